@@ -0,0 +1,1447 @@
+# University of Illinois/NCSA Open Source License
+# Copyright (c) 2018, Jakub Svoboda.
+
+"""
+Benchmarks of selected parts of Woolnote on generated task stores.
+
+Usage: python3 run_benchmarks.py [benchmark name ...] [--tasks N]
+
+Without benchmark names, all benchmarks are run. Nothing is written outside of a temporary directory.
+"""
+
+from woolnote import systemencoding
+
+import argparse
+import asyncio
+import concurrent.futures
+import http.client
+from http.server import HTTPServer
+import io
+import os
+import random
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import tracemalloc
+import zipfile
+
+from woolnote import asyncio_http_server
+from woolnote import config
+from woolnote import task_backup
+from woolnote import thread_pool_http_server
+from woolnote import util
+from woolnote.task_store import Task, TaskStore, TaskStoreWriter
+from woolnote.ui_auth import WoolnoteUIAuth
+from woolnote.ui_backend import UIBackend
+from woolnote.web_ui import WebUI
+from woolnote.web_ui_req_handler import get_WebInterfaceHandlerLocal
+from woolnote.woolnote_config import WoolnoteConfig
+
+# no debug output from the benchmarked code
+util.debug_print = False
+
+WORDS = ["alpha", "beta", "gamma", "delta", "epsilon", "shopping", "meeting", "project", "idea", "call", "invoice",
+         "garden", "travel", "book", "recipe", "holiday", "car", "doctor", "school", "birthday"]
+FOLDERS = ["inbox", "work", "home", "archive", "projects", "someday"]
+TAGS = ["urgent", "waiting", "personal", "work", "read", "buy", "later", "idea"]
+
+
+# helper functions
+##################
+
+def generate_task_store(task_count, seed=0, body_line_count_max=20):
+    """
+    Generates a task store with random tasks that is never saved anywhere.
+
+    Args:
+        task_count (int): the number of generated tasks
+        seed (int): seed of the random generator, the same seed generates the same tasks
+        body_line_count_max (int): the bodies have from 1 to this number of lines
+
+    Returns:
+        woolnote.task_store.TaskStore:
+    """
+    rnd = random.Random(seed)
+    task_store = TaskStore(None)
+    for i in range(task_count):
+        task = Task()
+        task.name = " ".join(rnd.sample(WORDS, 3))
+        body_lines = []
+        for line_no in range(rnd.randint(1, body_line_count_max)):
+            body_lines.append(" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(3, 12))))
+        task.body = "\n".join(body_lines)
+        task.folder = rnd.choice(FOLDERS)
+        task.tags = set(rnd.sample(TAGS, rnd.randint(0, 3)))
+        task.lamport_timestamp = rnd.randint(1, 2 * task_count)
+        task_store.add_deserialized(task)
+    return task_store
+
+
+def measure(function, repeat=3):
+    """
+    Runs the function several times and returns the best time.
+
+    Args:
+        function (Callable[[], Any]):
+        repeat (int):
+
+    Returns:
+        float: the best time in seconds
+    """
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    return best
+
+
+def print_result(name, duration, reference_duration=None):
+    """
+    Prints one line of benchmark results.
+
+    Args:
+        name (str): what has been measured
+        duration (float): time in seconds
+        reference_duration (Union[None, float]): time of the implementation to compare with
+
+    Returns:
+        None:
+    """
+    if reference_duration is None:
+        print("  {:<50} {:10.4f} s".format(name, duration))
+    else:
+        print("  {:<50} {:10.4f} s  ({:.1f}x)".format(name, duration, reference_duration / max(duration, 1e-9)))
+
+
+# previous implementations for comparison
+#########################################
+
+class TaskPrevious():
+    def __init__(self):
+        """
+        The previous implementation of Task - a plain object with a mutable set of tags and its own copies of all
+        strings.
+        """
+        super().__init__()
+        curr_date = util.current_timestamp()
+        self.name = ""
+        self.folder = ""
+        self.tags = set()
+        self.body = ""
+        self.taskid = util.create_id_task()
+        self.bodydelimiter = util.create_id_task()
+        self.lamport_timestamp = 1
+        self.export_lamport_timestamp = -1
+        self.created_date = curr_date
+        self.changed_date = curr_date
+        self.due_date = ""
+        self.due_date_reminder_dismissed = False
+        self.body_format = "MARKUP"
+        self.public_share_auth = util.create_id_task()
+
+
+def deserialize_task_previous(self, input_string, task_class=Task):
+    """
+    The previous implementation of Task.deserialize(). Reads the input_string into self (a task) as a transaction.
+    Returns True on success, False on fail. Self doesn't change on fail.
+
+    Args:
+        self (Union[woolnote.task_store.Task, TaskPrevious]): The task to read into
+        input_string (str): The serialized representation of the task
+        task_class (type): The class of the temporary task
+
+    Returns:
+        bool: Whether successful & self changed or unsuccessful & self unchanged.
+    """
+    tmp_task = task_class()
+    parse_state_id_known = False
+    parse_state_name_known = False
+    parse_state_folder_known = False
+    parse_state_tags_known = False
+
+    parse_state_lamport_known = False
+    parse_state_export_lamport_known = False
+    parse_state_created_known = False
+    parse_state_changed_known = False
+    parse_state_due_known = False
+    parse_state_due_rem_known = False
+    parse_state_bodyformat_known = False
+    parse_state_publicshareauth_known = False
+
+    parse_state_inside_body = False
+    parse_state_body_known = False
+    parse_state_body = []
+    parse_state_body_id_end_delimiter = ""
+
+    # Some conditions may be duplicate for better readability
+    for line in input_string.splitlines():
+        line = line.rstrip("\n")
+        line_split = line.split(" ")
+        if not parse_state_inside_body:
+            if not parse_state_id_known:
+                if line_split[0] == "TASK-ID":
+                    tmp_task.taskid = line_split[1]
+                    parse_state_id_known = True
+            if not parse_state_name_known:
+                if line_split[0] == "TASK-NAME":
+                    tmp_task.name = " ".join(line_split[1:])
+                    parse_state_name_known = True
+            if not parse_state_folder_known:
+                if line_split[0] == "TASK-FOLDER":
+                    tmp_task.folder = " ".join(line_split[1:])
+                    parse_state_folder_known = True
+
+            if not parse_state_lamport_known:
+                if line_split[0] == "TASK-LAMPORT-TIMESTAMP":
+                    tmp_task.lamport_timestamp = int(line_split[1])
+                    parse_state_lamport_known = True
+            if not parse_state_export_lamport_known:
+                if line_split[0] == "TASK-EXPORT-LAMPORT-TIMESTAMP":
+                    tmp_task.export_lamport_timestamp = int(line_split[1])
+                    parse_state_export_lamport_known = True
+            if not parse_state_created_known:
+                if line_split[0] == "TASK-CREATED-DATE":
+                    tmp_task.created_date = " ".join(line_split[1:])
+                    parse_state_created_known = True
+            if not parse_state_changed_known:
+                if line_split[0] == "TASK-CHANGED-DATE":
+                    tmp_task.changed_date = " ".join(line_split[1:])
+                    parse_state_changed_known = True
+            if not parse_state_due_rem_known:
+                if line_split[0] == "TASK-DUE-DATE-REMINDER-DISMISSED":
+                    tmp_task.due_date_reminder_dismissed = (line_split[1] == "True")
+                    parse_state_due_rem_known = True
+            if not parse_state_due_known:
+                if line_split[0] == "TASK-DUE-DATE":
+                    tmp_task.due_date = " ".join(line_split[1:])
+                    parse_state_due_known = True
+            if not parse_state_bodyformat_known:
+                if line_split[0] == "TASK-BODY-FORMAT":
+                    tmp_task.body_format = line_split[1]
+                    parse_state_bodyformat_known = True
+            if not parse_state_publicshareauth_known:
+                if line_split[0] == "TASK-PUBLIC-SHARE-AUTH":
+                    tmp_task.public_share_auth = line_split[1]
+                    parse_state_publicshareauth_known = True
+
+            if not parse_state_tags_known:
+                if line_split[0] == "TASK-TAGS":
+                    tags = " ".join(line_split[1:])
+                    tags2 = {x.strip() for x in tags.split(",")}
+                    tags3 = []
+                    for tag in tags2:
+                        if tag != "":
+                            tags3.append(tag)
+                    tmp_task.tags = set(sorted(tags3))
+                    parse_state_tags_known = True
+            if not parse_state_body_known:
+                if line_split[0] == "TASK-BODY-BEGIN":
+                    parse_state_body_id_end_delimiter = line_split[1]
+                    tmp_task.bodydelimiter = parse_state_body_id_end_delimiter
+                    parse_state_inside_body = True
+        elif parse_state_inside_body:
+            if line_split[0] == "TASK-BODY-END" and line_split[1] == parse_state_body_id_end_delimiter:
+                parse_state_inside_body = False
+                tmp_task.body = "\n".join(parse_state_body)
+                parse_state_body_known = True
+            else:
+                parse_state_body.append(line)
+
+    # start modifying self only after everything is parsed and potential errors or exceptions are the past
+    if parse_state_id_known and parse_state_name_known and not parse_state_inside_body and parse_state_body_known:
+        self.taskid = tmp_task.taskid
+        self.name = tmp_task.name
+        self.folder = tmp_task.folder
+        self.tags = tmp_task.tags
+        self.body = tmp_task.body
+        self.bodydelimiter = tmp_task.bodydelimiter
+
+        self.lamport_timestamp = tmp_task.lamport_timestamp
+        self.export_lamport_timestamp = tmp_task.export_lamport_timestamp
+        self.created_date = tmp_task.created_date
+        self.changed_date = tmp_task.changed_date
+        self.due_date = tmp_task.due_date
+        self.due_date_reminder_dismissed = tmp_task.due_date_reminder_dismissed
+        self.body_format = tmp_task.body_format
+        self.public_share_auth = tmp_task.public_share_auth
+
+        return True
+
+    return False
+
+
+def load_task_store_previous(destination_task_store, path):
+    """
+    The previous implementation of TaskStore.task_store_load() for an alternative path, which collects the lines of
+    every task, joins them and lets deserialize_task_previous() split them again.
+
+    Args:
+        destination_task_store (woolnote.task_store.TaskStore): where to store the deserialized data
+        path (str): where to read serialized data from
+
+    Returns:
+        None:
+    """
+    with open(path, "r", encoding="utf-8", newline="\n") as stored_file:
+        task_strings = []
+        inside_task = False
+        inside_task_id_known = False
+        inside_task_id = ""
+        for line in stored_file:
+            line = line.rstrip("\n")
+            line_split = line.split(" ")
+            if not inside_task:
+                if line_split[0] == "EXPORT-LAMPORT-CLOCK":
+                    destination_task_store.export_lamport_clock = int(line_split[1])
+                if line_split[0] == "LAST-IMPORT-LAMPORT-CLOCK":
+                    destination_task_store.last_import_lamport_clock = int(line_split[1])
+                if line == "TASK-BEGIN":
+                    inside_task = True
+            if inside_task:
+                task_strings.append(line)
+                if not inside_task_id_known:
+                    if line_split[0] == "TASK-ID":
+                        inside_task_id = line_split[1]
+                        inside_task_id_known = True
+                if inside_task_id_known:
+                    if line_split[0] == "TASK-END":
+                        if line_split[1] == inside_task_id:
+                            inside_task = False
+                            inside_task_id_known = False
+                            new_task = Task()
+                            deserialize_task_previous(new_task, "\n".join(task_strings))
+                            destination_task_store.add_deserialized(new_task)
+                            task_strings = []
+
+
+def sort_taskid_list_descending_lamport_helper_previous(task_store, taskid_list):
+    """
+    The previous implementation of TaskStore.sort_taskid_list_descending_lamport_helper(), which was used only by
+    search_expression_execute_ast_node_previous(). Sorts the input list of taskids by lamport clock in descending
+    order. No state is changed.
+
+    Args:
+        task_store (woolnote.task_store.TaskStore):
+        taskid_list (Union[dict_keys, List[str]]): A list of taskids identifying which tasks to sort.
+
+    Returns:
+        List[str]: taskids sorted by lamport clock in descending order
+    """
+    tuples_taskid_lamport = []
+    for taskid in taskid_list:
+        task = task_store.store_dict_id[taskid]
+        lamport = task.lamport_timestamp
+        tuples_taskid_lamport.append((taskid, lamport))
+    sorted_tuples = sorted(tuples_taskid_lamport, key=lambda x: x[1], reverse=True)
+    sorted_taskid_desc = [x[0] for x in sorted_tuples]
+    return sorted_taskid_desc
+
+
+def search_expression_execute_ast_node_previous(ast_node, task_store, search_type=None, fulltext_search_strings=None, fulltext_search_strings_excluded=None):
+    """
+    The previous implementation of util.search_expression_execute_ast_node(), which sorts the result of every node and
+    intersects lists by membership tests.
+
+    Args:
+        ast_node (woolnote.util.Search_AST_Node):
+        task_store (woolnote.task_store.TaskStore):
+        search_type (Union[None, str]):
+        fulltext_search_strings (List): Fulltext strings to be highlighted in the text.
+        fulltext_search_strings_excluded (List): Fulltext strings to be highlighted in the text according to the partial search filter that has been negated.
+
+    Returns:
+        List[str]:
+    """
+    # fulltext_search_strings is None or list. if it is list, then all fulltext search strings will be appended to it
+    # works correctly only on EXEC_ROOT for end user
+    # recognized types of tokens:
+    # EXEC_ROOT
+    # SEARCH_STRING
+    # CTRL_SEQ_OPERATOR
+    # CTRL_SEQ_SEARCH_TYPE
+    # CTRL_SEQ_CLOSED
+    if fulltext_search_strings is not None and fulltext_search_strings_excluded is None:
+        # so that if the caller is interested only in the first array, the internal logic of swapping on 'not' still works
+        fulltext_search_strings_excluded = []
+    if ast_node.type == "EXEC_ROOT":
+        unsorted_list = search_expression_execute_ast_node_previous(ast_node.children[0], task_store,
+                                                                    fulltext_search_strings=fulltext_search_strings,
+                                                                    fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+        sorted_list = sort_taskid_list_descending_lamport_helper_previous(task_store, list(set(unsorted_list)))
+        return sorted_list
+    elif ast_node.type == "SEARCH_STRING":
+        if search_type is None:
+            if fulltext_search_strings is not None:
+                fulltext_search_strings.append(ast_node.content)
+            return task_store.filter_search(ast_node.content)
+        elif search_type == "fulltext:":
+            if fulltext_search_strings is not None:
+                fulltext_search_strings.append(ast_node.content)
+            return task_store.filter_search(ast_node.content)
+        elif search_type == "folder:":
+            return task_store.filter_folder(ast_node.content)
+        elif search_type == "tag:":
+            return task_store.filter_tag(ast_node.content)
+        else:
+            return None
+    elif ast_node.type == "CTRL_SEQ_OPERATOR":
+        if ast_node.content == "and":
+            list1 = search_expression_execute_ast_node_previous(ast_node.children[0], task_store, search_type=search_type,
+                                                                fulltext_search_strings=fulltext_search_strings,
+                                                                fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+            list2 = search_expression_execute_ast_node_previous(ast_node.children[1], task_store, search_type=search_type,
+                                                                fulltext_search_strings=fulltext_search_strings,
+                                                                fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+            and_list = []
+            for item in list1:
+                if item in list2:
+                    and_list.append(item)
+            sorted_and_list = sort_taskid_list_descending_lamport_helper_previous(task_store, list(set(and_list)))
+            return sorted_and_list
+        elif ast_node.content == "or":
+            list1 = search_expression_execute_ast_node_previous(ast_node.children[0], task_store, search_type=search_type,
+                                                                fulltext_search_strings=fulltext_search_strings,
+                                                                fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+            list2 = search_expression_execute_ast_node_previous(ast_node.children[1], task_store, search_type=search_type,
+                                                                fulltext_search_strings=fulltext_search_strings,
+                                                                fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+            or_list = list(set(list1 + list2))
+            sorted_or_list = sort_taskid_list_descending_lamport_helper_previous(task_store, or_list)
+            return sorted_or_list
+        elif ast_node.content == "not":
+            # On each 'not', the two array references for fulltext search strings are switched over - that way they are
+            # correctly added in even-numbered nested 'not's.
+            list1 = search_expression_execute_ast_node_previous(ast_node.children[0], task_store, search_type=search_type,
+                                                                fulltext_search_strings=fulltext_search_strings_excluded,
+                                                                fulltext_search_strings_excluded=fulltext_search_strings)
+            list2 = task_store.sort_taskid_list_descending_lamport()
+            sorted_not_list = [x for x in list2 if x not in list1]
+            return sorted_not_list
+    elif ast_node.type == "CTRL_SEQ_SEARCH_TYPE":
+        return search_expression_execute_ast_node_previous(ast_node.children[0], task_store, search_type=ast_node.content,
+                                                           fulltext_search_strings=fulltext_search_strings,
+                                                           fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+    elif ast_node.type == "CTRL_SEQ_CLOSED":
+        return search_expression_execute_ast_node_previous(ast_node.children[0], task_store, search_type=search_type,
+                                                           fulltext_search_strings=fulltext_search_strings,
+                                                           fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+    else:
+        # bad input
+        return None
+
+
+# benchmarks
+############
+
+def benchmark_search(task_count):
+    """
+    Compares the set-based search executor with the previous list-based one on virtual-folder-like expressions.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    expressions = [
+        "folder: inbox",
+        "(folder: work) and (tag: urgent)",
+        "(tag: work) or (tag: read)",
+        "not (folder: archive)",
+        "((folder: work) or (folder: projects)) and (not (tag: later))",
+        "(meeting) and ((tag: waiting) or (not (folder: inbox)))",
+        "(not (tag: buy)) and (not (tag: read)) and (not (folder: someday))",
+    ]
+    for expression in expressions:
+        tree_root = util.search_expression_build_ast(util.search_expression_tokenizer(expression))
+        highlight_list_new = []
+        highlight_list_old = []
+        result_new = util.search_expression_execute_ast_node(tree_root, task_store,
+                                                             fulltext_search_strings=highlight_list_new)
+        result_old = search_expression_execute_ast_node_previous(tree_root, task_store,
+                                                                        fulltext_search_strings=highlight_list_old)
+        # the previous executor orders the tasks with the same lamport clock by the iteration order of a set
+        lamport_timestamps_new = [task_store.store_dict_id[taskid].lamport_timestamp for taskid in result_new]
+        lamport_timestamps_old = [task_store.store_dict_id[taskid].lamport_timestamp for taskid in result_old]
+        if (set(result_new) != set(result_old) or lamport_timestamps_new != lamport_timestamps_old
+                or highlight_list_new != highlight_list_old):
+            raise Exception("search executors differ for: {}".format(repr(expression)))
+        duration_old = measure(lambda: search_expression_execute_ast_node_previous(tree_root, task_store), 1)
+        duration_new = measure(lambda: util.search_expression_execute_ast_node(tree_root, task_store))
+        print("{} ({} results)".format(expression, len(result_new)))
+        print_result("list-based executor", duration_old)
+        print_result("set-based executor", duration_new, duration_old)
+
+
+def benchmark_search_cache(task_count):
+    """
+    Compares parsing and executing a search expression on every query with the cached query plans, both
+    when the task store doesn't change between the queries and when a task is touched before each query.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    expression = "((folder: work) or (folder: projects)) and (not (tag: later)) and (not (meeting))"
+    query_count = 100
+
+    def uncached():
+        for i in range(query_count):
+            tree_root = util.search_expression_build_ast(util.search_expression_tokenizer(expression))
+            util.search_expression_execute_ast_node(tree_root, task_store, fulltext_search_strings=[])
+
+    def cached():
+        for i in range(query_count):
+            search_query_plan_cache.get_plan(expression).execute(task_store)
+
+    def cached_with_touch():
+        for i in range(query_count):
+            task_store.touch(taskid)
+            search_query_plan_cache.get_plan(expression).execute(task_store)
+
+    search_query_plan_cache = util.SearchQueryPlanCache(16)
+    taskid = next(iter(task_store.store_dict_id))
+    print("{} queries of {}".format(query_count, expression))
+    duration_uncached = measure(uncached)
+    print_result("parse and execute every query", duration_uncached)
+    print_result("cached plan, unchanged task store", measure(cached), duration_uncached)
+    print_result("cached plan, task touched before each query", measure(cached_with_touch), duration_uncached)
+
+
+def benchmark_load(task_count):
+    """
+    Compares loading a task store file with the streaming parser and with the previous implementation, which joins the
+    lines of every task and splits them again, and loading it from the binary snapshot written by the save.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "tasks.dat")
+        task_store.filepath = path
+        task_store.task_store_save()
+        print("loading {} ({} bytes)".format(path, os.path.getsize(path)))
+
+        def load_previous():
+            load_task_store_previous(TaskStore(None), path)
+
+        def load_streaming():
+            # loaded as an alternative path, so that the file is parsed and not read from its binary snapshot
+            TaskStore(None).task_store_load(alt_path=path)
+
+        task_store_previous = TaskStore(None)
+        load_task_store_previous(task_store_previous, path)
+        task_store_streaming = TaskStore(None)
+        task_store_streaming.task_store_load(alt_path=path)
+        task_store_snapshot = TaskStore(path)
+        task_store_snapshot.task_store_load()
+        if (task_store_previous.serialize() != task_store_streaming.serialize()
+                or task_store_previous.serialize() != task_store_snapshot.serialize()):
+            raise Exception("the loaded task stores differ")
+
+        def load_snapshot():
+            TaskStore(path).task_store_load()
+
+        duration_previous = measure(load_previous)
+        print_result("join and split every task", duration_previous)
+        print_result("streaming parser", measure(load_streaming), duration_previous)
+        if os.path.exists(path + config.SNAPSHOT_EXTENSION):
+            print_result("binary snapshot", measure(load_snapshot), duration_previous)
+
+
+def benchmark_save(task_count):
+    """
+    Compares saving a task store after one task has been touched by writing the full file and by appending to the
+    journal, both fsynced before returning, and by passing the journal record to the background writer.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    taskids = list(task_store.store_dict_id.keys())
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "tasks.dat")
+        task_store.filepath = path
+        task_store.task_store_save()
+        print("saving {} ({} bytes)".format(path, os.path.getsize(path)))
+
+        def touch_one_task():
+            taskid = random.choice(taskids)
+            task = task_store.store_dict_id[taskid]
+            task.tags = task.tags | {"touched"}
+            task_store.touch(taskid)
+
+        def save_full():
+            touch_one_task()
+            task_store.task_store_save(compact=True)
+
+        def save_journal():
+            touch_one_task()
+            task_store.task_store_save()
+
+        duration_full = measure(save_full)
+        print_result("full file", duration_full)
+        print_result("journal", measure(save_journal), duration_full)
+        task_store.journal_compaction_wait()
+
+        task_store.background_writer = TaskStoreWriter()
+        print_result("journal, background writer", measure(save_journal), duration_full)
+        task_store.background_writer.stop()
+        task_store.background_writer = None
+
+        task_store_loaded = TaskStore(path)
+        task_store_loaded.task_store_load()
+        if task_store_loaded.serialize() != task_store.serialize():
+            raise Exception("the loaded task store differs")
+
+
+def benchmark_memory(task_count):
+    """
+    Compares the memory taken by the deserialized tasks (without the text of their bodies) with the previous
+    implementation of Task.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    serialized_tasks = [task.serialize() for task in task_store.store_dict_id.values()]
+    body_size = sum(len(task.body) for task in task_store.store_dict_id.values())
+    del task_store
+
+    def measure_memory(deserialize_tasks):
+        tracemalloc.start()
+        tasks = deserialize_tasks()
+        memory_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return tasks, (memory_size - body_size) / len(tasks)
+
+    def deserialize_previous():
+        tasks = []
+        for serialized_task in serialized_tasks:
+            task = TaskPrevious()
+            deserialize_task_previous(task, serialized_task, task_class=TaskPrevious)
+            tasks.append(task)
+        return tasks
+
+    def deserialize_current():
+        tasks = []
+        for serialized_task in serialized_tasks:
+            task = Task()
+            task.deserialize(serialized_task)
+            tasks.append(task)
+        return tasks
+
+    tasks_previous, bytes_per_task_previous = measure_memory(deserialize_previous)
+    tasks_current, bytes_per_task_current = measure_memory(deserialize_current)
+    print("  {:<50} {:10.0f} B".format("previous Task, bytes per task without body text", bytes_per_task_previous))
+    print("  {:<50} {:10.0f} B  ({:.1f}x)".format("slotted Task, bytes per task without body text", bytes_per_task_current,
+                                                   bytes_per_task_previous / bytes_per_task_current))
+
+    for task_previous, task_current in zip(tasks_previous, tasks_current):
+        if (task_previous.taskid, task_previous.folder, task_previous.tags, task_previous.body,
+            task_previous.bodydelimiter, task_previous.public_share_auth) != (
+            task_current.taskid, task_current.folder, task_current.tags, task_current.body,
+            task_current.bodydelimiter, task_current.public_share_auth):
+            raise Exception("the deserialized tasks differ")
+
+
+def benchmark_lazy_load(task_count):
+    """
+    Compares loading a task store file with the bodies decoded right away and with the bodies left in the
+    memory-mapped file until they are accessed, both in time and in memory.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    for body_line_count_max in (20, 200):
+        print("bodies with 1 to {} lines".format(body_line_count_max))
+        benchmark_lazy_load_task_store(generate_task_store(task_count, body_line_count_max=body_line_count_max))
+
+
+def benchmark_lazy_load_task_store(task_store):
+    """
+    Runs benchmark_lazy_load() for the given task store.
+
+    Args:
+        task_store (woolnote.task_store.TaskStore):
+
+    Returns:
+        None:
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "tasks.dat")
+        task_store.filepath = path
+        task_store.task_store_save()
+        print("loading {} ({} bytes)".format(path, os.path.getsize(path)))
+
+        def load(lazy_body_loading):
+            config.LAZY_BODY_LOADING = lazy_body_loading
+            task_store_loaded = TaskStore(path)
+            task_store_loaded.task_store_load()
+            return task_store_loaded
+
+        def load_memory(lazy_body_loading):
+            tracemalloc.start()
+            task_store_loaded = load(lazy_body_loading)
+            memory_size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return task_store_loaded, memory_size
+
+        lazy_body_loading_original = config.LAZY_BODY_LOADING
+        try:
+            duration_eager = measure(lambda: load(False))
+            print_result("bodies decoded", duration_eager)
+            print_result("bodies memory-mapped", measure(lambda: load(True)), duration_eager)
+            task_store_eager, memory_size_eager = load_memory(False)
+            task_store_lazy, memory_size_lazy = load_memory(True)
+        finally:
+            config.LAZY_BODY_LOADING = lazy_body_loading_original
+        print("  {:<50} {:10.0f} kB".format("bodies decoded, memory", memory_size_eager / 1024))
+        print("  {:<50} {:10.0f} kB  ({:.1f}x)".format("bodies memory-mapped, memory", memory_size_lazy / 1024,
+                                                        memory_size_eager / memory_size_lazy))
+
+        if task_store_eager.serialize() != task_store_lazy.serialize():
+            raise Exception("the loaded task stores differ")
+
+
+def benchmark_startup(task_count):
+    """
+    Compares loading task stores of 1000, 10000 and 100000 tasks at startup by parsing the main file and from its
+    binary snapshot. The number of tasks given on the command line is not used.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    for startup_task_count in (1000, 10000, 100000):
+        task_store = generate_task_store(startup_task_count)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tasks.dat")
+            task_store.filepath = path
+            task_store.task_store_save()
+            print("{} tasks: loading {} ({} bytes, snapshot {} bytes)".format(
+                startup_task_count, path, os.path.getsize(path), os.path.getsize(path + config.SNAPSHOT_EXTENSION)))
+
+            def load(binary_snapshot_enabled):
+                config.BINARY_SNAPSHOT_ENABLED = binary_snapshot_enabled
+                task_store_loaded = TaskStore(path)
+                task_store_loaded.task_store_load()
+                return task_store_loaded
+
+            binary_snapshot_enabled_original = config.BINARY_SNAPSHOT_ENABLED
+            try:
+                if load(False).serialize() != load(True).serialize():
+                    raise Exception("the loaded task stores differ")
+                duration_parsed = measure(lambda: load(False))
+                print_result("main file parsed", duration_parsed)
+                print_result("binary snapshot", measure(lambda: load(True)), duration_parsed)
+            finally:
+                config.BINARY_SNAPSHOT_ENABLED = binary_snapshot_enabled_original
+
+
+def benchmark_parallel_load(task_count):
+    """
+    Compares parsing a task store file in a single pass and in parallel by several processes. At least two processes
+    are used even if there is only one CPU, which shows just the overhead.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "tasks.dat")
+        task_store.task_store_save(alt_path=path)
+        processes = max(2, os.cpu_count() or 1)
+        print("loading {} ({} bytes, {} CPUs, {} processes)".format(path, os.path.getsize(path), os.cpu_count(),
+                                                                    processes))
+
+        def load(parallel):
+            config.PARALLEL_LOADING_MIN_SIZE = 1 if parallel else 0
+            task_store_loaded = TaskStore(None)
+            task_store_loaded.task_store_load(alt_path=path)
+            return task_store_loaded
+
+        parallel_loading_min_size_original = config.PARALLEL_LOADING_MIN_SIZE
+        parallel_loading_processes_original = config.PARALLEL_LOADING_PROCESSES
+        config.PARALLEL_LOADING_PROCESSES = processes
+        try:
+            if load(False).serialize() != load(True).serialize():
+                raise Exception("the loaded task stores differ")
+            duration_single = measure(lambda: load(False))
+            print_result("single pass", duration_single)
+            print_result("parallel", measure(lambda: load(True)), duration_single)
+        finally:
+            config.PARALLEL_LOADING_MIN_SIZE = parallel_loading_min_size_original
+            config.PARALLEL_LOADING_PROCESSES = parallel_loading_processes_original
+
+
+def benchmark_backup(task_count):
+    """
+    Compares backing up a task store in which 10 tasks have been changed since the previous backup by writing a full
+    copy (the previous implementation) and by writing only the changed tasks into the deduplicated backup store.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        task_store.filepath = os.path.join(tmp_dir, "tasks.dat")
+        backup_store = task_backup.TaskBackupStore(tmp_dir)
+        backup_store.backup("woolbackup_first_tasks.dat", task_store)
+        taskids = sorted(task_store.store_dict_id)
+        backup_count = [0]
+
+        def change_tasks():
+            for taskid in taskids[backup_count[0] * 10:backup_count[0] * 10 + 10]:
+                task_store.store_dict_id[taskid].body += "\nchanged"
+                task_store.touch(taskid)
+            backup_count[0] += 1
+
+        def backup_full_copy():
+            change_tasks()
+            task_store.task_store_save(alt_path=os.path.join(tmp_dir, "woolbackup_{}_tasks.dat".format(backup_count[0])))
+
+        def backup_deduplicated():
+            change_tasks()
+            backup_store.backup("woolbackup_{}_tasks.dat".format(backup_count[0]), task_store)
+
+        duration_full_copy = measure(backup_full_copy)
+        print_result("full copy", duration_full_copy)
+        print_result("changed tasks only", measure(backup_deduplicated), duration_full_copy)
+
+        restored_path = os.path.join(tmp_dir, "restored.dat")
+        backup_store.restore("woolbackup_{}_tasks.dat".format(backup_count[0]) + config.BACKUP_MANIFEST_EXTENSION,
+                             restored_path)
+        with open(restored_path, "r", encoding="utf-8", newline="\n") as restored_file:
+            if restored_file.read() != task_store.serialize():
+                raise Exception("the restored task store differs")
+
+
+def benchmark_import(task_count):
+    """
+    Compares reading the database for a replacing import from woolnote.zip by extracting it to the disk and parsing it
+    twice (the previous implementation of UIBackend.import_notes()) and by parsing it once straight from the zip.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        zip_path = os.path.join(tmp_dir, config.FILE_WOOLNOTE_ZIP)
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as exportzip:
+            exportzip.writestr(config.FILE_WOOLNOTE_DAT, task_store.serialize())
+        print("importing {} ({} bytes)".format(zip_path, os.path.getsize(zip_path)))
+
+        def import_extracted():
+            with zipfile.ZipFile(zip_path, "r") as importzip:
+                importzip.extract(config.FILE_WOOLNOTE_DAT, tmp_dir)
+            task_remote_store = TaskStore(None)
+            task_remote_store.task_store_load(alt_path=os.path.join(tmp_dir, config.FILE_WOOLNOTE_DAT))
+            task_store_replaced = TaskStore(None)
+            task_store_replaced.task_store_load(alt_path=os.path.join(tmp_dir, config.FILE_WOOLNOTE_DAT))
+            return task_store_replaced
+
+        def import_streamed():
+            task_remote_store = TaskStore(None)
+            with zipfile.ZipFile(zip_path, "r") as importzip:
+                with importzip.open(config.FILE_WOOLNOTE_DAT) as remote_file:
+                    task_remote_store.task_store_load_stream(remote_file)
+            task_store_replaced = TaskStore(None)
+            task_store_replaced.add_deserialized_task_store(task_remote_store)
+            return task_store_replaced
+
+        if import_extracted().serialize() != import_streamed().serialize():
+            raise Exception("the imported task stores differ")
+        duration_extracted = measure(import_extracted)
+        print_result("extracted and parsed twice", duration_extracted)
+        print_result("streamed from the zip and parsed once", measure(import_streamed), duration_extracted)
+
+
+def benchmark_export(task_count):
+    """
+    Compares exporting a task store by saving it, saving it again as woolnote.dat and compressing that file into
+    woolnote.zip (the previous implementation of UIBackend.export_notes()) and by saving it and compressing the
+    serialized tasks straight into woolnote.zip.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        task_store.filepath = os.path.join(tmp_dir, "tasks.dat")
+        dat_path = os.path.join(tmp_dir, config.FILE_WOOLNOTE_DAT)
+        zip_path = os.path.join(tmp_dir, config.FILE_WOOLNOTE_ZIP)
+
+        def export_clock_set():
+            task_store.export_lamport_clock += 1
+            for task in task_store.store_dict_id.values():
+                task.export_lamport_timestamp = task_store.export_lamport_clock
+
+        def export_through_file():
+            export_clock_set()
+            task_store.task_store_save(compact=True)
+            task_store.task_store_save(alt_path=dat_path)
+            with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as exportzip:
+                exportzip.write(dat_path, arcname=config.FILE_WOOLNOTE_DAT, compress_type=zipfile.ZIP_DEFLATED)
+
+        def export_streamed():
+            export_clock_set()
+            task_store.task_store_save(compact=True)
+            return task_store.task_store_export_zip(zip_path, config.FILE_WOOLNOTE_DAT, config.FILE_WOOLNOTE_SUMMARY,
+                                                    config.EXPORT_COMPRESSION_LEVEL)
+
+        duration_through_file = measure(export_through_file)
+        print_result("saved twice and compressed from the file", duration_through_file)
+        print_result("saved once and streamed into the zip", measure(export_streamed), duration_through_file)
+        for stage, duration, size in export_streamed():
+            print("  {}: {:.3f} s, {} bytes".format(stage, duration, size))
+        with zipfile.ZipFile(zip_path, "r") as importzip:
+            if importzip.read(config.FILE_WOOLNOTE_DAT).decode("utf-8") != task_store.serialize():
+                raise Exception("the exported task store differs")
+
+
+def benchmark_import_summary(task_count):
+    """
+    Compares loading the exported task store for a differential import when 10 tasks have been changed since the
+    previous export by loading all tasks (the previous implementation of UIBackend.import_notes()) and by loading only
+    the groups of tasks which differ from the exported summary.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        zip_path = os.path.join(tmp_dir, config.FILE_WOOLNOTE_ZIP)
+
+        def export_clock_set():
+            task_store.export_lamport_clock = task_store.lamport_clock
+            for task in task_store.store_dict_id.values():
+                task.export_lamport_timestamp = task_store.export_lamport_clock
+
+        export_clock_set()
+        task_store.task_store_export_zip(zip_path, config.FILE_WOOLNOTE_DAT, config.FILE_WOOLNOTE_SUMMARY,
+                                         config.EXPORT_COMPRESSION_LEVEL)
+        task_local_store = TaskStore(None)
+        with zipfile.ZipFile(zip_path, "r") as importzip:
+            with importzip.open(config.FILE_WOOLNOTE_DAT) as remote_file:
+                task_local_store.task_store_load_stream(remote_file)
+        for taskid in random.Random(1).sample(sorted(task_store.store_dict_id), 10):
+            task_store.store_dict_id[taskid].body += "\nchanged"
+            task_store.touch(taskid)
+        export_clock_set()
+        task_store.task_store_export_zip(zip_path, config.FILE_WOOLNOTE_DAT, config.FILE_WOOLNOTE_SUMMARY,
+                                         config.EXPORT_COMPRESSION_LEVEL)
+
+        def load_all():
+            task_remote_store = TaskStore(None)
+            with zipfile.ZipFile(zip_path, "r") as importzip:
+                with importzip.open(config.FILE_WOOLNOTE_DAT) as remote_file:
+                    task_remote_store.task_store_load_stream(remote_file)
+            return task_remote_store
+
+        def load_differing():
+            task_remote_store = TaskStore(None)
+            with zipfile.ZipFile(zip_path, "r") as importzip:
+                with importzip.open(config.FILE_WOOLNOTE_SUMMARY) as summary_file:
+                    remote_summary = TaskStore.summary_deserialize(
+                        io.TextIOWrapper(summary_file, encoding="utf-8", newline="\n"))
+                taskid_prefixes = task_local_store.summary_prefixes_differing(remote_summary)
+                with importzip.open(config.FILE_WOOLNOTE_DAT) as remote_file:
+                    task_remote_store.task_store_load_stream(remote_file, taskid_prefixes=taskid_prefixes)
+            return task_remote_store
+
+        task_remote_store = load_differing()
+        print("{} of {} tasks loaded".format(len(task_remote_store.store_dict_id), task_count))
+        for taskid, task in task_store.store_dict_id.items():
+            if (task.content_hash() != task_local_store.store_dict_id[taskid].content_hash()
+                    and taskid not in task_remote_store.store_dict_id):
+                raise Exception("a changed task has not been loaded")
+        duration_all = measure(load_all)
+        print_result("all tasks", duration_all)
+        print_result("differing groups of tasks", measure(load_differing), duration_all)
+
+
+def benchmark_compression(task_count):
+    """
+    Compares the size of the files and the time to write and read them for the plain and the compressed storage
+    (STORAGE_COMPRESSION_LEVEL) - saving the main file, loading it (without the binary snapshot) and writing the first
+    backup of the task store.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    task_store = generate_task_store(task_count)
+    compresslevel_original = config.STORAGE_COMPRESSION_LEVEL
+    binary_snapshot_enabled_original = config.BINARY_SNAPSHOT_ENABLED
+    durations_plain = {}
+    try:
+        config.BINARY_SNAPSHOT_ENABLED = False
+        for compresslevel in (None, 1, 6):
+            config.STORAGE_COMPRESSION_LEVEL = compresslevel
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, "tasks.dat")
+                task_store.filepath = path
+                backup_count = [0]
+
+                def save():
+                    task_store.task_store_save(compact=True)
+
+                def load():
+                    task_store_loaded = TaskStore(path)
+                    task_store_loaded.task_store_load()
+                    return task_store_loaded
+
+                def backup():
+                    backup_count[0] += 1
+                    backup_path = os.path.join(tmp_dir, "backup_{}".format(backup_count[0]))
+                    os.mkdir(backup_path)
+                    task_backup.TaskBackupStore(backup_path).backup("woolbackup_tasks.dat", task_store)
+                    return backup_path
+
+                save()
+                if load().serialize() != task_store.serialize():
+                    raise Exception("the loaded task store differs")
+                backup_path = backup()
+                backup_size = sum(os.path.getsize(os.path.join(directory, name))
+                                  for directory, _, names in os.walk(backup_path) for name in names)
+                print("{}: main file {} bytes, backup {} bytes".format(
+                    "plain" if compresslevel is None else "gzip level {}".format(compresslevel), os.path.getsize(path),
+                    backup_size))
+                for name, function in (("save", save), ("load", load), ("backup", backup)):
+                    duration = measure(function)
+                    print_result("  " + name, duration, durations_plain.get(name))
+                    durations_plain.setdefault(name, duration)
+    finally:
+        config.STORAGE_COMPRESSION_LEVEL = compresslevel_original
+        config.BINARY_SNAPSHOT_ENABLED = binary_snapshot_enabled_original
+
+
+def benchmark_concurrent_serving(task_count):
+    """
+    Load test of the web interface on localhost with clients which receive the pages at about 1.6 MB/s (like over a
+    slow mobile link). Compares the throughput of displaying folders and notes by the server handling one request at
+    a time and by the server with the thread pool, with a growing number of concurrent clients. The pages generated in
+    parallel share the CPUs (and the GIL), so the thread pool scales with the time spent waiting for the clients, not
+    with the time spent generating the pages.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    client_receive_delay = 0.005  # after every 8 kB
+    requests_per_client = 8
+    task_store = generate_task_store(task_count)
+    taskids = list(task_store.store_dict_id)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        task_store.filepath = os.path.join(tmp_dir, "tasks.dat")
+        task_store_trash = TaskStore(os.path.join(tmp_dir, "tasks_trash.dat"))
+        ui_auth = WoolnoteUIAuth()
+        woolnote_config = WoolnoteConfig()
+        web_ui = WebUI(task_store, task_store_trash, UIBackend(task_store, task_store_trash), woolnote_config, ui_auth)
+        handler_class = get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth,
+                                                     util.ReadWriteLock())
+
+        class QuietHandler(handler_class):
+            def setup(self):
+                # with the small buffers, the server waits for the client to receive the page like on a slow link
+                self.request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 8192)
+                super().setup()
+
+            def log_message(self, format, *args):
+                pass
+
+        cookie = "auth=" + ui_auth.return_cookie_authenticated()
+        # a folder and a note from it
+        paths = ["/woolnote?action=page_list_folder&folder=" + FOLDERS[i // 2]
+                 if i % 2 else "/woolnote?action=page_display_note&taskid=" + taskids[i // 2]
+                 for i in range(requests_per_client)]
+
+        def client(port):
+            for path in paths:
+                with socket.socket() as sock:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8192)
+                    sock.connect(("127.0.0.1", port))
+                    sock.sendall("GET {} HTTP/1.0\r\nCookie: {}\r\n\r\n".format(path, cookie).encode("utf-8"))
+                    while sock.recv(8192):
+                        time.sleep(client_receive_delay)
+
+        def throughput(server, client_count):
+            server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+            server_thread.start()
+            try:
+                start = time.perf_counter()
+                client_threads = [threading.Thread(target=client, args=(server.server_address[1],))
+                                  for i in range(client_count)]
+                for client_thread in client_threads:
+                    client_thread.start()
+                for client_thread in client_threads:
+                    client_thread.join()
+                return client_count * requests_per_client / (time.perf_counter() - start)
+            finally:
+                server.shutdown()
+                server_thread.join()
+                server.server_close()
+
+        # the first request reads the configuration and creates the config note
+        client_count_list = [1, 4, 16]
+        throughput(HTTPServer(("127.0.0.1", 0), QuietHandler), 1)
+        throughput_serial = {}
+        for client_count in client_count_list:
+            throughput_serial[client_count] = throughput(HTTPServer(("127.0.0.1", 0), QuietHandler), client_count)
+            print("  {:<50} {:10.1f} requests/s".format("one at a time, {} clients".format(client_count),
+                                                        throughput_serial[client_count]))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=config.SERVER_THREAD_POOL_SIZE) as executor:
+            for client_count in client_count_list:
+                server = thread_pool_http_server.ThreadPoolHTTPServer(("127.0.0.1", 0), QuietHandler, executor)
+                requests_per_second = throughput(server, client_count)
+                print("  {:<50} {:10.1f} requests/s  ({:.1f}x)".format(
+                    "thread pool of {}, {} clients".format(config.SERVER_THREAD_POOL_SIZE, client_count),
+                    requests_per_second, requests_per_second / throughput_serial[client_count]))
+
+
+def benchmark_idle_connections(task_count):
+    """
+    Latency of displaying a note while other clients keep connections open without sending anything (like phones with
+    the web interface in the background). Compares the server with the thread pool, in which every idle connection
+    takes a thread until SERVER_REQUEST_TIMEOUT (shortened to 1 s here), with the asyncio server, in which the idle
+    connections take no threads.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    requests_count = 8
+    request_timeout = 1
+    task_store = generate_task_store(task_count)
+    taskids = list(task_store.store_dict_id)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        task_store.filepath = os.path.join(tmp_dir, "tasks.dat")
+        task_store_trash = TaskStore(os.path.join(tmp_dir, "tasks_trash.dat"))
+        ui_auth = WoolnoteUIAuth()
+        woolnote_config = WoolnoteConfig()
+        web_ui = WebUI(task_store, task_store_trash, UIBackend(task_store, task_store_trash), woolnote_config, ui_auth)
+        handler_class = get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth,
+                                                     util.ReadWriteLock())
+
+        class QuietHandler(handler_class):
+            def log_message(self, format, *args):
+                pass
+
+        cookie = "auth=" + ui_auth.return_cookie_authenticated()
+
+        def request(port, taskid):
+            with socket.create_connection(("127.0.0.1", port)) as sock:
+                sock.sendall("GET /woolnote?action=page_display_note&taskid={} HTTP/1.0\r\nCookie: {}\r\n\r\n".format(
+                    taskid, cookie).encode("utf-8"))
+                while sock.recv(65536):
+                    pass
+
+        def latency(port, idle_count):
+            idle_sockets = [socket.create_connection(("127.0.0.1", port)) for i in range(idle_count)]
+            try:
+                # all the idle connections are accepted before the measured requests
+                time.sleep(0.2)
+                start = time.perf_counter()
+                for i in range(requests_count):
+                    request(port, taskids[i])
+                return (time.perf_counter() - start) / requests_count
+            finally:
+                for idle_socket in idle_sockets:
+                    idle_socket.close()
+
+        class BacklogThreadPoolHTTPServer(thread_pool_http_server.ThreadPoolHTTPServer):
+            # all the idle connections fit into the listen backlog like with asyncio
+            request_queue_size = 100
+
+        def latency_thread_pool(executor, idle_count):
+            server = BacklogThreadPoolHTTPServer(("127.0.0.1", 0), QuietHandler, executor)
+            server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+            server_thread.start()
+            try:
+                return latency(server.server_address[1], idle_count)
+            finally:
+                server.shutdown()
+                server_thread.join()
+                server.server_close()
+
+        async def close_asyncio(server):
+            server.close()
+            # the connections which haven't been closed by the clients yet
+            tasks = asyncio.all_tasks() - {asyncio.current_task()}
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await server.wait_closed()
+
+        def latency_asyncio(executor, idle_count):
+            loop = asyncio.new_event_loop()
+            server_asyncio = asyncio_http_server.AsyncioHTTPServer(QuietHandler, executor)
+            server = loop.run_until_complete(server_asyncio.start(0, host="127.0.0.1"))
+            loop_thread = threading.Thread(target=loop.run_forever)
+            loop_thread.start()
+            try:
+                return latency(server.sockets[0].getsockname()[1], idle_count)
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                loop_thread.join()
+                loop.run_until_complete(close_asyncio(server))
+                loop.close()
+
+        server_request_timeout = config.SERVER_REQUEST_TIMEOUT
+        config.SERVER_REQUEST_TIMEOUT = request_timeout
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=config.SERVER_THREAD_POOL_SIZE) as executor:
+                # the first request reads the configuration and creates the config note
+                latency_asyncio(executor, 0)
+                for idle_count in [0, config.SERVER_THREAD_POOL_SIZE, 64]:
+                    for server_name, latency_function in [("thread pool", latency_thread_pool),
+                                                          ("asyncio", latency_asyncio)]:
+                        print("  {:<50} {:10.1f} ms".format(
+                            "{}, {} idle connections".format(server_name, idle_count),
+                            latency_function(executor, idle_count) * 1000))
+        finally:
+            config.SERVER_REQUEST_TIMEOUT = server_request_timeout
+
+
+def benchmark_keep_alive(task_count):
+    """
+    Time of loading a note with its CSS and favicon from the server with the thread pool over HTTP and HTTPS, with a
+    new connection for every request (Connection: close) and with one kept-alive connection. HTTPS is measured only if
+    openssl is available to create a self-signed certificate.
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    pages_count = 20
+    task_store = generate_task_store(task_count)
+    taskids = list(task_store.store_dict_id)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        task_store.filepath = os.path.join(tmp_dir, "tasks.dat")
+        task_store_trash = TaskStore(os.path.join(tmp_dir, "tasks_trash.dat"))
+        ui_auth = WoolnoteUIAuth()
+        woolnote_config = WoolnoteConfig()
+        web_ui = WebUI(task_store, task_store_trash, UIBackend(task_store, task_store_trash), woolnote_config, ui_auth)
+        # the connections are kept alive (HTTP/1.1) only by the handler created for the thread pool server
+        server_concurrent = config.SERVER_CONCURRENT
+        try:
+            config.SERVER_CONCURRENT = True
+            handler_class = get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth,
+                                                         util.ReadWriteLock())
+        finally:
+            config.SERVER_CONCURRENT = server_concurrent
+
+        class QuietHandler(handler_class):
+            def log_message(self, format, *args):
+                pass
+
+        cookie = "auth=" + ui_auth.return_cookie_authenticated()
+
+        def load_pages(get_connection, keep_alive):
+            headers = {"Cookie": cookie}
+            if not keep_alive:
+                headers["Connection"] = "close"
+            connection = get_connection()
+            start = time.perf_counter()
+            for i in range(pages_count):
+                for path in ["/woolnote?action=page_display_note&taskid=" + taskids[i],
+                             "/uikit-2.27.1.gradient-customized.css", "/favicon.ico"]:
+                    connection.request("GET", path, headers=headers)
+                    connection.getresponse().read()
+            connection.close()
+            return (time.perf_counter() - start) / pages_count
+
+        protocols = [("HTTP", None)]
+        if shutil.which("openssl"):
+            cert_path = os.path.join(tmp_dir, "cert.pem")
+            key_path = os.path.join(tmp_dir, "key.pem")
+            subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-keyout", key_path, "-out", cert_path,
+                            "-days", "1", "-nodes", "-subj", "/CN=localhost"], check=True, capture_output=True)
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(certfile=cert_path, keyfile=key_path)
+            protocols.append(("HTTPS", ssl_context))
+        else:
+            print("  openssl not found, HTTPS is not measured")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=config.SERVER_THREAD_POOL_SIZE) as executor:
+            for protocol_name, ssl_context in protocols:
+                server = thread_pool_http_server.ThreadPoolHTTPServer(("127.0.0.1", 0), QuietHandler, executor)
+                if ssl_context is not None:
+                    server.socket = ssl_context.wrap_socket(server.socket, server_side=True,
+                                                            do_handshake_on_connect=False)
+                    client_ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                    client_ssl_context.check_hostname = False
+                    client_ssl_context.verify_mode = ssl.CERT_NONE
+
+                    def get_connection():
+                        return http.client.HTTPSConnection("127.0.0.1", server.server_address[1],
+                                                           context=client_ssl_context)
+                else:
+                    def get_connection():
+                        return http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+                server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+                server_thread.start()
+                try:
+                    # the first request reads the configuration and creates the config note
+                    load_pages(get_connection, False)
+                    time_closed = load_pages(get_connection, False)
+                    time_kept_alive = load_pages(get_connection, True)
+                    print("  {:<50} {:10.2f} ms".format(
+                        "{}, a new connection for every request".format(protocol_name), time_closed * 1000))
+                    print("  {:<50} {:10.2f} ms  ({:.1f}x)".format(
+                        "{}, one kept-alive connection".format(protocol_name), time_kept_alive * 1000,
+                        time_closed / time_kept_alive))
+                finally:
+                    server.shutdown()
+                    server_thread.join()
+                    server.server_close()
+
+
+def benchmark_http_compression(task_count):
+    """
+    Size and time of serving the list of all notes and the CSS with no compression and with gzip with several
+    HTTP_COMPRESSION_LEVELs, and the time the response would take over a link of 2 Mbit/s (a phone).
+
+    Args:
+        task_count (int):
+
+    Returns:
+        None:
+    """
+    requests_count = 5
+    link_bytes_per_second = 2 * 1000 * 1000 / 8
+    task_store = generate_task_store(task_count)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        task_store.filepath = os.path.join(tmp_dir, "tasks.dat")
+        task_store_trash = TaskStore(os.path.join(tmp_dir, "tasks_trash.dat"))
+        ui_auth = WoolnoteUIAuth()
+        woolnote_config = WoolnoteConfig()
+        web_ui = WebUI(task_store, task_store_trash, UIBackend(task_store, task_store_trash), woolnote_config, ui_auth)
+        cookie = "auth=" + ui_auth.return_cookie_authenticated()
+        http_compression_level = config.HTTP_COMPRESSION_LEVEL
+        try:
+            for compression_level in [None, 1, 6, 9]:
+                # the static resources are compressed when the class is created
+                config.HTTP_COMPRESSION_LEVEL = compression_level
+                handler_class = get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth,
+                                                             util.ReadWriteLock())
+
+                class QuietHandler(handler_class):
+                    def log_message(self, format, *args):
+                        pass
+
+                server = HTTPServer(("127.0.0.1", 0), QuietHandler)
+                server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+                server_thread.start()
+                try:
+                    for page_name, path in [("list of all notes", "/woolnote"),
+                                            ("CSS", "/uikit-2.27.1.gradient-customized.css")]:
+                        headers = {"Cookie": cookie, "Accept-Encoding": "gzip", "Connection": "close"}
+                        # the first request reads the configuration and creates the config note
+                        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+                        connection.request("GET", path, headers=headers)
+                        connection.getresponse().read()
+                        start = time.perf_counter()
+                        for i in range(requests_count):
+                            connection.request("GET", path, headers=headers)
+                            page_content = connection.getresponse().read()
+                        duration = (time.perf_counter() - start) / requests_count
+                        connection.close()
+                        print("  {:<50} {:10.1f} ms {:10.1f} kB {:10.1f} ms at 2 Mbit/s".format(
+                            "{}, level {}".format(page_name, compression_level), duration * 1000,
+                            len(page_content) / 1000, len(page_content) / link_bytes_per_second * 1000))
+                finally:
+                    server.shutdown()
+                    server_thread.join()
+                    server.server_close()
+        finally:
+            config.HTTP_COMPRESSION_LEVEL = http_compression_level
+
+
+BENCHMARKS = {
+    "search": benchmark_search,
+    "search_cache": benchmark_search_cache,
+    "load": benchmark_load,
+    "save": benchmark_save,
+    "memory": benchmark_memory,
+    "lazy_load": benchmark_lazy_load,
+    "startup": benchmark_startup,
+    "parallel_load": benchmark_parallel_load,
+    "backup": benchmark_backup,
+    "import": benchmark_import,
+    "export": benchmark_export,
+    "import_summary": benchmark_import_summary,
+    "compression": benchmark_compression,
+    "concurrent_serving": benchmark_concurrent_serving,
+    "idle_connections": benchmark_idle_connections,
+    "keep_alive": benchmark_keep_alive,
+    "http_compression": benchmark_http_compression,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Woolnote benchmarks")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run (all if not specified): {}".format(", ".join(sorted(BENCHMARKS))))
+    parser.add_argument("--tasks", type=int, default=5000, help="number of tasks in the generated task stores")
+    args = parser.parse_args()
+    for benchmark_name in args.benchmarks:
+        if benchmark_name not in BENCHMARKS:
+            parser.error("unknown benchmark: {}".format(benchmark_name))
+    benchmark_names = args.benchmarks or list(BENCHMARKS)
+    for benchmark_name in benchmark_names:
+        print("=== {} ({} tasks) ===".format(benchmark_name, args.tasks))
+        BENCHMARKS[benchmark_name](args.tasks)
+
+
+if __name__ == "__main__":
+    main()
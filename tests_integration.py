@@ -4058,7 +4058,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=main_list" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=main_list" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: <br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-30 11:20:00<br>\n<form class="uk-form" action="/woolnote?action=req_note_checkboxes_save&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=main_list&task_body_hash=79656d4861e3407e6a503e5e0f99da74b7dd35995cd42f7e377835f49b661fd3" method="post">\n<input type="submit" class="uk-button" value="Save checkboxes"><br>\n<input type="hidden" name="post_action" value="req_note_checkboxes_save">\n<hr>\n<br>\n<br>\n<br>\n<br>\n..<br>\n<br>\nasdf<br>\n<br>\n<br>\n<b><u>longterm/sometime task inbox</u></b>: (individual tasks without deadline)<br>\n<br>\n<b><u>Q1</u></b><br>\n<br>\n...q1...<br>\n<input type="checkbox" name="checkbox15" checked="checked" >q1 @doctor 1605 checkup<br>\n<input type="checkbox" name="checkbox16" checked="checked" >q1 @work w8<br>\n<br>\n<br>\n<b><u>Q2</u></b><br>\n<br>\n...q2...<br>\n<input type="checkbox" name="checkbox22"  >q2 @personal: &quot;First of all -- figure out a small way to be present every day Is it 15 minutes before your kids go to school? Is it a note in their lunchbox because you&#x27;re leaving too early to see them? Is it a loving phone call or e-mail to your husband between cases?&quot;<br>\n<input type="checkbox" name="checkbox23" checked="checked" >q2 @home - adjust cross country skis<br>\n<input type="checkbox" name="checkbox24"  >q2 shoe warranty<br>\n<br>\n<br>\n...q2 - @pc / @home...<br>\n<input type="checkbox" name="checkbox28"  >q2 @pc @work google doc insect repellents<br>\n<br>\n<br>\n<b><u>Q3</u></b><br>\n<br>\n...q3...<br>\n<br>\n<br>\n<b><u>Q4</u></b><br>\n<br>\n...q4...<br>\n<br>\n...q4 - @pc / @home...<br>\n<input type="checkbox" name="checkbox41"  >find whether magnetic water softeners are pseudoscience<br>\n<br>\n...q4 - relax @pc @home...<br>\n<input type="checkbox" name="checkbox44"  >watch mgs walkthrough<br>\n<input type="checkbox" name="checkbox45"  >system shock 2 - watch walkthrough<br>\n<br>\n<br>\n...q4 - relax @pc / @mobile / @home...<br>\n<input type="checkbox" name="checkbox49"  ><a href="http://varlamov.ru/1405687.html">http://varlamov.ru/1405687.html</a><br>\n<br>\n...<br>\n<br>\n<br>\n<b><u>longterm/sometime reference inbox</u></b>: (individual references without deadline)<br>\n<br>\n<br>\n<b><u>Q1</u></b><br>\n<br>\n...q1...<br>\n<br>\n<br>\n<b><u>Q2</u></b><br>\n<br>\n...q2...<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>@pc: /usr/lib/virtualbox/vboxdrv.sh setup</li></ul>\n<br>\n<br>\n<br>\n<b><u>Q3</u></b><br>\n<br>\n...q3...<br>\n<br>\n<br>\n<br>\n<br>\n<b><u>Q4</u></b><br>\n<br>\n...q4...<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li><a href="http://self-compassion.org/category/exercises/">http://self-compassion.org/category/exercises/</a></li></ul>\n<br>\n<br>\n...<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n</form>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=main_list" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=main_list" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: <br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-24 22:00:00<br>\n<form class="uk-form" action="/woolnote?action=req_note_checkboxes_save&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=main_list&task_body_hash=79656d4861e3407e6a503e5e0f99da74b7dd35995cd42f7e377835f49b661fd3" method="post">\n<input type="submit" class="uk-button" value="Save checkboxes"><br>\n<input type="hidden" name="post_action" value="req_note_checkboxes_save">\n<hr>\n<br>\n<br>\n<br>\n<br>\n..<br>\n<br>\nasdf<br>\n<br>\n<br>\n<b><u>longterm/sometime task inbox</u></b>: (individual tasks without deadline)<br>\n<br>\n<b><u>Q1</u></b><br>\n<br>\n...q1...<br>\n<input type="checkbox" name="checkbox15" checked="checked" >q1 @doctor 1605 checkup<br>\n<input type="checkbox" name="checkbox16" checked="checked" >q1 @work w8<br>\n<br>\n<br>\n<b><u>Q2</u></b><br>\n<br>\n...q2...<br>\n<input type="checkbox" name="checkbox22"  >q2 @personal: &quot;First of all -- figure out a small way to be present every day Is it 15 minutes before your kids go to school? Is it a note in their lunchbox because you&#x27;re leaving too early to see them? Is it a loving phone call or e-mail to your husband between cases?&quot;<br>\n<input type="checkbox" name="checkbox23" checked="checked" >q2 @home - adjust cross country skis<br>\n<input type="checkbox" name="checkbox24"  >q2 shoe warranty<br>\n<br>\n<br>\n...q2 - @pc / @home...<br>\n<input type="checkbox" name="checkbox28"  >q2 @pc @work google doc insect repellents<br>\n<br>\n<br>\n<b><u>Q3</u></b><br>\n<br>\n...q3...<br>\n<br>\n<br>\n<b><u>Q4</u></b><br>\n<br>\n...q4...<br>\n<br>\n...q4 - @pc / @home...<br>\n<input type="checkbox" name="checkbox41"  >find whether magnetic water softeners are pseudoscience<br>\n<br>\n...q4 - relax @pc @home...<br>\n<input type="checkbox" name="checkbox44"  >watch mgs walkthrough<br>\n<input type="checkbox" name="checkbox45"  >system shock 2 - watch walkthrough<br>\n<br>\n<br>\n...q4 - relax @pc / @mobile / @home...<br>\n<input type="checkbox" name="checkbox49"  ><a href="http://varlamov.ru/1405687.html">http://varlamov.ru/1405687.html</a><br>\n<br>\n...<br>\n<br>\n<br>\n<b><u>longterm/sometime reference inbox</u></b>: (individual references without deadline)<br>\n<br>\n<br>\n<b><u>Q1</u></b><br>\n<br>\n...q1...<br>\n<br>\n<br>\n<b><u>Q2</u></b><br>\n<br>\n...q2...<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>@pc: /usr/lib/virtualbox/vboxdrv.sh setup</li></ul>\n<br>\n<br>\n<br>\n<b><u>Q3</u></b><br>\n<br>\n...q3...<br>\n<br>\n<br>\n<br>\n<br>\n<b><u>Q4</u></b><br>\n<br>\n...q4...<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li><a href="http://self-compassion.org/category/exercises/">http://self-compassion.org/category/exercises/</a></li></ul>\n<br>\n<br>\n...<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n<br>\n</form>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -4325,7 +4325,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=main_list" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=main_list" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-04-03 12:33:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=main_list" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=main_list" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=main_list" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-28 23:13:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -4616,7 +4616,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=None" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=None" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-04-03 12:33:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=None" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=None" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-28 23:13:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -4907,7 +4907,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=None" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=None" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-04-03 12:33:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=None" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=None" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=None" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-28 23:13:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -6362,7 +6362,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-04-03 12:33:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__<span style=\'background-color: #FFFF00\'>longterm</span>/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__<span style=\'background-color: #FFFF00\'>longterm</span>/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-28 23:13:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__<span style=\'background-color: #FFFF00\'>longterm</span>/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__<span style=\'background-color: #FFFF00\'>longterm</span>/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -6459,7 +6459,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-04-03 12:33:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>inbox - tasks/reference - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=DA131CEFC03BA5645EEE1304C47E5C2350FB3B854C23825A2AFA92EA6417C41F&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=0a58d4d36c27ae38c94701ad130e03efb33a09a2041e53c79c7901278f8bcac7" class="uk-button">delete note</a><br>\n<hr><b>inbox - tasks/reference</b><br>\nFolder: inbox<br>\nTags: !starred, time current<br>\nDue date: 1999-01-01<br>\nCreated: 2016-03-02 22:16:32<br>\nChanged: 2030-03-28 23:13:20<br>\n<hr><span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >..</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >asdf</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>task&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>tasks&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@doctor&nbsp;<wbr>1605&nbsp;<wbr>checkup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q1&nbsp;<wbr>@work&nbsp;<wbr>w8</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@personal:&nbsp;<wbr>&quot;First&nbsp;<wbr>of&nbsp;<wbr>all&nbsp;<wbr>--&nbsp;<wbr>figure&nbsp;<wbr>out&nbsp;<wbr>a&nbsp;<wbr>small&nbsp;<wbr>way&nbsp;<wbr>to&nbsp;<wbr>be&nbsp;<wbr>present&nbsp;<wbr>every&nbsp;<wbr>day&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>15&nbsp;<wbr>minutes&nbsp;<wbr>before&nbsp;<wbr>your&nbsp;<wbr>kids&nbsp;<wbr>go&nbsp;<wbr>to&nbsp;<wbr>school?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>note&nbsp;<wbr>in&nbsp;<wbr>their&nbsp;<wbr>lunchbox&nbsp;<wbr>because&nbsp;<wbr>you&#x27;re&nbsp;<wbr>leaving&nbsp;<wbr>too&nbsp;<wbr>early&nbsp;<wbr>to&nbsp;<wbr>see&nbsp;<wbr>them?&nbsp;<wbr>Is&nbsp;<wbr>it&nbsp;<wbr>a&nbsp;<wbr>loving&nbsp;<wbr>phone&nbsp;<wbr>call&nbsp;<wbr>or&nbsp;<wbr>e-mail&nbsp;<wbr>to&nbsp;<wbr>your&nbsp;<wbr>husband&nbsp;<wbr>between&nbsp;<wbr>cases?&quot;</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >+&nbsp;<wbr>q2&nbsp;<wbr>@home&nbsp;<wbr>-&nbsp;<wbr>adjust&nbsp;<wbr>cross&nbsp;<wbr>country&nbsp;<wbr>skis</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>shoe&nbsp;<wbr>warranty</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>q2&nbsp;<wbr>@pc&nbsp;<wbr>@work&nbsp;<wbr>google&nbsp;<wbr>doc&nbsp;<wbr>insect&nbsp;<wbr>repellents</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>find&nbsp;<wbr>whether&nbsp;<wbr>magnetic&nbsp;<wbr>water&nbsp;<wbr>softeners&nbsp;<wbr>are&nbsp;<wbr>pseudoscience</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>watch&nbsp;<wbr>mgs&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>system&nbsp;<wbr>shock&nbsp;<wbr>2&nbsp;<wbr>-&nbsp;<wbr>watch&nbsp;<wbr>walkthrough</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4&nbsp;<wbr>-&nbsp;<wbr>relax&nbsp;<wbr>@pc&nbsp;<wbr>/&nbsp;<wbr>@mobile&nbsp;<wbr>/&nbsp;<wbr>@home...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >-&nbsp;<wbr>http://varlamov.ru/1405687.html</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__longterm/sometime&nbsp;<wbr>reference&nbsp;<wbr>inbox__**:&nbsp;<wbr>(individual&nbsp;<wbr>references&nbsp;<wbr>without&nbsp;<wbr>deadline)</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q1__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q1...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q2__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q2...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>@pc:&nbsp;<wbr>/usr/lib/virtualbox/vboxdrv.sh&nbsp;<wbr>setup</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q3__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q3...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >**__Q4__**</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...q4...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >*&nbsp;<wbr>http://self-compassion.org/category/exercises/</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" >...</span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br>\n<span style="white-space: pre-wrap; font-family: monospace;" ></span><br><br>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -7260,7 +7260,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>all data here are dummy data - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">delete note</a><br>\n<hr><b>all data here are dummy data</b><br>\nFolder: notes txt<br>\nTags: <br>\nDue date: <br>\nCreated: 2017-04-21 13:00:08<br>\nChanged: 2030-04-08 12:00:00<br>\n<form class="uk-form" action="/woolnote?action=req_note_checkboxes_save&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b&task_body_hash=83a49098caad142b2191bf859ec2154a1444a0b3281bdf7003c925743f50ae13" method="post">\n<input type="submit" class="uk-button" value="Save checkboxes"><br>\n<input type="hidden" name="post_action" value="req_note_checkboxes_save">\n<hr>\n<br>\n<br>\n<br>\n<br>\nall data here are dummy data to show how woolnote can be used <br>\n<br>\n(including the TASK-ID and TASK-PUBLIC-SHARE-AUTH keys)<br>\n<br>\n<br>\nasdfasdf<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>asdf</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>jaslkdfjlaskdf</li>\n<li>ajsdlfkj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>alksdfjalskfdj</li>\n<li>aslfdkjaslfkj</li>\n<li><a href="https://laskdfj.com">https://laskdfj.com</a> jjlkjčřš <input type="checkbox" name="checkbox1"  > jasdlfkj <input type="checkbox" name="checkbox2" checked="checked" > safldkj</li>\n<li>___laksdjf___</li></ul></ul></ul>\n<input type="checkbox" name="checkbox21"  >íáýas dfask jf<br>\n<input type="checkbox" name="checkbox22"  >lkj<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>adlsjfkjaf</li>\n<li>asldkfj</li></ul>\n<li>faskldfj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>alskdfj</li>\n<li><input type="checkbox" name="checkbox3"  > <a href="https://laskdfj.com">https://laskdfj.com</a> jasldkfj</li></ul></ul></ul>\n<br>\n<hr><br>\n<br>\nflakjdsf <b>alksdjf</b> asldfkjasdf <i>alskfjalskdfj</i> alksjdf <br>\n<br>\n<br>\n<br>\n<br>\n</form>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>all data here are dummy data - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">delete note</a><br>\n<hr><b>all data here are dummy data</b><br>\nFolder: notes txt<br>\nTags: <br>\nDue date: <br>\nCreated: 2017-04-21 13:00:08<br>\nChanged: 2030-04-02 22:40:00<br>\n<form class="uk-form" action="/woolnote?action=req_note_checkboxes_save&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b&task_body_hash=83a49098caad142b2191bf859ec2154a1444a0b3281bdf7003c925743f50ae13" method="post">\n<input type="submit" class="uk-button" value="Save checkboxes"><br>\n<input type="hidden" name="post_action" value="req_note_checkboxes_save">\n<hr>\n<br>\n<br>\n<br>\n<br>\nall data here are dummy data to show how woolnote can be used <br>\n<br>\n(including the TASK-ID and TASK-PUBLIC-SHARE-AUTH keys)<br>\n<br>\n<br>\nasdfasdf<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>asdf</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>jaslkdfjlaskdf</li>\n<li>ajsdlfkj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>alksdfjalskfdj</li>\n<li>aslfdkjaslfkj</li>\n<li><a href="https://laskdfj.com">https://laskdfj.com</a> jjlkjčřš <input type="checkbox" name="checkbox1"  > jasdlfkj <input type="checkbox" name="checkbox2" checked="checked" > safldkj</li>\n<li>___laksdjf___</li></ul></ul></ul>\n<input type="checkbox" name="checkbox21"  >íáýas dfask jf<br>\n<input type="checkbox" name="checkbox22"  >lkj<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>adlsjfkjaf</li>\n<li>asldkfj</li></ul>\n<li>faskldfj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>alskdfj</li>\n<li><input type="checkbox" name="checkbox3"  > <a href="https://laskdfj.com">https://laskdfj.com</a> jasldkfj</li></ul></ul></ul>\n<br>\n<hr><br>\n<br>\nflakjdsf <b>alksdjf</b> asldfkjasdf <i>alskfjalskdfj</i> alksjdf <br>\n<br>\n<br>\n<br>\n<br>\n</form>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -7333,7 +7333,7 @@ instance_self = get_instance_self('WebInterfaceHandlerLocal')
 args = ()
 kwargs = {}
 function = instance_self.req_handler
-expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>all data here are dummy data - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">delete note</a><br>\n<hr><b>all data here are dummy data</b><br>\nFolder: notes txt<br>\nTags: <br>\nDue date: <br>\nCreated: 2017-04-21 13:00:08<br>\nChanged: 2030-04-08 14:46:40<br>\n<form class="uk-form" action="/woolnote?action=req_note_checkboxes_save&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b&task_body_hash=9837dd828c4a74ef3289f9e269314a961e1f259670d8fd5f313479fa1c7928f4" method="post">\n<input type="submit" class="uk-button" value="Save checkboxes"><br>\n<input type="hidden" name="post_action" value="req_note_checkboxes_save">\n<hr>\n<br>\n<br>\n<br>\n<br>\n<br>\nall data here are dummy data to show how woolnote can be used <br>\n<br>\n(including the TASK-ID and TASK-PUBLIC-SHARE-AUTH keys)<br>\n<br>\n<br>\nasdfasdf<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>asdf</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>jaslkdfjlaskdf</li>\n<li>ajsdlfkj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>alksdfjalskfdj</li>\n<li>aslfdkjaslfkj</li>\n<li><a href="https://laskdfj.com">https://laskdfj.com</a> jjlkjčřš <input type="checkbox" name="checkbox1" checked="checked" > jasdlfkj <input type="checkbox" name="checkbox2"  > safldkj</li>\n<li>___laksdjf___</li></ul></ul></ul>\n<input type="checkbox" name="checkbox22" checked="checked" >íáýas dfask jf<br>\n<input type="checkbox" name="checkbox23" checked="checked" >lkj<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>adlsjfkjaf</li>\n<li>asldkfj</li></ul>\n<li>faskldfj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>alskdfj</li>\n<li><input type="checkbox" name="checkbox3"  > <a href="https://laskdfj.com">https://laskdfj.com</a> jasldkfj</li></ul></ul></ul>\n<br>\n<hr><br>\n<br>\nflakjdsf <b>alksdjf</b> asldfkjasdf <i>alskfjalskdfj</i> alksjdf <br>\n<br>\n<br>\n<br>\n<br>\n</form>\n        </div><br>\n        </div>\n            </body>\n            </html>'
+expected = '<html>\n            <meta charset=utf-8>\n            <meta name="viewport" content="width=device-width, height=device-height, initial-scale=1.0, user-scalable=no, user-scalable=0"/>\n            <head>\n            <link rel="stylesheet" href="../uikit-2.27.1.gradient-customized.css.v5.css">\n            <title>all data here are dummy data - woolnote</title>\n            </head>\n            <body>\n            <div id="jumptotopbutton" style="position: fixed; bottom: 15px; right: 10px; padding: 4px; border: 1px solid #ccc; background: #f6f6f6; color: #333; text-align: center; cursor: pointer; " onclick="scroll(0,0); window.scrollTo(0, 0);"><div style="font-size: 16px;">&#x25B2;</div></div>\n        <div id="content" class="uk-margin-left uk-margin-right uk-margin-top uk-margin-bottom">\n        \n        <div id="pagemenu"><span style="font-size:20pt; " >\n            <a href="/woolnote?action=history_back&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">back to list</a>\n            </span>\n            <span style="font-size:20pt; " >\n            <a href="/woolnote?action=page_display_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button uk-button-large">reload note</a>\n            </span></div><br>\n        <div id="pagemaincontent">\n        <span style="font-size:20pt; " >\n<a href="/woolnote?action=page_edit_note&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">edit note</a><br>\n</span><br>\n<a href="/woolnote?action=page_delete_taskid&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b" class="uk-button">delete note</a><br>\n<hr><b>all data here are dummy data</b><br>\nFolder: notes txt<br>\nTags: <br>\nDue date: <br>\nCreated: 2017-04-21 13:00:08<br>\nChanged: 2030-04-03 01:26:40<br>\n<form class="uk-form" action="/woolnote?action=req_note_checkboxes_save&taskid=7796E968EC7853A3516D4024962FCD33067577E9041CF10E9879E84BA28F3485&sessactionauth=00000000000000000000000000000000000000000000000000000000001E8482&history_back_id=13dd524a92cfdd53f60699b89c91d57b15a19f0a905da4a4bc692232a9077f0b&task_body_hash=9837dd828c4a74ef3289f9e269314a961e1f259670d8fd5f313479fa1c7928f4" method="post">\n<input type="submit" class="uk-button" value="Save checkboxes"><br>\n<input type="hidden" name="post_action" value="req_note_checkboxes_save">\n<hr>\n<br>\n<br>\n<br>\n<br>\n<br>\nall data here are dummy data to show how woolnote can be used <br>\n<br>\n(including the TASK-ID and TASK-PUBLIC-SHARE-AUTH keys)<br>\n<br>\n<br>\nasdfasdf<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>asdf</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>jaslkdfjlaskdf</li>\n<li>ajsdlfkj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><li>alksdfjalskfdj</li>\n<li>aslfdkjaslfkj</li>\n<li><a href="https://laskdfj.com">https://laskdfj.com</a> jjlkjčřš <input type="checkbox" name="checkbox1" checked="checked" > jasdlfkj <input type="checkbox" name="checkbox2"  > safldkj</li>\n<li>___laksdjf___</li></ul></ul></ul>\n<input type="checkbox" name="checkbox22" checked="checked" >íáýas dfask jf<br>\n<input type="checkbox" name="checkbox23" checked="checked" >lkj<br>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>adlsjfkjaf</li>\n<li>asldkfj</li></ul>\n<li>faskldfj</li>\n<ul style=" margin: 0;  padding-left: 1.2em; " ><ul style=" margin: 0;  padding-left: 1.2em; " ><li>alskdfj</li>\n<li><input type="checkbox" name="checkbox3"  > <a href="https://laskdfj.com">https://laskdfj.com</a> jasldkfj</li></ul></ul></ul>\n<br>\n<hr><br>\n<br>\nflakjdsf <b>alksdjf</b> asldfkjasdf <i>alskfjalskdfj</i> alksjdf <br>\n<br>\n<br>\n<br>\n<br>\n</form>\n        </div><br>\n        </div>\n            </body>\n            </html>'
 try:
     output = function(*args, **kwargs)
 except Exception as ex:
@@ -0,0 +1,197 @@
+# University of Illinois/NCSA Open Source License
+# Copyright (c) 2018, Jakub Svoboda.
+
+# TODO: docstring for the file
+from woolnote import systemencoding
+import asyncio
+import io
+import ssl
+
+from woolnote import config
+from woolnote import util
+
+
+# maximum number of lines of the request line and the headers of a request (like in http.client)
+REQUEST_HEAD_MAX_LINES = 101
+
+
+# HTTP server on an asyncio event loop
+######################################
+
+def get_buffered_handler_class(RequestHandlerClass):
+    """
+    Returns a subclass of the request handler class which handles exactly one request read from bytes in memory and
+    writes the response into memory, so that the same handler can be used by an asyncio event loop which receives and
+    sends the data. The response is exactly the same as the one the handler writes to a socket.
+
+    Args:
+        RequestHandlerClass (type): subclass of http.server.BaseHTTPRequestHandler
+
+    Returns:
+        type: class BufferedRequestHandler(RequestHandlerClass), its request is a tuple of the bytes of the request and
+              the number of the requests received on the connection before it
+    """
+    class BufferedRequestHandler(RequestHandlerClass):
+        def setup(self):
+            request, self.requests_handled = self.request
+            self.rfile = io.BytesIO(request)
+            self.wfile = io.BytesIO()
+
+        def helper_set_connection_timeout(self, timeout):
+            # the timeouts are handled by the event loop
+            pass
+
+        def handle_expect_100(self):
+            # 100 Continue has been sent by the event loop before the body was received
+            return True
+
+        def handle(self):
+            # only the one request, the event loop reads the next request on the connection if it's kept alive
+            self.handle_one_request()
+
+        def finish(self):
+            # the response stays in self.wfile
+            pass
+
+    return BufferedRequestHandler
+
+
+class AsyncioHTTPServer():
+    def __init__(self, RequestHandlerClass, executor):
+        """
+        HTTP server whose connections are served by an asyncio event loop, so that any number of idle clients (e.g.
+        phones keeping connections open) and slow TLS handshakes don't take any threads. Every request is received
+        completely by the event loop and then handled by the request handler in a thread of the executor, where the
+        pages are generated and the task stores saved. The request handler has to be safe to use from several threads
+        at once (see the request_lock of get_WebInterfaceHandlerLocal()).
+
+        Args:
+            RequestHandlerClass (type): subclass of http.server.BaseHTTPRequestHandler
+            executor (concurrent.futures.ThreadPoolExecutor):
+        """
+        super().__init__()
+        self.RequestHandlerClass = get_buffered_handler_class(RequestHandlerClass)
+        self.executor = executor
+
+    @staticmethod
+    async def read_request(reader, writer):
+        """
+        Reads the request line, the headers and the body (according to Content-Length) of one request.
+
+        Args:
+            reader (asyncio.StreamReader):
+            writer (asyncio.StreamWriter): For the response 100 Continue.
+
+        Returns:
+            Union[None, bytes]: None if the connection has been closed before a complete request has been received
+        """
+        lines = []
+        content_length = 0
+        expect_100 = False
+        while True:
+            line = await reader.readline()
+            if not line.endswith(b"\n"):
+                # closed by the client
+                return None
+            if not lines and line in (b"\r\n", b"\n"):
+                # empty lines before the request line are ignored by http.server as well
+                continue
+            lines.append(line)
+            if line in (b"\r\n", b"\n"):
+                break
+            if len(lines) > REQUEST_HEAD_MAX_LINES:
+                # the request handler responds with an error, nothing else is read
+                return b"".join(lines)
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                try:
+                    content_length = max(0, int(value.strip()))
+                except ValueError:
+                    content_length = 0
+            elif name.strip().lower() == b"expect" and value.strip().lower() == b"100-continue":
+                expect_100 = True
+        if expect_100 and content_length and lines[0].rstrip().endswith(b"HTTP/1.1"):
+            # the client waits for it before sending the body
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+        body = await reader.readexactly(content_length)
+        return b"".join(lines) + body
+
+    def handle_request(self, request, requests_handled, client_address):
+        """
+        Handles the request in a thread of the executor.
+
+        Args:
+            request (bytes): The complete request.
+            requests_handled (int): The number of the requests received on the connection before this one.
+            client_address (Tuple[str, int]):
+
+        Returns:
+            Tuple[bytes, bool]: the response, whether the connection has to be closed
+        """
+        handler = self.RequestHandlerClass((request, requests_handled), client_address, self)
+        return handler.wfile.getvalue(), handler.close_connection
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves the requests of one connection until the request handler closes it, the client closes it or sends
+        nothing for SERVER_REQUEST_TIMEOUT seconds (SERVER_KEEP_ALIVE_TIMEOUT seconds after the first request).
+
+        Args:
+            reader (asyncio.StreamReader):
+            writer (asyncio.StreamWriter):
+
+        Returns:
+            None:
+        """
+        loop = asyncio.get_running_loop()
+        client_address = writer.get_extra_info("peername")
+        requests_handled = 0
+        try:
+            while True:
+                timeout = config.SERVER_KEEP_ALIVE_TIMEOUT if requests_handled else config.SERVER_REQUEST_TIMEOUT
+                request = await asyncio.wait_for(self.read_request(reader, writer), timeout)
+                if request is None:
+                    break
+                response, close_connection = await loop.run_in_executor(self.executor, self.handle_request, request,
+                                                                        requests_handled, client_address)
+                requests_handled += 1
+                writer.write(response)
+                await asyncio.wait_for(writer.drain(), config.SERVER_REQUEST_TIMEOUT)
+                if close_connection:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, ConnectionError, ssl.SSLError) as exc:
+            # ValueError - a line longer than the limit of the reader
+            util.dbgprint("connection from {} closed - {}".format(client_address, repr(exc)))
+        finally:
+            writer.close()
+
+    async def start(self, port, ssl_context=None, host=None):
+        """
+        Starts accepting the connections on the port.
+
+        Args:
+            port (int):
+            ssl_context (Union[None, ssl.SSLContext]): The connections use TLS if set.
+            host (Union[None, str]): All interfaces if None.
+
+        Returns:
+            asyncio.AbstractServer:
+        """
+        return await asyncio.start_server(self.handle_connection, host=host, port=port, ssl=ssl_context,
+                                          ssl_handshake_timeout=config.SERVER_REQUEST_TIMEOUT if ssl_context else None)
+
+    def serve_forever(self, ports_with_ssl_contexts):
+        """
+        Runs the event loop serving on the ports forever.
+
+        Args:
+            ports_with_ssl_contexts (List[Tuple[int, Union[None, ssl.SSLContext]]]): The ports and their SSL contexts.
+
+        Returns:
+            None:
+        """
+        async def serve():
+            servers = [await self.start(port, ssl_context) for port, ssl_context in ports_with_ssl_contexts]
+            await asyncio.gather(*(server.serve_forever() for server in servers))
+
+        asyncio.run(serve())
@@ -54,20 +54,30 @@ __HELP_MSG_FRAGMENT = " or the working dir './'" if not THIS_IS_ANDROID else ""
 # Filenames for files
 # * tasks.dat - the main internal task database
 # * tasks_trash.dat - the internal trash
-# * woolnote.dat - the task database for export/import (has updated export_lamport_clock/timestamps)
+# * tasks_trash_archive.dat - the oldest notes from the internal trash (only appended to the .journal file)
+# * woolnote.dat - the task database for export/import inside woolnote.zip (has updated export_lamport_clock/timestamps)
 # * woolnote.zip - the task database for export/import zipped so that less data are transmitted
+# * woolnote_summary.dat - hashes of the groups of tasks in woolnote.dat inside woolnote.zip, so that the import can
+#                          skip the tasks that have not been changed
 # - TODO: autocreate files?
 
-DIFFNEW_EXTENSION = '.diffnew'  # appended to the path when accessing a differential database
+DIFFNEW_EXTENSION = '.diffnew'  # appended to the path when accessing a differential database (older versions)
+JOURNAL_EXTENSION = '.journal'  # appended to the path when accessing the journal of changes since the last full save
+JOURNAL_COMPACTING_EXTENSION = '.journal.compacting'  # the journal while its changes are being written to the full file
+SNAPSHOT_EXTENSION = '.snapshot'  # appended to the path when accessing the binary snapshot of the database
+BACKUP_MANIFEST_EXTENSION = '.manifest'  # appended to the name of a backup when accessing its list of tasks
+BACKUP_OBJECTS_DIRECTORY = 'objects'  # directory in the backup location in which the tasks of backups are stored
+TEMP_EXTENSION = '.tmp'  # appended to the path when writing a file that then atomically replaces the file at the path
 FILE_TASKS_DAT = 'tasks.dat'
 FILE_TASKS_TRASH_DAT = 'tasks_trash.dat'
+FILE_TASKS_TRASH_ARCHIVE_DAT = 'tasks_trash_archive.dat'
 FILE_WOOLNOTE_DAT = 'woolnote.dat'
 FILE_WOOLNOTE_ZIP = 'woolnote.zip'
+FILE_WOOLNOTE_SUMMARY = 'woolnote_summary.dat'
 
 # Primary database location - this is written to on every save
-# * tasks.dat - the main internal task database
-# * tasks_trash.dat - the internal trash
-# * woolnote.dat - for caching before ZIP / after unZIP before export.
+# * tasks.dat - the main internal task database (+ tasks.dat.journal - the changes since it was fully written)
+# * tasks_trash.dat - the internal trash (+ tasks_trash.dat.journal)
 # The first available path is selected - allows autodetection between multiple environments (pc, phone).
 # If none is available, an empty path is used (depends on the environment what it actually resolves to).
 _PATHS_SAVE_DB = ["/sdcard/woolnote/"]
@@ -88,8 +98,9 @@ if PATH_SAVE_DB is None:
 
 
 # Location for backup - this is written to on every startup, import, export
-# * tasks.dat - timestamped filenames
-# * tasks_trash.dat - timestamped filenames
+# * tasks.dat - timestamped manifest filenames
+# * tasks_trash.dat - timestamped manifest filenames
+# * objects - the tasks of all backups, each stored only once
 # The first available path is selected - allows autodetection between multiple environments (pc, phone).
 # If none is available, an empty path is used (depends on the environment what it actually resolves to).
 _PATHS_SAVE_DB_BACKUP = ["/sdcard/woolnote/backups/", "backups"]
@@ -191,3 +202,100 @@ try:
 except:
     DISPLAY_STARTUP_HELP = True
     DISPLAY_STARTUP_HELP_LIST_OF_MESSAGES.append("Certificates not found anywhere in {}.".format(repr(_PATHS_SSL_PEM)))
+
+
+# constants for serving
+#######################
+
+# if True, the requests are handled by a pool of threads, so that a slow request (e.g. a TLS handshake of a slow client,
+# an import or a large page) doesn't block the other ones; the pages that only display the notes are generated in
+# parallel and the requests that change anything are handled one at a time
+SERVER_CONCURRENT = False
+# number of threads handling the requests of both the HTTP and the HTTPS server
+SERVER_THREAD_POOL_SIZE = 8
+# how many seconds a thread waits for a client to send or receive data before the connection is closed
+SERVER_REQUEST_TIMEOUT = 60
+# if True, the connections are served by an asyncio event loop instead of the HTTPServers, so that many idle
+# connections (kept alive by phones) and TLS handshakes don't take any threads; the requests are handled by the pool of
+# SERVER_THREAD_POOL_SIZE threads like with SERVER_CONCURRENT
+SERVER_ASYNCIO = False
+# if True, the clients can send more requests over one connection (HTTP/1.1 keep-alive), so that a page and its CSS
+# don't need a new connection and a new TLS handshake each; only with SERVER_CONCURRENT or SERVER_ASYNCIO
+SERVER_KEEP_ALIVE = True
+# how many seconds a kept-alive connection waits for the next request before it's closed
+SERVER_KEEP_ALIVE_TIMEOUT = 15
+# the connection is closed after this many requests, the client then opens a new one
+SERVER_KEEP_ALIVE_MAX_REQUESTS = 100
+# if not None, the responses are compressed by gzip or deflate with this level (1 - fastest, 9 - smallest) for the
+# clients that accept it; the static resources (CSS) are compressed once at the start
+HTTP_COMPRESSION_LEVEL = 6
+# smaller responses are not compressed (they would hardly get any smaller)
+HTTP_COMPRESSION_MIN_SIZE = 1024
+# the web interface keeps the messages and the history of the back buttons for this many clients (browsers)
+WEB_UI_SESSION_COUNT_MAX = 64
+
+
+# constants for caches
+######################
+
+# how many parsed search expressions are kept (the least recently used ones are evicted first)
+SEARCH_QUERY_PLAN_CACHE_SIZE = 64
+# if True, the fulltext search uses an index of all 3-character substrings of the notes (built at the first search and
+# updated afterwards), which takes about 2.5 bytes of memory per character of the notes (e.g. 6 MB for 2.6 MB of notes)
+# and makes the searches of longer strings many times faster; if False, every search goes through all notes
+FULLTEXT_INDEX_ENABLED = True
+
+
+# constants for loading
+#######################
+
+# if True, tasks.dat is memory-mapped when it is loaded and the body of each task is decoded only when it is accessed
+# (e.g. displayed or searched), which makes the startup faster and takes less memory (not used on Windows)
+LAZY_BODY_LOADING = False
+
+# task store files of at least this size in bytes are parsed in parallel by several processes if the platform can fork
+# processes and no other threads have been started yet, i.e. at the startup (0 disables parallel parsing)
+PARALLEL_LOADING_MIN_SIZE = 16 * 1024 * 1024
+# number of processes that parse a file in parallel, None for the number of CPUs (nothing is parsed in parallel with 1)
+PARALLEL_LOADING_PROCESSES = None
+
+# if True, tasks_trash.dat is loaded only when the trash is used for the first time (e.g. the trash is displayed, a
+# note is deleted or notes are imported) instead of at startup
+LAZY_TRASH_LOADING = True
+
+
+# constants for saving
+######################
+
+# the journal is compacted (the full file is written and the journal emptied) once it is larger than this ratio of the
+# size of the full file and at least the minimum size in bytes
+JOURNAL_COMPACTION_RATIO = 0.5
+JOURNAL_COMPACTION_MIN_SIZE = 64 * 1024
+
+# if True, the task stores are written to the files by a background thread, so that the HTTP requests don't wait for it
+BACKGROUND_WRITER_ENABLED = False
+# how many seconds the background thread waits after a save so that more saves can be written at once
+BACKGROUND_WRITER_DELAY = 0.5
+
+# if True, every full save of a task store also writes a binary snapshot of the file, which is loaded at startup
+# instead of parsing the file as long as the file has not been changed since then
+BINARY_SNAPSHOT_ENABLED = True
+
+# if not None, tasks.dat, tasks_trash.dat and the backed up tasks are compressed by gzip with this level (1 - fastest,
+# 9 - smallest), which takes less time to write on slow storage; the files are read whether they are compressed or not,
+# so it can be changed at any time (the journals are never compressed)
+STORAGE_COMPRESSION_LEVEL = None
+
+# an old backup is deleted when there are this many newer backups of the same file and it is older than this many days
+BACKUP_KEEP_COUNT = 20
+BACKUP_KEEP_DAYS = 30
+
+# if set, the trash keeps only this many of the most recently deleted notes, the older ones are moved to the trash
+# archive once there are TRASH_ARCHIVE_BATCH more of them; the archive is never loaded by woolnote, so an archived note
+# is not known to be deleted anymore when notes are imported (it would be imported again if it is still in the import);
+# None - the trash keeps all deleted notes
+TRASH_KEEP_COUNT = None
+TRASH_ARCHIVE_BATCH = 100
+
+# deflate compression level of woolnote.zip written by the export (0 - no compression, 1 - fastest, 9 - smallest)
+EXPORT_COMPRESSION_LEVEL = 6
@@ -0,0 +1,295 @@
+# University of Illinois/NCSA Open Source License
+# Copyright (c) 2018, Jakub Svoboda.
+
+# TODO: docstring for the file
+from woolnote import systemencoding
+import argparse
+import hashlib
+import os
+import time
+from woolnote import util
+from woolnote import config
+
+MANIFEST_HEADER = "WOOLNOTE-BACKUP-MANIFEST 1"
+EXPORT_TIMESTAMP_FIELD = "\nTASK-EXPORT-LAMPORT-TIMESTAMP "
+# TaskBackupStore instances by path, so that the objects are listed only once and not before every backup
+BACKUP_STORES = {}
+
+# TaskBackupStore - deduplicated backups of task stores
+########################################################
+
+class TaskBackupStore():
+    def __init__(self, path):
+        """
+        A backup directory in which every serialized task is stored only once, in a file named by the SHA-256 hash of
+        its contents (an object). The objects don't contain the export lamport timestamps, which are set for all tasks
+        by every export, so that an export doesn't make the next backup store all tasks again; the timestamps are
+        listed in the manifests instead (see Task.content_hash()). A backup of a task store is a small manifest listing the objects of its tasks, so
+        backing up a task store writes only the tasks that have changed since any previous backup. The backup can be
+        restored into a task store file identical to the one the task store would have saved at that time. The objects
+        are compressed if STORAGE_COMPRESSION_LEVEL is set, they are named by the hash of the uncompressed task.
+
+        Args:
+            path (str): The backup directory.
+        """
+        super().__init__()
+        self.path = path
+        self.objects_path = os.path.join(path, config.BACKUP_OBJECTS_DIRECTORY)
+        self.object_hashes = None  # hashes of the objects in the directory, listed at the first backup
+
+    def object_path(self, object_hash):
+        """
+        Returns the path of the object with the given hash. The objects are spread over subdirectories by the first two
+        characters of the hash.
+
+        Args:
+            object_hash (str):
+
+        Returns:
+            str:
+        """
+        return os.path.join(self.objects_path, object_hash[:2], object_hash)
+
+    def object_hashes_list(self):
+        """
+        Returns the hashes of all objects in the backup directory. They are listed only once and then kept up to date.
+
+        Returns:
+            Set[str]:
+        """
+        if self.object_hashes is None:
+            self.object_hashes = set()
+            if os.path.isdir(self.objects_path):
+                for subdirectory in os.listdir(self.objects_path):
+                    subdirectory_path = os.path.join(self.objects_path, subdirectory)
+                    if os.path.isdir(subdirectory_path):
+                        self.object_hashes.update(name for name in os.listdir(subdirectory_path)
+                                                  if not name.endswith(config.TEMP_EXTENSION))
+        return self.object_hashes
+
+    @staticmethod
+    def task_object(task):
+        """
+        Returns the contents of the object of the task - the serialized task without its export lamport timestamp. Its
+        hash is Task.content_hash().
+
+        Args:
+            task (woolnote.task_store.Task):
+
+        Returns:
+            str:
+        """
+        serialized = task.serialize()
+        # the fields before it are single-line, so the first occurrence is the field
+        export_start = serialized.index(EXPORT_TIMESTAMP_FIELD)
+        export_end = serialized.index("\n", export_start + 1)
+        return serialized[:export_start] + serialized[export_end:]
+
+    @staticmethod
+    def task_object_restore(serialized_object, export_lamport_timestamp):
+        """
+        Returns the serialized task from the contents of its object and its export lamport timestamp, the reverse of
+        task_object().
+
+        Args:
+            serialized_object (str):
+            export_lamport_timestamp (str):
+
+        Returns:
+            str:
+        """
+        # the field follows TASK-LAMPORT-TIMESTAMP in Task.serialize()
+        lamport_start = serialized_object.index("\nTASK-LAMPORT-TIMESTAMP ")
+        lamport_end = serialized_object.index("\n", lamport_start + 1)
+        return (serialized_object[:lamport_end] + EXPORT_TIMESTAMP_FIELD + export_lamport_timestamp
+                + serialized_object[lamport_end:])
+
+    def backup(self, manifest_name, task_store):
+        """
+        Writes the objects of the tasks of the task store that are not in the backup directory yet and then the manifest
+        of the backup. Afterwards, old backups are deleted according to the retention policy, see retention_apply().
+
+        Args:
+            manifest_name (str): File name of the manifest without BACKUP_MANIFEST_EXTENSION. It has to end with "_"
+                                 and the file name of the task store, so that the retention policy is applied separately to the
+                                 backups of every task store.
+            task_store (woolnote.task_store.TaskStore):
+
+        Returns:
+            None:
+        """
+        object_hashes = self.object_hashes_list()
+        object_paths_written = []
+        manifest_lines = [MANIFEST_HEADER,
+                          "EXPORT-LAMPORT-CLOCK " + str(task_store.export_lamport_clock),
+                          "LAST-IMPORT-LAMPORT-CLOCK " + str(task_store.last_import_lamport_clock)]
+        # sorted by taskid like in TaskStore.serialize_chunks(), so that the restored file is the same
+        for taskid in sorted(task_store.store_dict_id):
+            task = task_store.store_dict_id[taskid]
+            # cached by the task until it is changed, so unchanged tasks are not hashed again
+            object_hash = task.content_hash()
+            if object_hash not in object_hashes:
+                object_path = self.object_path(object_hash)
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                util.write_file_atomically(object_path, [self.task_object(task)], sync=False,
+                                           compresslevel=config.STORAGE_COMPRESSION_LEVEL)
+                object_paths_written.append(object_path)
+                object_hashes.add(object_hash)
+            manifest_lines.append("TASK-OBJECT " + object_hash + " " + str(task.export_lamport_timestamp))
+        # the manifest is written last, so it never refers to objects which are not on the disk
+        if object_paths_written:
+            if hasattr(os, "sync"):
+                # much faster than syncing the many small files one by one
+                os.sync()
+            else:
+                for object_path in object_paths_written:
+                    with open(object_path, "rb+") as object_file:
+                        os.fsync(object_file.fileno())
+        manifest_path = os.path.join(self.path, manifest_name + config.BACKUP_MANIFEST_EXTENSION)
+        util.write_file_atomically(manifest_path, ["\n".join(manifest_lines) + "\n"])
+        self.retention_apply("_" + os.path.basename(task_store.filepath) + config.BACKUP_MANIFEST_EXTENSION)
+
+    def manifest_list(self):
+        """
+        Returns the file names of all manifests in the backup directory from the oldest to the newest.
+
+        Returns:
+            List[str]:
+        """
+        manifest_names = [name for name in os.listdir(self.path) if name.endswith(config.BACKUP_MANIFEST_EXTENSION)]
+        return sorted(manifest_names, key=lambda name: (os.path.getmtime(os.path.join(self.path, name)), name))
+
+    def manifest_read(self, manifest_name):
+        """
+        Reads the manifest with the given file name.
+
+        Args:
+            manifest_name (str):
+
+        Returns:
+            Tuple[int, int, List[str], List[str]]: export lamport clock, last import lamport clock, hashes of the
+                                                   objects, export lamport timestamps of the tasks
+        """
+        export_lamport_clock = -1
+        last_import_lamport_clock = -1
+        object_hashes = []
+        export_lamport_timestamps = []
+        with open(os.path.join(self.path, manifest_name), "r", encoding="utf-8", newline="\n") as manifest_file:
+            if manifest_file.readline().rstrip("\n") != MANIFEST_HEADER:
+                raise ValueError("{} is not a backup manifest".format(manifest_name))
+            for line in manifest_file:
+                line_split = line.rstrip("\n").split(" ", 2)
+                if line_split[0] == "TASK-OBJECT":
+                    object_hashes.append(line_split[1])
+                    export_lamport_timestamps.append(line_split[2])
+                elif line_split[0] == "EXPORT-LAMPORT-CLOCK":
+                    export_lamport_clock = int(line_split[1])
+                elif line_split[0] == "LAST-IMPORT-LAMPORT-CLOCK":
+                    last_import_lamport_clock = int(line_split[1])
+        return export_lamport_clock, last_import_lamport_clock, object_hashes, export_lamport_timestamps
+
+    def restore(self, manifest_name, path):
+        """
+        Writes the task store file of the backup with the given manifest file name to the given path. The file can be
+        loaded by TaskStore.task_store_load() or used instead of the task store's file (after woolnote is stopped).
+
+        Args:
+            manifest_name (str):
+            path (str):
+
+        Returns:
+            None:
+        """
+        export_lamport_clock, last_import_lamport_clock, object_hashes, export_lamport_timestamps = \
+            self.manifest_read(manifest_name)
+        chunks = ["EXPORT-LAMPORT-CLOCK " + str(export_lamport_clock) + "\n",
+                  "LAST-IMPORT-LAMPORT-CLOCK " + str(last_import_lamport_clock) + "\n"]
+        for object_hash, export_lamport_timestamp in zip(object_hashes, export_lamport_timestamps):
+            with util.open_text_file(self.object_path(object_hash)) as object_file:
+                serialized = object_file.read()
+            if hashlib.sha256(serialized.encode("utf-8")).hexdigest() != object_hash:
+                raise ValueError("the backed up task {} is damaged".format(object_hash))
+            chunks.append(self.task_object_restore(serialized, export_lamport_timestamp))
+            chunks.append("\n\n")
+        util.write_file_atomically(path, chunks)
+
+    def retention_apply(self, manifest_suffix):
+        """
+        Deletes the manifests ending with the given suffix (i.e. the backups of one task store) which are neither
+        among the newest BACKUP_KEEP_COUNT ones nor younger than BACKUP_KEEP_DAYS, and then the objects that are not
+        in any manifest anymore.
+
+        Args:
+            manifest_suffix (str):
+
+        Returns:
+            None:
+        """
+        manifest_names = [name for name in self.manifest_list() if name.endswith(manifest_suffix)]
+        min_mtime = time.time() - config.BACKUP_KEEP_DAYS * 24 * 60 * 60
+        manifest_names_deleted = False
+        for manifest_name in manifest_names[:max(0, len(manifest_names) - config.BACKUP_KEEP_COUNT)]:
+            manifest_path = os.path.join(self.path, manifest_name)
+            if os.path.getmtime(manifest_path) < min_mtime:
+                os.remove(manifest_path)
+                manifest_names_deleted = True
+        if manifest_names_deleted:
+            util.fsync_directory(self.path)
+            self.garbage_collect()
+
+    def garbage_collect(self):
+        """
+        Deletes the objects that are not in any manifest.
+
+        Returns:
+            None:
+        """
+        object_hashes_used = set()
+        for manifest_name in self.manifest_list():
+            object_hashes_used.update(self.manifest_read(manifest_name)[2])
+        object_hashes = self.object_hashes_list()
+        for object_hash in object_hashes - object_hashes_used:
+            os.remove(self.object_path(object_hash))
+            object_hashes.discard(object_hash)
+
+
+def backup_store_get(path):
+    """
+    Returns the backup store for the given backup directory, the same one every time.
+
+    Args:
+        path (str):
+
+    Returns:
+        woolnote.task_backup.TaskBackupStore:
+    """
+    backup_store = BACKUP_STORES.get(path)
+    if backup_store is None:
+        backup_store = TaskBackupStore(path)
+        BACKUP_STORES[path] = backup_store
+    return backup_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Woolnote backups in {}".format(config.PATH_SAVE_DB_BACKUP))
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("list", help="list the backups from the oldest to the newest")
+    parser_restore = subparsers.add_parser("restore", help="write the task store file of a backup")
+    parser_restore.add_argument("manifest", help="file name of the backup's manifest")
+    parser_restore.add_argument("path", help="where to write the task store file")
+    subparsers.add_parser("gc", help="delete the stored tasks that are not in any backup")
+    args = parser.parse_args()
+    backup_store = TaskBackupStore(config.PATH_SAVE_DB_BACKUP)
+    if args.command == "list":
+        for manifest_name in backup_store.manifest_list():
+            print(manifest_name)
+    elif args.command == "restore":
+        backup_store.restore(args.manifest, args.path)
+    elif args.command == "gc":
+        backup_store.garbage_collect()
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
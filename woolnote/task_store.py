@@ -3,30 +3,105 @@
 
 # TODO: docstring for the file
 from woolnote import systemencoding
+import array
+import bisect
+import concurrent.futures
+import hashlib
+import io
+import mmap
+import multiprocessing
 import re
 import os
+import struct
+import sys
+import threading
+import time
+import zipfile
+import zlib
 from woolnote import util
 from woolnote import config
 
 MARKUP = "MARKUP"
 PLAIN = "PLAIN"
+# characters other than "\n" at which str.splitlines() splits lines
+RE_OTHER_LINE_BOUNDARIES = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+# file operations prepared by TaskStore.task_store_save()
+FILE_OPERATION_JOURNAL_APPEND = "JOURNAL_APPEND"
+FILE_OPERATION_FULL_SAVE = "FULL_SAVE"
+FILE_OPERATION_JOURNAL_COMPACTION = "JOURNAL_COMPACTION"
+
+# characters of the serialized task store that are compressed at once by TaskStore.task_store_export_zip()
+EXPORT_BLOCK_SIZE = 1024 * 1024
+# the summary of a task store (see TaskStore.summary()) has a hash for each group of tasks whose taskids start with the
+# same characters, 2 hexadecimal characters make 256 groups
+SUMMARY_PREFIX_LENGTH = 2
+SUMMARY_HEADER = "WOOLNOTE-SUMMARY 1"
+
 # TODO: escape body of notes - prepend a space before every line, ignore unspaced lines
 
 # Task - a single task container
 ################################
 
+def hex_id_compact(hex_id):
+    """
+    Returns the 32 bytes encoded by an ID consisting of 64 [01-9A-F] symbols (see util.create_id_task()), which need
+    less than half of the memory of the string. Other strings are returned unchanged.
+
+    Args:
+        hex_id (str):
+
+    Returns:
+        Union[bytes, str]:
+    """
+    if len(hex_id) == 64:
+        try:
+            compact = bytes.fromhex(hex_id)
+        except ValueError:
+            return hex_id
+        if compact.hex().upper() == hex_id:
+            return compact
+    return hex_id
+
+
+def hex_id_expand(compact):
+    """
+    Returns the ID that has been passed to hex_id_compact().
+
+    Args:
+        compact (Union[bytes, str]):
+
+    Returns:
+        str:
+    """
+    if isinstance(compact, bytes):
+        return compact.hex().upper()
+    return compact
+
+
+# the same combination of tags is shared by all tasks that have it
+FROZEN_TAG_SETS = {}
+
+
 class Task():
     # TODO: add more fields
 
+    # There are many tasks and their fields take less memory without the per-instance dict. The strings that are often
+    # the same in many tasks are interned, so that the tasks share them.
+    __slots__ = ("name", "folder", "tags", "body_source", "taskid", "bodydelimiter_compact", "lamport_timestamp",
+                 "export_lamport_timestamp", "created_date", "changed_date", "due_date", "due_date_reminder_dismissed",
+                 "body_format", "public_share_auth_compact", "content_hash_cache")
+    INTERNED_FIELDS = frozenset(("folder", "created_date", "changed_date", "due_date", "body_format"))
+
     def __init__(self):
         """
-        Creates a new empty task with default properties.
+        Creates a new empty task with default properties. Its content hash is cached until any of its fields is set
+        again, so the fields cannot be changed in place - the tags are a frozenset and have to be replaced by a new set.
         """
         super().__init__()
         curr_date = util.current_timestamp()
         self.name = ""
         self.folder = ""
-        self.tags = set()
+        self.tags = frozenset()
         self.body = ""
         self.taskid = util.create_id_task()
         self.bodydelimiter = util.create_id_task()
@@ -39,6 +114,46 @@ class Task():
         self.body_format = MARKUP
         self.public_share_auth = util.create_id_task()
 
+    def __setattr__(self, name, value):
+        if name in Task.INTERNED_FIELDS:
+            value = sys.intern(value)
+        elif name == "tags":
+            value = frozenset(sys.intern(tag) for tag in value)
+            value = FROZEN_TAG_SETS.setdefault(value, value)
+        object.__setattr__(self, name, value)
+        # the export lamport timestamp is not a part of the content hash
+        if name != "export_lamport_timestamp":
+            object.__setattr__(self, "content_hash_cache", None)
+
+    @property
+    def body(self):
+        body = self.body_source
+        if body.__class__ is MappedTaskBody:
+            # decoded at every access and not kept in the task, so that going through all tasks (e.g. searching,
+            # saving or backing them up) doesn't load all bodies into memory
+            return body.decode()
+        return body
+
+    @body.setter
+    def body(self, value):
+        self.body_source = value
+
+    @property
+    def bodydelimiter(self):
+        return hex_id_expand(self.bodydelimiter_compact)
+
+    @bodydelimiter.setter
+    def bodydelimiter(self, value):
+        self.bodydelimiter_compact = hex_id_compact(value)
+
+    @property
+    def public_share_auth(self):
+        return hex_id_expand(self.public_share_auth_compact)
+
+    @public_share_auth.setter
+    def public_share_auth(self, value):
+        self.public_share_auth_compact = hex_id_compact(value)
+
     def serialize(self):
         """
         Creates a textual representation of the task so that it can be saved and loaded later.
@@ -74,6 +189,25 @@ class Task():
         output_string = "\n".join(output)
         return output_string
 
+    def content_hash(self):
+        """
+        Returns the SHA-256 hash of the serialized task without its export lamport timestamp, which is set for all tasks
+        by every export. Two tasks have the same hash exactly if they differ at most in the export lamport timestamp.
+        The result is cached until a field of the task other than the export lamport timestamp is set.
+
+        Returns:
+            str: hexadecimal hash
+        """
+        if self.content_hash_cache is None:
+            serialized = self.serialize()
+            # the fields before it are single-line, so the first occurrence is the field
+            export_start = serialized.index("\nTASK-EXPORT-LAMPORT-TIMESTAMP ")
+            export_end = serialized.index("\n", export_start + 1)
+            content_hash = hashlib.sha256(serialized[:export_start].encode("utf-8"))
+            content_hash.update(serialized[export_end:].encode("utf-8"))
+            object.__setattr__(self, "content_hash_cache", content_hash.hexdigest())
+        return self.content_hash_cache
+
     def deserialize(self, input_string):
         """
         Reads the input_string into self as a transaction. Returns True on success,
@@ -85,102 +219,13 @@ class Task():
         Returns:
             bool: Whether successful & self changed or unsuccessful & self unchanged.
         """
-        tmp_task = Task()
-        parse_state_id_known = False
-        parse_state_name_known = False
-        parse_state_folder_known = False
-        parse_state_tags_known = False
-
-        parse_state_lamport_known = False
-        parse_state_export_lamport_known = False
-        parse_state_created_known = False
-        parse_state_changed_known = False
-        parse_state_due_known = False
-        parse_state_due_rem_known = False
-        parse_state_bodyformat_known = False
-        parse_state_publicshareauth_known = False
-
-        parse_state_inside_body = False
-        parse_state_body_known = False
-        parse_state_body = []
-        parse_state_body_id_end_delimiter = ""
-
-        # Some conditions may be duplicate for better readability
+        parser = TaskLineParser()
         for line in input_string.splitlines():
-            line = line.rstrip("\n")
-            line_split = line.split(" ")
-            if not parse_state_inside_body:
-                if not parse_state_id_known:
-                    if line_split[0] == "TASK-ID":
-                        tmp_task.taskid = line_split[1]
-                        parse_state_id_known = True
-                if not parse_state_name_known:
-                    if line_split[0] == "TASK-NAME":
-                        tmp_task.name = " ".join(line_split[1:])
-                        parse_state_name_known = True
-                if not parse_state_folder_known:
-                    if line_split[0] == "TASK-FOLDER":
-                        tmp_task.folder = " ".join(line_split[1:])
-                        parse_state_folder_known = True
-
-                if not parse_state_lamport_known:
-                    if line_split[0] == "TASK-LAMPORT-TIMESTAMP":
-                        tmp_task.lamport_timestamp = int(line_split[1])
-                        parse_state_lamport_known = True
-                if not parse_state_export_lamport_known:
-                    if line_split[0] == "TASK-EXPORT-LAMPORT-TIMESTAMP":
-                        tmp_task.export_lamport_timestamp = int(line_split[1])
-                        parse_state_export_lamport_known = True
-                if not parse_state_created_known:
-                    if line_split[0] == "TASK-CREATED-DATE":
-                        tmp_task.created_date = " ".join(line_split[1:])
-                        parse_state_created_known = True
-                if not parse_state_changed_known:
-                    if line_split[0] == "TASK-CHANGED-DATE":
-                        tmp_task.changed_date = " ".join(line_split[1:])
-                        parse_state_changed_known = True
-                if not parse_state_due_rem_known:
-                    if line_split[0] == "TASK-DUE-DATE-REMINDER-DISMISSED":
-                        tmp_task.due_date_reminder_dismissed = (line_split[1] == "True")
-                        parse_state_due_rem_known = True
-                if not parse_state_due_known:
-                    if line_split[0] == "TASK-DUE-DATE":
-                        tmp_task.due_date = " ".join(line_split[1:])
-                        parse_state_due_known = True
-                if not parse_state_bodyformat_known:
-                    if line_split[0] == "TASK-BODY-FORMAT":
-                        tmp_task.body_format = line_split[1]
-                        parse_state_bodyformat_known = True
-                if not parse_state_publicshareauth_known:
-                    if line_split[0] == "TASK-PUBLIC-SHARE-AUTH":
-                        tmp_task.public_share_auth = line_split[1]
-                        parse_state_publicshareauth_known = True
-
-                if not parse_state_tags_known:
-                    if line_split[0] == "TASK-TAGS":
-                        tags = " ".join(line_split[1:])
-                        tags2 = {x.strip() for x in tags.split(",")}
-                        tags3 = []
-                        for tag in tags2:
-                            if tag != "":
-                                tags3.append(tag)
-                        tmp_task.tags = set(sorted(tags3))
-                        parse_state_tags_known = True
-                if not parse_state_body_known:
-                    if line_split[0] == "TASK-BODY-BEGIN":
-                        parse_state_body_id_end_delimiter = line_split[1]
-                        tmp_task.bodydelimiter = parse_state_body_id_end_delimiter
-                        parse_state_inside_body = True
-            elif parse_state_inside_body:
-                if line_split[0] == "TASK-BODY-END" and line_split[1] == parse_state_body_id_end_delimiter:
-                    parse_state_inside_body = False
-                    tmp_task.body = "\n".join(parse_state_body)
-                    parse_state_body_known = True
-                else:
-                    parse_state_body.append(line)
+            parser.parse_line(line)
 
         # start modifying self only after everything is parsed and potential errors or exceptions are the past
-        if parse_state_id_known and parse_state_name_known and not parse_state_inside_body and parse_state_body_known:
+        if parser.is_complete():
+            tmp_task = parser.task
             self.taskid = tmp_task.taskid
             self.name = tmp_task.name
             self.folder = tmp_task.folder
@@ -197,38 +242,1102 @@ class Task():
             self.body_format = tmp_task.body_format
             self.public_share_auth = tmp_task.public_share_auth
 
-            return True
+            return True
+
+        return False
+
+
+# MappedTaskStoreFileLines - the lines of a memory-mapped task store file with bodies that can be skipped
+#########################################################################################################
+
+# the characters of RE_OTHER_LINE_BOUNDARIES encoded in UTF-8 (searched for one by one, which is much faster than
+# a regular expression on bytes)
+OTHER_LINE_BOUNDARIES_UTF8 = tuple(character.encode("utf-8") for character in "\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+class MappedTaskBody():
+    __slots__ = ("mapped_file", "start", "end")
+
+    def __init__(self, mapped_file, start, end):
+        """
+        The body of a task that is still in the memory-mapped task store file, so that it doesn't take any memory
+        until it is accessed. See Task.body.
+
+        Args:
+            mapped_file (mmap.mmap):
+            start (int): position of the first byte of the body
+            end (int): position after the last byte of the body
+        """
+        super().__init__()
+        self.mapped_file = mapped_file
+        self.start = start
+        self.end = end
+
+    def decode(self):
+        """
+        Returns the body. Invalid UTF-8 (which would have failed the loading of the file if the body was not skipped)
+        is replaced.
+
+        Returns:
+            str:
+        """
+        return self.mapped_file[self.start:self.end].decode("utf-8", errors="replace")
+
+
+class MappedTaskStoreFileLines():
+
+    def __init__(self, mapped_file):
+        """
+        Iterates over the lines of a memory-mapped task store file like over the lines of the file opened in text
+        mode. TaskStore.deserialize_lines() uses skip_body() to skip the lines of the bodies.
+
+        Args:
+            mapped_file (mmap.mmap):
+        """
+        super().__init__()
+        self.mapped_file = mapped_file
+        self.line_start = 0  # position of the line returned last
+
+    def __iter__(self):
+        tell = self.mapped_file.tell
+        readline = self.mapped_file.readline
+        while True:
+            self.line_start = tell()
+            line = readline()
+            if not line:
+                return
+            yield line.decode("utf-8")
+
+    def skip_body(self, body_end_delimiter):
+        """
+        Skips the body which begins with the line returned last and continues with its TASK-BODY-END line. The body is
+        skipped only if its lines would be read as the body without any special handling - if none of them begins
+        with "TASK-" or contains other line boundaries than "\n".
+
+        Args:
+            body_end_delimiter (str): the delimiter from the TASK-BODY-BEGIN line
+
+        Returns:
+            Union[MappedTaskBody, None]: The skipped body or None if the body has not been skipped.
+        """
+        mapped_file = self.mapped_file
+        body_start = self.line_start
+        body_end_line = b"\nTASK-BODY-END " + body_end_delimiter.encode("utf-8")
+        if not body_end_delimiter or body_start == 0:
+            return None
+        # the "\n" before the TASK-BODY-END line, which is the end of the TASK-BODY-BEGIN line if the body is empty
+        body_end_line_found = mapped_file.find(body_end_line, body_start - 1)
+        if body_end_line_found == -1:
+            return None
+        after_delimiter = body_end_line_found + len(body_end_line)
+        if after_delimiter < len(mapped_file) and mapped_file[after_delimiter:after_delimiter + 1] not in (b" ", b"\n"):
+            return None
+        body_end = max(body_end_line_found, body_start)
+        if mapped_file.find(b"TASK-", body_start, body_end) != -1:
+            return None
+        for other_line_boundary in OTHER_LINE_BOUNDARIES_UTF8:
+            if mapped_file.find(other_line_boundary, body_start, body_end) != -1:
+                return None
+        mapped_file.seek(body_end_line_found + 1)
+        return MappedTaskBody(mapped_file, body_start, body_end)
+
+
+# TaskLineParser - a state machine that parses the lines of one serialized task
+###############################################################################
+
+class TaskLineParser():
+
+    def __init__(self):
+        """
+        Creates a parser that reads the lines of one serialized task (as written by Task.serialize()) one by one into
+        a new task. Each property is read only from its first occurrence. The lines are expected without line
+        terminators.
+        """
+        super().__init__()
+        self.task = Task()
+        self.properties_known = set()  # first words of the lines that have already been read
+        self.inside_body = False
+        self.body_known = False
+        self.body_lines = []
+        self.body_mapped = None  # MappedTaskBody if the lines of the body have been skipped
+        self.body_end_delimiter = ""
+
+    def parse_line(self, line, first_word=None):
+        """
+        Reads one line of the serialized task.
+
+        Args:
+            line (str):
+            first_word (Union[None, str]): the part of the line before the first space if the caller knows it already
+
+        Returns:
+            None:
+        """
+        if self.inside_body:
+            if line.startswith("TASK-BODY-END"):
+                line_split = line.split(" ", 2)
+                if line_split[0] == "TASK-BODY-END" and line_split[1] == self.body_end_delimiter:
+                    self.inside_body = False
+                    if self.body_mapped is not None:
+                        self.task.body = self.body_mapped
+                    else:
+                        self.task.body = "\n".join(self.body_lines)
+                    self.body_known = True
+                    return
+            self.body_lines.append(line)
+            return
+        if first_word is None:
+            first_word = line.split(" ", 1)[0]
+        property_parser = self.PROPERTY_PARSERS.get(first_word)
+        if property_parser is not None and first_word not in self.properties_known:
+            property_parser(self, line)
+            self.properties_known.add(first_word)
+
+    def is_complete(self):
+        """
+        Returns whether all the lines of a valid task have been read.
+
+        Returns:
+            bool:
+        """
+        return ("TASK-ID" in self.properties_known and "TASK-NAME" in self.properties_known and
+                not self.inside_body and self.body_known)
+
+    # The property parsers read the property from the whole line. "TASK-NAME" and the like take the rest of the line
+    # after the first space, "TASK-ID" and the like take only the second word.
+
+    def parse_id(self, line):
+        self.task.taskid = line.split(" ", 2)[1]
+
+    def parse_name(self, line):
+        self.task.name = line.partition(" ")[2]
+
+    def parse_folder(self, line):
+        self.task.folder = line.partition(" ")[2]
+
+    def parse_lamport_timestamp(self, line):
+        self.task.lamport_timestamp = int(line.split(" ", 2)[1])
+
+    def parse_export_lamport_timestamp(self, line):
+        self.task.export_lamport_timestamp = int(line.split(" ", 2)[1])
+
+    def parse_created_date(self, line):
+        self.task.created_date = line.partition(" ")[2]
+
+    def parse_changed_date(self, line):
+        self.task.changed_date = line.partition(" ")[2]
+
+    def parse_due_date(self, line):
+        self.task.due_date = line.partition(" ")[2]
+
+    def parse_due_date_reminder_dismissed(self, line):
+        self.task.due_date_reminder_dismissed = (line.split(" ", 2)[1] == "True")
+
+    def parse_body_format(self, line):
+        self.task.body_format = line.split(" ", 2)[1]
+
+    def parse_public_share_auth(self, line):
+        self.task.public_share_auth = line.split(" ", 2)[1]
+
+    def parse_tags(self, line):
+        tags = {x.strip() for x in line.partition(" ")[2].split(",")}
+        tags.discard("")
+        self.task.tags = tags
+
+    def parse_body_begin(self, line):
+        self.body_end_delimiter = line.split(" ", 2)[1]
+        self.task.bodydelimiter = self.body_end_delimiter
+        self.inside_body = True
+
+    PROPERTY_PARSERS = {
+        "TASK-ID": parse_id,
+        "TASK-NAME": parse_name,
+        "TASK-FOLDER": parse_folder,
+        "TASK-LAMPORT-TIMESTAMP": parse_lamport_timestamp,
+        "TASK-EXPORT-LAMPORT-TIMESTAMP": parse_export_lamport_timestamp,
+        "TASK-CREATED-DATE": parse_created_date,
+        "TASK-CHANGED-DATE": parse_changed_date,
+        "TASK-DUE-DATE": parse_due_date,
+        "TASK-DUE-DATE-REMINDER-DISMISSED": parse_due_date_reminder_dismissed,
+        "TASK-BODY-FORMAT": parse_body_format,
+        "TASK-PUBLIC-SHARE-AUTH": parse_public_share_auth,
+        "TASK-TAGS": parse_tags,
+        "TASK-BODY-BEGIN": parse_body_begin,
+    }
+
+
+# FulltextIndex - an inverted n-gram index over the searchable fields of tasks
+##############################################################################
+
+class FulltextIndex():
+    # length of the indexed substrings; search strings shorter than that are answered by scanning the tasks
+    NGRAM_LEN = 3
+
+    def __init__(self):
+        """
+        Creates an empty inverted index mapping every n-gram of the lowercased searchable fields of the indexed tasks
+        to the tasks whose fields contain it. The index is used to narrow down the candidates for case-insensitive
+        substring search; the candidates are then verified against the fields of the tasks themselves so that the
+        results are exactly the same as with a plain linear scan.
+
+        Every indexed version of a task gets a new document number and the postings are arrays of the document
+        numbers (4 bytes per n-gram of a task). Reindexing or removing a task only forgets its previous document
+        number, the stale entries in the postings are skipped by searches and removed by compact() once there are
+        more forgotten document numbers than indexed tasks.
+        """
+        super().__init__()
+        self.ngram_to_docnums = {}
+        self.docnum_to_taskid = {}
+        self.taskid_to_docnum = {}
+        self.docnum_next = 0
+
+    @staticmethod
+    def task_contains(task, search_text):
+        """
+        Returns whether any of the fields of the task searched by TaskStore.filter_search() contains the text.
+
+        Args:
+            task (woolnote.task_store.Task):
+            search_text (str): lowercased text
+
+        Returns:
+            bool:
+        """
+        # the name first, it is the shortest field that is likely to contain the text
+        return (search_text in task.name.lower() or search_text in task.body.lower()
+                or search_text in task.taskid.lower() or search_text in task.due_date.lower()
+                or search_text in task.created_date.lower() or search_text in task.changed_date.lower())
+
+    @staticmethod
+    def searchable_fields(task):
+        """
+        Returns the lowercased fields of the task that are searched by TaskStore.filter_search().
+
+        Args:
+            task (woolnote.task_store.Task):
+
+        Returns:
+            Tuple[str, ...]: lowercased name, body, taskid, due date, created date, changed date
+        """
+        return (task.name.lower(), task.body.lower(), task.taskid.lower(), task.due_date.lower(),
+                task.created_date.lower(), task.changed_date.lower())
+
+    def ngrams(self, fields):
+        """
+        Returns the set of all n-grams of the given strings. N-grams never span two strings.
+
+        Args:
+            fields (Iterable[str]):
+
+        Returns:
+            Set[str]:
+        """
+        n = self.NGRAM_LEN
+        ngram_set = set()
+        for field in fields:
+            ngram_set.update(field[i:i + n] for i in range(len(field) - n + 1))
+        return ngram_set
+
+    def index_task(self, taskid, task):
+        """
+        Adds the task to the index or replaces its previously indexed version.
+
+        Args:
+            taskid (str): The key under which the task is stored in the task store.
+            task (woolnote.task_store.Task):
+
+        Returns:
+            None:
+        """
+        self.unindex_taskid(taskid)
+        docnum = self.docnum_next
+        self.docnum_next += 1
+        self.docnum_to_taskid[docnum] = taskid
+        self.taskid_to_docnum[taskid] = docnum
+        for ngram in self.ngrams(self.searchable_fields(task)):
+            posting = self.ngram_to_docnums.get(ngram)
+            if posting is None:
+                self.ngram_to_docnums[ngram] = array.array("I", (docnum,))
+            else:
+                # the document numbers only grow, so the postings stay sorted
+                posting.append(docnum)
+
+    def unindex_taskid(self, taskid):
+        """
+        Removes the task from the index. Does nothing if the task is not indexed.
+
+        Args:
+            taskid (str):
+
+        Returns:
+            None:
+        """
+        docnum = self.taskid_to_docnum.pop(taskid, None)
+        if docnum is None:
+            return
+        del self.docnum_to_taskid[docnum]
+        if self.docnum_next - len(self.docnum_to_taskid) > max(len(self.docnum_to_taskid), 1000):
+            self.compact()
+
+    def compact(self):
+        """
+        Removes the document numbers of the reindexed and removed tasks from the postings.
+
+        Returns:
+            None:
+        """
+        docnum_to_taskid = self.docnum_to_taskid
+        for ngram in list(self.ngram_to_docnums):
+            posting = array.array("I", (docnum for docnum in self.ngram_to_docnums[ngram] if docnum in docnum_to_taskid))
+            if posting:
+                self.ngram_to_docnums[ngram] = posting
+            else:
+                del self.ngram_to_docnums[ngram]
+        # only the forgotten document numbers are counted in unindex_taskid()
+        self.docnum_next = len(docnum_to_taskid)
+        self.docnum_to_taskid = {}
+        self.taskid_to_docnum = {}
+        docnum_renumbered = {}
+        for docnum_new, docnum in enumerate(sorted(docnum_to_taskid)):
+            docnum_renumbered[docnum] = docnum_new
+            self.docnum_to_taskid[docnum_new] = docnum_to_taskid[docnum]
+            self.taskid_to_docnum[docnum_to_taskid[docnum]] = docnum_new
+        for ngram, posting in self.ngram_to_docnums.items():
+            self.ngram_to_docnums[ngram] = array.array("I", (docnum_renumbered[docnum] for docnum in posting))
+
+    def search(self, search_text, store_dict_id):
+        """
+        Returns the set of indexed taskids which contain the specified text in any of their searchable fields.
+        Search is case-insensitive.
+
+        Args:
+            search_text (str):
+            store_dict_id (Dict[str, woolnote.task_store.Task]): The indexed tasks by taskid.
+
+        Returns:
+            Set[str]: taskids matching the searched text (unordered)
+        """
+        search_text = search_text.lower()
+        if len(search_text) < self.NGRAM_LEN:
+            candidates = self.taskid_to_docnum.keys()
+        else:
+            postings = []
+            for ngram in self.ngrams((search_text,)):
+                posting = self.ngram_to_docnums.get(ngram)
+                if posting is None:
+                    return set()
+                postings.append(posting)
+            postings.sort(key=len)
+            docnums = set(postings[0]).intersection(*postings[1:])
+            docnum_to_taskid = self.docnum_to_taskid
+            candidates = [docnum_to_taskid[docnum] for docnum in docnums if docnum in docnum_to_taskid]
+            if len(search_text) == self.NGRAM_LEN:
+                # the n-grams never span two fields, so the tasks whose fields contain it are exactly the candidates
+                return set(candidates)
+        found = set()
+        for taskid in candidates:
+            task = store_dict_id[taskid]
+            # like task_contains(), inlined because there can be a candidate for every task
+            if (search_text in task.name.lower() or search_text in task.body.lower()
+                    or search_text in task.taskid.lower() or search_text in task.due_date.lower()
+                    or search_text in task.created_date.lower() or search_text in task.changed_date.lower()):
+                found.add(taskid)
+        return found
+
+
+# FolderTagIndex - folder and tag lookup tables
+###############################################
+
+class FolderTagIndex():
+
+    def __init__(self):
+        """
+        Creates empty lookup tables from lowercased folder and tag names to the sets of taskids having them, and
+        reference counts of the folder and tag names as they are written in the tasks (so that the lists of existing
+        folders and tags don't have to be collected from all tasks).
+        """
+        super().__init__()
+        self.folder_to_taskids = {}
+        self.tag_to_taskids = {}
+        self.folder_name_refcount = {}
+        self.tag_name_refcount = {}
+        # the indexed folder and tags of every task, so that the task can be unindexed after it has been changed
+        self.taskid_to_folder_tags = {}
+
+    @staticmethod
+    def _refcount_add(refcount_dict, name):
+        refcount_dict[name] = refcount_dict.get(name, 0) + 1
+
+    @staticmethod
+    def _refcount_discard(refcount_dict, name):
+        count = refcount_dict[name] - 1
+        if count:
+            refcount_dict[name] = count
+        else:
+            del refcount_dict[name]
+
+    @staticmethod
+    def _lookup_add(lookup_dict, key, taskid):
+        taskids = lookup_dict.get(key)
+        if taskids is None:
+            lookup_dict[key] = {taskid}
+        else:
+            taskids.add(taskid)
+
+    @staticmethod
+    def _lookup_discard(lookup_dict, key, taskid):
+        taskids = lookup_dict[key]
+        taskids.discard(taskid)
+        if not taskids:
+            del lookup_dict[key]
+
+    def index_task(self, taskid, task):
+        """
+        Adds the task to the lookup tables or replaces its previously indexed version.
+
+        Args:
+            taskid (str): The key under which the task is stored in the task store.
+            task (woolnote.task_store.Task):
+
+        Returns:
+            None:
+        """
+        self.unindex_taskid(taskid)
+        folder = task.folder
+        tags = frozenset(task.tags)
+        self.taskid_to_folder_tags[taskid] = (folder, tags)
+        self._lookup_add(self.folder_to_taskids, folder.lower(), taskid)
+        if folder:
+            self._refcount_add(self.folder_name_refcount, folder)
+        for tag_lower in {tag.lower() for tag in tags}:
+            self._lookup_add(self.tag_to_taskids, tag_lower, taskid)
+        for tag in tags:
+            if tag:
+                self._refcount_add(self.tag_name_refcount, tag)
+
+    def unindex_taskid(self, taskid):
+        """
+        Removes the task from the lookup tables. Does nothing if the task is not indexed.
+
+        Args:
+            taskid (str):
+
+        Returns:
+            None:
+        """
+        folder_tags = self.taskid_to_folder_tags.pop(taskid, None)
+        if folder_tags is None:
+            return
+        folder, tags = folder_tags
+        self._lookup_discard(self.folder_to_taskids, folder.lower(), taskid)
+        if folder:
+            self._refcount_discard(self.folder_name_refcount, folder)
+        for tag_lower in {tag.lower() for tag in tags}:
+            self._lookup_discard(self.tag_to_taskids, tag_lower, taskid)
+        for tag in tags:
+            if tag:
+                self._refcount_discard(self.tag_name_refcount, tag)
+
+    def taskids_in_folder(self, folder):
+        """
+        Returns the set of taskids whose folder is the specified one (case-insensitive). Don't modify the set.
+
+        Args:
+            folder (str):
+
+        Returns:
+            Set[str]:
+        """
+        return self.folder_to_taskids.get(folder.lower(), set())
+
+    def taskids_with_tag(self, tag):
+        """
+        Returns the set of taskids having the specified tag (case-insensitive). Don't modify the set.
+
+        Args:
+            tag (str):
+
+        Returns:
+            Set[str]:
+        """
+        return self.tag_to_taskids.get(tag.lower(), set())
+
+
+# LamportOrderedTaskids - taskids kept sorted by descending lamport clock
+#########################################################################
+
+class LamportOrderedTaskids():
+    # blocks are split when they grow over twice this size
+    BLOCK_LOAD = 256
+
+    def __init__(self):
+        """
+        Creates an empty sorted container of taskids ordered by descending lamport timestamp and, for equal
+        timestamps, by the order in which the taskids have been added (which is also the order of the task store's
+        dict). The keys are kept in a list of sorted blocks, so that adding or removing a taskid costs a binary search
+        plus shifting a single block instead of sorting all taskids again.
+        """
+        super().__init__()
+        self.blocks = []  # list of sorted lists of keys (-lamport, insertion order, taskid)
+        self.block_maxes = []  # the last key of every block, for bisecting
+        self.taskid_to_key = {}
+        self.insertion_order_next = 0
+
+    def __len__(self):
+        return len(self.taskid_to_key)
+
+    def __contains__(self, taskid):
+        return taskid in self.taskid_to_key
+
+    def __iter__(self):
+        """
+        Iterates over the taskids in descending lamport order. The container must not be changed during iteration.
+        """
+        for block in self.blocks:
+            for key in block:
+                yield key[2]
+
+    def add(self, taskid, lamport_timestamp):
+        """
+        Adds the taskid or moves it to the right position if it is already present. A taskid that is already present
+        keeps its insertion order, just like overwriting a key in a dict keeps its position.
+
+        Args:
+            taskid (str):
+            lamport_timestamp (int): the lamport timestamp of the task
+
+        Returns:
+            None:
+        """
+        old_key = self.taskid_to_key.get(taskid)
+        if old_key is None:
+            insertion_order = self.insertion_order_next
+            self.insertion_order_next += 1
+        else:
+            insertion_order = old_key[1]
+            self.discard(taskid)
+        key = (-lamport_timestamp, insertion_order, taskid)
+        self.taskid_to_key[taskid] = key
+        if not self.blocks:
+            self.blocks.append([key])
+            self.block_maxes.append(key)
+            return
+        i = bisect.bisect_left(self.block_maxes, key)
+        if i == len(self.block_maxes):
+            i -= 1
+        block = self.blocks[i]
+        bisect.insort(block, key)
+        self.block_maxes[i] = block[-1]
+        if len(block) > 2 * self.BLOCK_LOAD:
+            self.blocks[i:i + 1] = [block[:self.BLOCK_LOAD], block[self.BLOCK_LOAD:]]
+            self.block_maxes[i:i + 1] = [block[self.BLOCK_LOAD - 1], block[-1]]
+
+    def discard(self, taskid):
+        """
+        Removes the taskid. Does nothing if it is not present.
+
+        Args:
+            taskid (str):
+
+        Returns:
+            None:
+        """
+        key = self.taskid_to_key.pop(taskid, None)
+        if key is None:
+            return
+        i = bisect.bisect_left(self.block_maxes, key)
+        block = self.blocks[i]
+        del block[bisect.bisect_left(block, key)]
+        if block:
+            self.block_maxes[i] = block[-1]
+        else:
+            del self.blocks[i]
+            del self.block_maxes[i]
+
+    def sort_key(self, taskid):
+        """
+        Returns the sort key of the taskid; sorting taskids by it gives the same order as iterating the container.
+
+        Args:
+            taskid (str):
+
+        Returns:
+            Tuple[int, int, str]:
+        """
+        return self.taskid_to_key[taskid]
+
+
+# TaskStoreSnapshot - a binary copy of the main file of a task store that is loaded without parsing
+##################################################################################################
+
+class TaskStoreSnapshot():
+    MAGIC = b"WOOLNOTE-SNAPSHOT"
+    VERSION = 1
+    # magic, version, size, modification time and inode of the main file, export lamport clock, last import lamport
+    # clock, number of tasks
+    HEADER = struct.Struct("<17sIQQQqqI")
+    # every string is prefixed with its length in bytes
+    LENGTH = struct.Struct("<I")
+    # lamport timestamp and offset of the task's record in the file; follows the taskid in the table of tasks
+    TABLE_ENTRY = struct.Struct("<qQ")
+    # export lamport timestamp, due date reminder dismissed; followed by the strings and the tags in the record
+    RECORD = struct.Struct("<qB")
+    RECORD_STRING_FIELDS = ("name", "folder", "created_date", "changed_date", "due_date", "body_format",
+                            "public_share_auth", "bodydelimiter", "body")
+    CHECKSUM = struct.Struct("<I")
+
+    def __init__(self, path):
+        """
+        The snapshot of the main file of a task store at the given path. The snapshot contains the same tasks as the
+        main file in a binary format - a header with the identity of the main file (so that a main file which has been
+        changed since the snapshot was written is recognized), a table of the taskids, their lamport timestamps and the
+        offsets of the records with the other fields of the tasks, the records and a checksum of all of it. The main
+        file stays the authoritative copy, the snapshot only makes loading it faster.
+
+        Args:
+            path (str): Path of the main file.
+        """
+        super().__init__()
+        self.path = path
+        self.snapshot_path = path + config.SNAPSHOT_EXTENSION
+
+    @staticmethod
+    def main_file_identity(path):
+        """
+        Returns the size, the modification time and the inode of the file at the given path. A file written by
+        util.write_file_atomically() always gets a new inode.
+
+        Args:
+            path (str):
+
+        Returns:
+            Tuple[int, int, int]:
+        """
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+    @staticmethod
+    def task_fields(task):
+        """
+        Returns the fields of the task to be written to the snapshot, or None if reading the task from the main file
+        wouldn't give the same fields (e.g. if the name contains a line break or the body contains a line that would end
+        it), because the snapshot must give exactly the same tasks as the main file. Task.serialize() has to be called
+        first.
+
+        Args:
+            task (woolnote.task_store.Task):
+
+        Returns:
+            Union[tuple, None]: taskid, lamport timestamp, export lamport timestamp, due date reminder dismissed, the
+                                fields in RECORD_STRING_FIELDS and the sorted tags
+        """
+        s = util.sanitize_singleline_string_for_tasksave
+        for field in (task.name, task.folder, task.created_date, task.changed_date, task.due_date):
+            if s(field) != field:
+                return None
+        # the fields that are read only up to the first space
+        for field in (task.taskid, task.body_format, task.public_share_auth, task.bodydelimiter):
+            if s(field) != field or " " in field:
+                return None
+        for tag in task.tags:
+            if s(tag) != tag or not tag or "," in tag:
+                return None
+        body = task.body
+        if (RE_OTHER_LINE_BOUNDARIES.search(body) is not None or "TASK-BODY-END " + task.bodydelimiter in body
+                or "TASK-END " + task.taskid in body):
+            return None
+        return (task.taskid, int(task.lamport_timestamp), int(task.export_lamport_timestamp),
+                str(task.due_date_reminder_dismissed) == "True", task.name, task.folder, task.created_date,
+                task.changed_date, task.due_date, task.body_format, task.public_share_auth, task.bodydelimiter, body,
+                sorted(task.tags))
+
+    def write(self, export_lamport_clock, last_import_lamport_clock, task_fields_list):
+        """
+        Atomically replaces the snapshot with one of the main file as it is now. Doesn't access any task store, so it
+        can run in a background thread.
+
+        Args:
+            export_lamport_clock (int):
+            last_import_lamport_clock (int):
+            task_fields_list (List[tuple]): task_fields() of all tasks in the main file in the same order.
+
+        Returns:
+            None:
+        """
+        length_pack = self.LENGTH.pack
+        table_chunks = []
+        record_chunks = []
+        record_offset = 0  # relative to the end of the table, so that the table can be written first
+        for task_fields in task_fields_list:
+            taskid = task_fields[0].encode("utf-8")
+            table_chunks.append(length_pack(len(taskid)) + taskid + self.TABLE_ENTRY.pack(task_fields[1], record_offset))
+            record = [self.RECORD.pack(task_fields[2], task_fields[3])]
+            for field in task_fields[4:13]:
+                field = field.encode("utf-8")
+                record.append(length_pack(len(field)))
+                record.append(field)
+            tags = task_fields[13]
+            record.append(length_pack(len(tags)))
+            for tag in tags:
+                tag = tag.encode("utf-8")
+                record.append(length_pack(len(tag)))
+                record.append(tag)
+            record = b"".join(record)
+            record_chunks.append(record)
+            record_offset += len(record)
+        main_file_size, main_file_mtime, main_file_inode = self.main_file_identity(self.path)
+        chunks = [self.HEADER.pack(self.MAGIC, self.VERSION, main_file_size, main_file_mtime, main_file_inode,
+                                   export_lamport_clock, last_import_lamport_clock, len(table_chunks))]
+        chunks.extend(table_chunks)
+        chunks.extend(record_chunks)
+        checksum = 0
+        for chunk in chunks:
+            checksum = zlib.crc32(chunk, checksum)
+        chunks.append(self.CHECKSUM.pack(checksum))
+        util.write_file_atomically(self.snapshot_path, chunks, binary=True)
+
+    def read(self, mapped):
+        """
+        Reads the tasks from the snapshot. Returns None if there is no snapshot, if it is damaged or of another version,
+        or if the main file has been changed since the snapshot was written - the main file has to be parsed then.
+
+        Args:
+            mapped (bool): Memory-map the snapshot and decode the bodies only when they are accessed (see Task.body).
+
+        Returns:
+            Union[Tuple[int, int, List[woolnote.task_store.Task]], None]: export lamport clock, last import lamport
+                                                                          clock, tasks in the order of the main file
+        """
+        try:
+            with open(self.snapshot_path, "rb") as snapshot_file:
+                if mapped:
+                    data = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    data = snapshot_file.read()
+            main_file_identity = self.main_file_identity(self.path)
+        except (OSError, ValueError):
+            # no snapshot or an empty one (which cannot be mapped)
+            return None
+        try:
+            return self.read_data(data, main_file_identity, mapped)
+        except (struct.error, UnicodeDecodeError, ValueError) as exc:
+            util.dbgprint("TaskStoreSnapshot: cannot read {}: {}".format(self.snapshot_path, repr(exc)))
+            return None
+
+    def read_data(self, data, main_file_identity, mapped):
+        """
+        Reads the tasks from the contents of the snapshot, see read().
+
+        Args:
+            data (Union[bytes, mmap.mmap]): contents of the snapshot
+            main_file_identity (Tuple[int, int, int]): main_file_identity() of the main file
+            mapped (bool): the data are memory-mapped and the bodies are left in them
+
+        Returns:
+            Union[Tuple[int, int, List[woolnote.task_store.Task]], None]:
+        """
+        header_size = self.HEADER.size
+        checksum_size = self.CHECKSUM.size
+        if len(data) < header_size + checksum_size or data[:len(self.MAGIC)] != self.MAGIC:
+            return None
+        (magic, version, main_file_size, main_file_mtime, main_file_inode, export_lamport_clock,
+         last_import_lamport_clock, task_count) = self.HEADER.unpack_from(data, 0)
+        if version != self.VERSION or (main_file_size, main_file_mtime, main_file_inode) != main_file_identity:
+            return None
+        data_end = len(data) - checksum_size
+        if zlib.crc32(memoryview(data)[:data_end]) != self.CHECKSUM.unpack_from(data, data_end)[0]:
+            util.dbgprint("TaskStoreSnapshot: wrong checksum of {}".format(self.snapshot_path))
+            return None
+
+        length_unpack = self.LENGTH.unpack_from
+        length_size = self.LENGTH.size
+        table_entry_unpack = self.TABLE_ENTRY.unpack_from
+        table_entry_size = self.TABLE_ENTRY.size
+        record_unpack = self.RECORD.unpack_from
+        record_size = self.RECORD.size
+        table = []
+        pos = header_size
+        for i in range(task_count):
+            length = length_unpack(data, pos)[0]
+            pos += length_size
+            taskid = str(data[pos:pos + length], "utf-8")
+            pos += length
+            table.append((taskid,) + table_entry_unpack(data, pos))
+            pos += table_entry_size
+        records_start = pos
+
+        tasks = []
+        for taskid, lamport_timestamp, record_offset in table:
+            pos = records_start + record_offset
+            export_lamport_timestamp, due_date_reminder_dismissed = record_unpack(data, pos)
+            pos += record_size
+            strings = []
+            for field_name in self.RECORD_STRING_FIELDS:
+                length = length_unpack(data, pos)[0]
+                pos += length_size
+                if mapped and field_name == "body":
+                    strings.append(MappedTaskBody(data, pos, pos + length))
+                else:
+                    strings.append(str(data[pos:pos + length], "utf-8"))
+                pos += length
+            tag_count = length_unpack(data, pos)[0]
+            pos += length_size
+            tags = []
+            for j in range(tag_count):
+                length = length_unpack(data, pos)[0]
+                pos += length_size
+                tags.append(str(data[pos:pos + length], "utf-8"))
+                pos += length
+            if pos > data_end:
+                raise ValueError("record of {} out of bounds".format(taskid))
+
+            # the fields are set without Task.__init__(), which would create random IDs only to replace them
+            task = Task.__new__(Task)
+            task.taskid = taskid
+            task.lamport_timestamp = lamport_timestamp
+            task.export_lamport_timestamp = export_lamport_timestamp
+            task.due_date_reminder_dismissed = bool(due_date_reminder_dismissed)
+            for field_name, value in zip(self.RECORD_STRING_FIELDS, strings):
+                setattr(task, field_name, value)
+            task.tags = tags
+            tasks.append(task)
+        return export_lamport_clock, last_import_lamport_clock, tasks
+
+
+# TaskStore - a container for many tasks
+########################################
+
+class TaskStore():
+    # the attributes holding the loaded data, see task_store_load(deferred=True)
+    DEFERRED_LOAD_ATTRIBUTES = ("store_dict_id", "lamport_clock", "export_lamport_clock", "last_import_lamport_clock",
+                                "taskids_unsaved", "full_save_required", "journal_size", "journal_saved_clocks",
+                                "main_file_size", "taskids_index_dirty", "taskids_fulltext_index_dirty", "lamport_order",
+                                "changes_without_lamport_clock")
+
+    def __init__(self, filepath):
+        """
+        Creates an in-memory task store that can load or save its contents from/to a file, can accept new tasks, can
+        perform searches over tasks.
+
+        Args:
+            filepath (str): File into which and from which tasks can be saved / loaded.
+        """
+        super().__init__()
+        self.store_dict_id = {}
+        self.lamport_clock = 1
+        self.export_lamport_clock = -1  # lamport clock at the last export (not just save, but the user-facing export functionality)
+        self.last_import_lamport_clock = -1  # lamport clock at the last import (not just save, but the user-facing export functionality)
+        self.filepath = filepath
+
+        # Saves to the primary location append the tasks that have been added, touched or removed since the last save
+        # to a journal instead of rewriting the whole file, see task_store_save().
+        self.taskids_unsaved = set()
+        self.full_save_required = True  # the journal can only be used once the main file is known to be up to date
+        self.journal_size = 0  # size of the complete records in the journal, anything after them is discarded
+        self.journal_saved_clocks = None  # (export_lamport_clock, last_import_lamport_clock) as last saved
+        self.main_file_size = 0
+        self.journal_compaction_thread = None
+        self.background_writer = None  # TaskStoreWriter which writes the files if set
+
+        # The indexes are refreshed lazily before they are queried. Tasks are often modified right after touch()
+        # (e.g. tags are added), so the affected taskids are only marked here and reindexed at the next query. The
+        # fulltext index is refreshed only for searches, so that the bodies are not accessed just to list tasks.
+        self.fulltext_index = FulltextIndex()
+        self.folder_tag_index = FolderTagIndex()
+        self.taskids_index_dirty = set()
+        self.taskids_fulltext_index_dirty = set()
+        # the tasks are only read by concurrently handled requests, but the lazy refreshes change the indexes
+        self.index_lock = threading.Lock()
+
+        # taskids of all tasks in store_dict_id kept in the order of sort_taskid_list_descending_lamport()
+        self.lamport_order = LamportOrderedTaskids()
+
+        # counts the changes of store_dict_id that don't advance the lamport clock, see get_version()
+        self.changes_without_lamport_clock = 0
+
+        # the values of DEFERRED_LOAD_ATTRIBUTES while the loading is deferred, see task_store_load()
+        self.deferred_load_values = None
+        self.deferred_backups = []  # backups requested while the loading is deferred, see task_store_backup()
+        # the deferred loading can be requested by concurrently handled requests (reentrant for task_store_load())
+        self.deferred_load_lock = threading.RLock()
+
+    def __getstate__(self):
+        # the task stores are pickled by the test framework, the locks can't be pickled
+        state = self.__dict__.copy()
+        del state["index_lock"]
+        del state["deferred_load_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.index_lock = threading.Lock()
+        self.deferred_load_lock = threading.RLock()
+
+    def deferred_load_run(self):
+        """
+        Loads the task store if task_store_load() has deferred the loading, then makes the backups requested in the
+        meantime (before the loaded tasks can be changed). Has to be called before the data of a task store whose
+        loading may have been deferred are used. If it is called by several threads at once, the others wait until the
+        task store is loaded.
+
+        Returns:
+            None:
+        """
+        with self.deferred_load_lock:
+            if self.deferred_load_values is None:
+                return
+            util.dbgprint("TaskStore: loading {}".format(self.filepath))
+            for name, value in self.deferred_load_values.items():
+                self.__dict__.setdefault(name, value)
+            self.deferred_load_values = None
+            self.task_store_load()
+            deferred_backups = self.deferred_backups
+            self.deferred_backups = []
+            for backup_store, manifest_name in deferred_backups:
+                self.task_store_backup(backup_store, manifest_name)
+
+    def index_refresh(self):
+        """
+        Brings the folder and tag index up to date with the tasks that have been added, touched or removed since the
+        last refresh.
+
+        Returns:
+            None:
+        """
+        with self.index_lock:
+            for taskid in self.taskids_index_dirty:
+                task = self.store_dict_id.get(taskid)
+                if task is None:
+                    self.folder_tag_index.unindex_taskid(taskid)
+                else:
+                    self.folder_tag_index.index_task(taskid, task)
+            self.taskids_index_dirty.clear()
+
+    def fulltext_index_refresh(self):
+        """
+        Brings the fulltext index up to date with the tasks that have been added, touched or removed since the last
+        refresh.
+
+        Returns:
+            None:
+        """
+        with self.index_lock:
+            for taskid in self.taskids_fulltext_index_dirty:
+                task = self.store_dict_id.get(taskid)
+                if task is None:
+                    self.fulltext_index.unindex_taskid(taskid)
+                else:
+                    self.fulltext_index.index_task(taskid, task)
+            self.taskids_fulltext_index_dirty.clear()
+
+    def serialize(self):
+        """
+        Returns a textual representation of itself and all tasks.
+
+        Returns:
+            str: serialized task store
+        """
+        return "".join(self.serialize_chunks())
+
+    def summary(self):
+        """
+        Returns a Merkle-style summary of the tasks - a hash for each group of tasks whose taskids start with the same
+        SUMMARY_PREFIX_LENGTH characters, computed from their taskids and content hashes. Two task stores have the same
+        tasks in a group exactly if the hashes of the group are the same. The content hashes are cached by the tasks
+        until they change, so only the changed tasks are hashed again.
+
+        Returns:
+            Dict[str, str]: {taskid prefix: hash of the group}
+        """
+        groups = {}
+        for taskid, task in self.store_dict_id.items():
+            groups.setdefault(taskid[:SUMMARY_PREFIX_LENGTH], []).append(taskid + " " + task.content_hash() + "\n")
+        return {prefix: hashlib.sha256("".join(sorted(lines)).encode("utf-8")).hexdigest()
+                for prefix, lines in groups.items()}
+
+    @staticmethod
+    def summary_root(summary):
+        """
+        Returns the hash of the whole summary, which is the same for two task stores exactly if they have the same
+        tasks.
+
+        Args:
+            summary (Dict[str, str]): see summary()
 
-        return False
+        Returns:
+            str:
+        """
+        lines = "".join(prefix + " " + summary[prefix] + "\n" for prefix in sorted(summary))
+        return hashlib.sha256(lines.encode("utf-8")).hexdigest()
 
+    def summary_serialize(self):
+        """
+        Returns a textual representation of summary() which is stored next to the exported task store, so that the
+        import can skip the groups of tasks that have not been changed (see summary_deserialize()).
 
-# TaskStore - a container for many tasks
-########################################
+        Returns:
+            str:
+        """
+        summary = self.summary()
+        serialized_list = [SUMMARY_HEADER + "\n", "ROOT " + self.summary_root(summary) + "\n"]
+        for prefix in sorted(summary):
+            serialized_list.append("GROUP " + prefix + " " + summary[prefix] + "\n")
+        return "".join(serialized_list)
+
+    @staticmethod
+    def summary_deserialize(source_lines):
+        """
+        Reads the summary written by summary_serialize().
 
-class TaskStore():
-    def __init__(self, filepath):
+        Args:
+            source_lines (Iterable[str]): lines of the serialized summary, e.g. an opened file
+
+        Returns:
+            Union[Dict[str, str], None]: the summary or None if it is not valid
         """
-        Creates an in-memory task store that can load or save its contents from/to a file, can accept new tasks, can
-        perform searches over tasks.
+        source_lines = iter(source_lines)
+        if next(source_lines, "").rstrip("\n") != SUMMARY_HEADER:
+            return None
+        root = None
+        summary = {}
+        for line in source_lines:
+            line = line.rstrip("\n")
+            if line.startswith("ROOT "):
+                root = line[len("ROOT "):]
+            elif line.startswith("GROUP "):
+                prefix, prefix_hash = line[len("GROUP "):].rsplit(" ", 1)
+                summary[prefix] = prefix_hash
+        if root != TaskStore.summary_root(summary):
+            return None
+        return summary
+
+    def summary_prefixes_differing(self, other_summary):
+        """
+        Returns the taskid prefixes of the groups of tasks that differ from the other task store's summary. The groups
+        with a task that has been changed since the last export (the lamport timestamp is newer than the export one)
+        are returned too, even if the other task store has the same task.
 
         Args:
-            filepath (str): File into which and from which tasks can be saved / loaded.
+            other_summary (Dict[str, str]): see summary()
+
+        Returns:
+            Set[str]:
         """
-        super().__init__()
-        self.store_dict_id = {}
-        self.lamport_clock = 1
-        self.export_lamport_clock = -1  # lamport clock at the last export (not just save, but the user-facing export functionality)
-        self.last_import_lamport_clock = -1  # lamport clock at the last import (not just save, but the user-facing export functionality)
-        self.filepath = filepath
-        self.taskids_touched_since_last_add_or_del = set()
-        self.taskids_touched_dict_cleared_since_last_save = False
+        summary = self.summary()
+        prefixes = {prefix for prefix in summary.keys() | other_summary.keys()
+                    if summary.get(prefix) != other_summary.get(prefix)}
+        for taskid, task in self.store_dict_id.items():
+            if task.lamport_timestamp > task.export_lamport_timestamp:
+                prefixes.add(taskid[:SUMMARY_PREFIX_LENGTH])
+        return prefixes
 
-    def serialize(self):
+    def serialize_chunks(self):
         """
-        Returns a textual representation of itself and all tasks.
+        Returns a textual representation of itself and all tasks as a list of strings which are to be concatenated
+        (or written to a file one after another), so that the whole file is never joined into one string.
 
         Returns:
-            str: serialized task store
+            List[str]: serialized task store
         """
         s = util.sanitize_singleline_string_for_tasksave
         serialized_list = []
@@ -241,136 +1350,724 @@ class TaskStore():
             task = self.store_dict_id[taskid]
             serialized_list.append(task.serialize())
             serialized_list.append("\n\n")
-        serialized = "".join(serialized_list)
-        return serialized
+        return serialized_list
 
-    def task_store_save(self, alt_path=None, testing_no_write=False):
+    def task_store_save(self, alt_path=None, testing_no_write=False, compact=False):
         """
         Saves the serialized itself into the file configured in __init__(). This method has to be called manually,
         the task store doesn't save its in-memory representation into the file automatically. If no alternative path
-        is specified and if only a few tasks have been modified (without deleting or adding), it saves the changes
-        to a small differential file. If no alternative path is specified but the changes are more extensive,
-        the full file is saved and the differential file is emptied. If an alternative path is specified, no diff file
-        is used.
+        is specified, only the tasks that have been added, touched or removed since the last save are appended to the
+        journal, so the cost of a save depends on the size of the change and not on the size of the task store. Once
+        the journal grows large compared to the main file, the full file is written in a background thread and the
+        journal is emptied. The full file is written right away if compaction is requested or if the journal cannot
+        describe the changes (e.g. after remove_all()). If an alternative path is specified, no journal is used.
+
+        If a background writer is set (see TaskStoreWriter), the data for the primary location are serialized right
+        away but written to the files later by the writer's thread. Use task_store_flush() to wait for them.
 
         Args:
             alt_path (Union[str, None]): Alternative path where to save.
             testing_no_write (bool): Do not do file write. Only for testing purposes.
+            compact (bool): Save everything to the main file and empty the journal even if it is small.
 
         Returns:
             None:
         """
 
-        path_diff = self.filepath + config.DIFFNEW_EXTENSION
-        if all([ alt_path is None,  # only if primary location
-                 not self.taskids_touched_dict_cleared_since_last_save,  # only if flush not necessary
-                 self.taskids_touched_since_last_add_or_del,  # only if something has been touched
-                 len(self.taskids_touched_since_last_add_or_del) in range(5),  # only if only a few has been touched
-                 ]) :
-            # no alternative path, saving to the primary location
-            # there is only a few tasks that have been modified, write them to a separate small file
+        if alt_path is None and self.deferred_load_values is not None:
+            # not loaded yet, so nothing has been changed
+            return
+
+        if alt_path is not None:
+            # alternative path, do not use the journal at all
 
-            diffupdate_store = TaskStore(None)
-            for taskid in self.taskids_touched_since_last_add_or_del:
-                task = self.store_dict_id[taskid]
-                diffupdate_store.add_deserialized(task)
             if not testing_no_write:
-                with open(path_diff, "w", encoding="utf-8", newline="\n") as stored_file:
-                    stored_file.write(diffupdate_store.serialize())
+                util.write_file_atomically(alt_path, self.serialize_chunks(),
+                                           compresslevel=config.STORAGE_COMPRESSION_LEVEL)
 
-        elif alt_path is None:
+        elif compact or self.full_save_required:
             # no alternative path, saving to the primary location
-            # empty the separate small file and save everything to the main file
+            # save everything to the main file and empty the journal
 
-            self.taskids_touched_since_last_add_or_del.clear()  # going to save the full file
-            self.taskids_touched_dict_cleared_since_last_save = False  # going to save the full file and begin with a clean slate again
+            serialized_chunks = self.serialize_chunks()
             if not testing_no_write:
-                with open(self.filepath, "w", encoding="utf-8", newline="\n") as stored_file:
-                    stored_file.write(self.serialize())
-                with open(path_diff, "w", encoding="utf-8", newline="\n") as stored_file:
-                    stored_file.write("")
+                self.file_operation_run((FILE_OPERATION_FULL_SAVE, serialized_chunks, self.snapshot_prepare()))
+            self.main_file_size = sum(len(chunk) for chunk in serialized_chunks)
+            self.journal_size = 0
+            self.journal_saved_clocks = (self.export_lamport_clock, self.last_import_lamport_clock)
+            self.taskids_unsaved.clear()
+            self.full_save_required = False
 
         else:
-            # alternative path, do not use differential files at all
+            # no alternative path, saving to the primary location
+            # append the changes to the journal and compact it if it has grown too large
+
+            if self.taskids_unsaved or self.journal_saved_clocks != (self.export_lamport_clock, self.last_import_lamport_clock):
+                if not testing_no_write:
+                    record_bytes = self.journal_serialize_record().encode("utf-8")
+                    self.file_operation_run((FILE_OPERATION_JOURNAL_APPEND, record_bytes, self.journal_size))
+                    self.journal_size += len(record_bytes)
+                self.journal_saved_clocks = (self.export_lamport_clock, self.last_import_lamport_clock)
+                self.taskids_unsaved.clear()
+
+            if not testing_no_write and self.journal_size > max(config.JOURNAL_COMPACTION_MIN_SIZE,
+                                                                config.JOURNAL_COMPACTION_RATIO * self.main_file_size):
+                serialized_chunks = self.serialize_chunks()
+                self.file_operation_run((FILE_OPERATION_JOURNAL_COMPACTION, serialized_chunks, self.snapshot_prepare()))
+                self.main_file_size = sum(len(chunk) for chunk in serialized_chunks)
+                self.journal_size = 0
+
+    def task_store_backup(self, backup_store, manifest_name, testing_no_write=False):
+        """
+        Saves a backup of itself into the backup store, writing only the tasks that are not in it yet. See
+        task_backup.TaskBackupStore.backup().
 
-            if not testing_no_write:
-                with open(alt_path, "w", encoding="utf-8", newline="\n") as stored_file:
-                    stored_file.write(self.serialize())
+        Args:
+            backup_store (woolnote.task_backup.TaskBackupStore):
+            manifest_name (str): File name of the backup's manifest without the extension.
+            testing_no_write (bool): Do not do file write. Only for testing purposes.
+
+        Returns:
+            None:
+        """
+        if not testing_no_write:
+            if self.deferred_load_values is not None:
+                # the file hasn't been changed since the loading was deferred, it is backed up once it is loaded
+                self.deferred_backups.append((backup_store, manifest_name))
+            else:
+                backup_store.backup(manifest_name, self)
+
+    def task_store_export_zip(self, path, arcname, summary_arcname, compresslevel, testing_no_write=False):
+        """
+        Writes itself serialized as arcname into a new zip file at path. The serialized chunks are encoded and
+        compressed into the zip entry as they are produced, so no uncompressed copy of the file is written to the disk.
+        The serialized summary() is stored next to it, so that the import can skip the tasks that have not been
+        changed. The zip file is written next to the path first and then replaces it, so that a half-written zip file is
+        never synced.
+
+        Args:
+            path (str): Path of the zip file.
+            arcname (str): Name of the serialized task store in the zip file.
+            summary_arcname (str): Name of the serialized summary in the zip file.
+            compresslevel (int): Deflate compression level (0-9).
+            testing_no_write (bool): Do not do file write. Only for testing purposes.
+
+        Returns:
+            List[Tuple[str, float, int]]: stage name, duration in seconds, bytes produced by the stage
+        """
+        time_start = time.perf_counter()
+        serialized_chunks = self.serialize_chunks()
+        serialize_duration = time.perf_counter() - time_start
+        if testing_no_write:
+            return [("serialize", serialize_duration, sum(len(chunk.encode("utf-8")) for chunk in serialized_chunks))]
+
+        time_start = time.perf_counter()
+        uncompressed_size = 0
+        temp_path = path + config.TEMP_EXTENSION
+        with open(temp_path, "wb") as export_file:
+            with zipfile.ZipFile(export_file, "w", compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=compresslevel) as exportzip:
+                # a character takes at most 4 bytes in utf-8
+                force_zip64 = 4 * sum(len(chunk) for chunk in serialized_chunks) > zipfile.ZIP64_LIMIT
+                with exportzip.open(arcname, "w", force_zip64=force_zip64) as export_entry:
+                    # the chunks are joined into larger blocks so that the compressor is not called for every task
+                    block = []
+                    block_size = 0
+                    for chunk in serialized_chunks:
+                        block.append(chunk)
+                        block_size += len(chunk)
+                        if block_size >= EXPORT_BLOCK_SIZE:
+                            uncompressed_size += export_entry.write("".join(block).encode("utf-8"))
+                            block.clear()
+                            block_size = 0
+                    uncompressed_size += export_entry.write("".join(block).encode("utf-8"))
+                summary_time_start = time.perf_counter()
+                summary_bytes = self.summary_serialize().encode("utf-8")
+                exportzip.writestr(summary_arcname, summary_bytes)
+                summary_duration = time.perf_counter() - summary_time_start
+            export_file.flush()
+            os.fsync(export_file.fileno())
+            compressed_size = export_file.tell()
+        os.replace(temp_path, path)
+        util.fsync_directory(os.path.dirname(os.path.abspath(path)))
+        return [("serialize", serialize_duration, uncompressed_size),
+                ("summary", summary_duration, len(summary_bytes)),
+                ("compress", time.perf_counter() - time_start - summary_duration, compressed_size)]
+
+    def task_store_archive_oldest(self, archive_path, keep_count, archive_batch, testing_no_write=False):
+        """
+        Moves the tasks with the oldest lamport timestamps to the archive (a task store file that is only appended to
+        and never loaded here) so that only the newest keep_count tasks stay. The tasks are moved only once there are
+        at least archive_batch more, so that the archive is appended to in batches. The tasks are appended to the
+        journal of the archive (its main file is created empty), so the archive can be loaded by a TaskStore like any
+        other task store file. Saves itself afterwards.
+
+        Args:
+            archive_path (str): Path of the main file of the archive.
+            keep_count (Union[None, int]): How many tasks to keep, None (or 0) to keep all of them.
+            archive_batch (int): How many tasks over keep_count are needed to move them.
+            testing_no_write (bool): Do not do file write. Only for testing purposes.
+
+        Returns:
+            None:
+        """
+        if not keep_count or len(self.store_dict_id) < keep_count + archive_batch or testing_no_write:
+            return
+        taskids_archived = self.sort_taskid_list_descending_lamport()[keep_count:]
+        archive = TaskStore(archive_path)
+        for taskid in taskids_archived:
+            archive.add_deserialized(self.store_dict_id[taskid])
+        if not os.path.isfile(archive_path):
+            util.write_file_atomically(archive_path, [])
+        path_archive_journal = archive_path + config.JOURNAL_EXTENSION
+        archive_journal_size = 0
+        if os.path.isfile(path_archive_journal):
+            archive_journal_size = archive.journal_replay(path_archive_journal, deserialize=False)
+        # the tasks are removed only once they are on the disk in the archive
+        archive.journal_append(archive.journal_serialize_record().encode("utf-8"), archive_journal_size)
+        for taskid in taskids_archived:
+            self.remove(taskid)
+        self.task_store_save()
+
+    def task_store_flush(self):
+        """
+        Waits until everything saved by task_store_save() is written to the disk. Saves are written right away unless a
+        background writer is set.
+
+        Returns:
+            None:
+        """
+        if self.background_writer is not None:
+            self.background_writer.flush()
+
+    def file_operation_run(self, file_operation):
+        """
+        Runs the file operation prepared by task_store_save() right away or passes it to the background writer if it
+        is set. The file operations are run in the order in which they have been prepared.
+
+        Args:
+            file_operation (tuple): FILE_OPERATION_* followed by its arguments.
+
+        Returns:
+            None:
+        """
+        if self.background_writer is not None:
+            self.background_writer.enqueue(self, file_operation)
+        else:
+            self.file_operation_execute(file_operation, in_background=False)
+
+    def file_operation_execute(self, file_operation, in_background):
+        """
+        Writes the files according to a file operation prepared by task_store_save(). Only reads the data in the file
+        operation and not the tasks, so it can run in the thread of the background writer.
+
+        Args:
+            file_operation (tuple): FILE_OPERATION_* followed by its arguments.
+            in_background (bool): Runs in the thread of the background writer, so the compaction of the journal can be
+                                  done right away instead of in another thread.
+
+        Returns:
+            None:
+        """
+        operation = file_operation[0]
+        path_journal = self.filepath + config.JOURNAL_EXTENSION
+        path_journal_compacting = self.filepath + config.JOURNAL_COMPACTING_EXTENSION
+        path_diff = self.filepath + config.DIFFNEW_EXTENSION
+        if operation == FILE_OPERATION_JOURNAL_APPEND:
+            self.journal_append(file_operation[1], file_operation[2])
+        elif operation == FILE_OPERATION_FULL_SAVE:
+            self.journal_compaction_wait()
+            TaskStore.write_main_file(self.filepath, file_operation[1], [path_journal, path_journal_compacting, path_diff],
+                                      file_operation[2])
+        elif operation == FILE_OPERATION_JOURNAL_COMPACTION:
+            # the journal is moved aside so that the following saves start a new journal; if the program is killed
+            # before the full file is written, both journals are replayed by task_store_load() and the next save
+            # writes the full file again
+            self.journal_compaction_wait()
+            os.replace(path_journal, path_journal_compacting)
+            if in_background:
+                TaskStore.write_main_file(self.filepath, file_operation[1], [path_journal_compacting, path_diff],
+                                          file_operation[2])
+            else:
+                self.journal_compaction_thread = threading.Thread(
+                    target=TaskStore.write_main_file,
+                    args=(self.filepath, file_operation[1], [path_journal_compacting, path_diff], file_operation[2]),
+                    name="woolnote journal compaction")
+                self.journal_compaction_thread.start()
+
+    def journal_serialize_record(self):
+        """
+        Serializes the tasks that have been added, touched or removed since the last save into a journal record. The
+        record is enclosed in lines with a random token, so that a record that was written only partially (e.g. the
+        program was killed) can be recognized and ignored. No state is changed.
+
+        Returns:
+            str:
+        """
+        token = util.create_random_id()
+        record_lines = ["JOURNAL-BEGIN " + token,
+                        "EXPORT-LAMPORT-CLOCK " + str(self.export_lamport_clock),
+                        "LAST-IMPORT-LAMPORT-CLOCK " + str(self.last_import_lamport_clock)]
+        serialized_tasks = []
+        for taskid in sorted(self.taskids_unsaved):
+            if taskid in self.store_dict_id:
+                serialized_tasks.append(self.store_dict_id[taskid].serialize())
+            else:
+                record_lines.append("TASK-REMOVED " + taskid)
+        record_lines.append("".join(serialized_tasks))
+        record_lines.append("JOURNAL-COMMIT " + token)
+        return "\n".join(record_lines) + "\n"
+
+    def journal_append(self, record_bytes, journal_size):
+        """
+        Appends records to the journal of the task store and makes sure they are written to the disk before returning.
+        Anything after the last complete record (written only partially before the program was killed) is discarded
+        first, so that the new records are readable.
+
+        Args:
+            record_bytes (bytes): Encoded records from journal_serialize_record().
+            journal_size (int): The size of the complete records in the journal.
+
+        Returns:
+            None:
+        """
+        path_journal = self.filepath + config.JOURNAL_EXTENSION
+        journal_created = not os.path.isfile(path_journal)
+        with open(path_journal, "ab") as journal_file:
+            if journal_file.tell() > journal_size:
+                journal_file.truncate(journal_size)
+            journal_file.write(record_bytes)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        if journal_created:
+            util.fsync_directory(os.path.dirname(path_journal))
+
+    def journal_replay(self, path, deserialize=True):
+        """
+        Deserializes the complete records of the journal in the given file and applies them to itself in the order in
+        which they have been saved. An incomplete record at the end of the journal is ignored.
+
+        Args:
+            path (str): Path to the journal.
+            deserialize (bool): Apply the records, otherwise only their size is determined.
+
+        Returns:
+            int: The size of the complete records in bytes.
+        """
+        size_read = 0
+        size_complete = 0
+        record_token = None  # not None inside a record
+        record_lines = []
+        with open(path, "rb") as journal_file:
+            for line_bytes in journal_file:
+                size_read += len(line_bytes)
+                # the last line can be cut in the middle of a character if the record is incomplete
+                line = line_bytes.decode("utf-8", errors="replace")
+                if record_token is None:
+                    if line.startswith("JOURNAL-BEGIN "):
+                        record_token = line.rstrip("\n").split(" ", 2)[1]
+                        record_lines = []
+                elif line == "JOURNAL-COMMIT " + record_token + "\n":
+                    if deserialize:
+                        self.deserialize_lines(record_lines, journal_record=True)
+                    size_complete = size_read
+                    record_token = None
+                elif deserialize:
+                    record_lines.append(line)
+        return size_complete
+
+    def journal_compaction_wait(self):
+        """
+        Waits until the full file written by a compaction of the journal in another thread (if any) is on the disk.
+
+        Returns:
+            None:
+        """
+        if self.journal_compaction_thread is not None:
+            self.journal_compaction_thread.join()
+            self.journal_compaction_thread = None
+
+    def snapshot_prepare(self):
+        """
+        Collects the data for the snapshot of the main file (see TaskStoreSnapshot) that is written together with the
+        data from serialize_chunks(), which has to be called first. No state is changed.
+
+        Returns:
+            Union[tuple, None]: arguments of TaskStoreSnapshot.write() or None if no snapshot is to be written
+        """
+        if not config.BINARY_SNAPSHOT_ENABLED:
+            return None
+        task_fields_list = []
+        for taskid in sorted(self.store_dict_id):
+            task_fields = TaskStoreSnapshot.task_fields(self.store_dict_id[taskid])
+            if task_fields is None:
+                # the main file has to be parsed, the outdated snapshot is recognized by its header
+                return None
+            task_fields_list.append(task_fields)
+        return self.export_lamport_clock, self.last_import_lamport_clock, task_fields_list
+
+    @staticmethod
+    def write_main_file(path, serialized_chunks, obsolete_paths, snapshot_data=None):
+        """
+        Atomically replaces the file at the given path with the serialized task store, writes its snapshot and then
+        deletes the files that have become obsolete (the journals that are included in the written data). If the
+        program is killed at any point, the files still contain either the old or the new data - replaying a journal
+        that is already included in the main file results in the same tasks and a snapshot of the old main file is
+        not used. Doesn't access any task store, so it can run in a background thread.
+
+        Args:
+            path (str): Path of the main file.
+            serialized_chunks (List[str]): Serialized task store from serialize_chunks().
+            obsolete_paths (List[str]): Paths of the files to delete afterwards if they exist.
+            snapshot_data (Union[tuple, None]): Data for the snapshot from snapshot_prepare(), None for no snapshot.
 
-    def task_store_load(self, alt_path=None):
+        Returns:
+            None:
+        """
+        util.write_file_atomically(path, serialized_chunks, compresslevel=config.STORAGE_COMPRESSION_LEVEL)
+        if snapshot_data is not None:
+            TaskStoreSnapshot(path).write(*snapshot_data)
+        obsolete_paths_removed = False
+        for obsolete_path in obsolete_paths:
+            if os.path.isfile(obsolete_path):
+                os.remove(obsolete_path)
+                obsolete_paths_removed = True
+        if obsolete_paths_removed:
+            util.fsync_directory(os.path.dirname(path))
+
+    def task_store_load(self, alt_path=None, deferred=False):
         """
         Loads the serialized data from the file configured in __init__(), deserializes them and adds them to any data
-         that were held in memory by the task store.
+        that were held in memory by the task store. The tasks are read from the binary snapshot of the file instead if
+        the file hasn't been changed since the snapshot was written. Then the journals (and the differential file of
+        older versions) are replayed on top of them.
+
+        If the loading is deferred, the task store is loaded only by deferred_load_run(), which has to be called
+        before any of its data (DEFERRED_LOAD_ATTRIBUTES, e.g. store_dict_id) are used, so that a task store which is
+        seldom used (the trash) doesn't slow down the startup.
 
         Args:
             alt_path (Union[str, None]): Alternative path where to load from.
+            deferred (bool): Defer the loading from the file configured in __init__() until it is needed.
 
         Returns:
             None:
         """
 
-        def deserialize(destination_task_store, source_file, list_of_taskids_read=None):
-            """
-            Deserialize task store data from an input file and save it to a TaskStore instance.
-
-            Args:
-                destination_task_store (woolnote.task_store.TaskStore): where to store the deserialized data
-                source_file (_io.TextIOWrapper): where to read serialized data from
-                list_of_taskids_read (Union[None, List]): if not None, append deserialized taskid to this list
-
-            Returns:
-                None:
-            """
-            task_strings = []
-            inside_task = False
-            inside_task_id_known = False
-            inside_task_id = ""
-            for line in stored_file:
-                line = line.rstrip("\n")
-                line_split = line.split(" ")
-                if not inside_task:
-                    if line_split[0] == "EXPORT-LAMPORT-CLOCK":
-                        destination_task_store.export_lamport_clock = int(line_split[1])
-                    if line_split[0] == "LAST-IMPORT-LAMPORT-CLOCK":
-                        destination_task_store.last_import_lamport_clock = int(line_split[1])
-                    if line == "TASK-BEGIN":
-                        inside_task = True
-                if inside_task:
-                    task_strings.append(line)
-                    if not inside_task_id_known:
-                        if line_split[0] == "TASK-ID":
-                            inside_task_id = line_split[1]
-                            inside_task_id_known = True
-                    if inside_task_id_known:
-                        if line_split[0] == "TASK-END":
-                            if line_split[1] == inside_task_id:
-                                inside_task = False
-                                inside_task_id_known = False
-                                new_task = Task()
-                                new_task.deserialize("\n".join(task_strings))
-                                destination_task_store.add_deserialized(new_task)
-                                if list_of_taskids_read is not None:
-                                    list_of_taskids_read.append(new_task.taskid)
-                                task_strings = []
-
-        self.taskids_touched_since_last_add_or_del.clear()  # loading different data, the old are going to be irrelevant
-        self.taskids_touched_dict_cleared_since_last_save = True  # this makes task_store_save() work properly - deletes the contents of the diff file
-
-        path = self.filepath
+        if deferred and alt_path is None:
+            self.deferred_load_values = {name: self.__dict__.pop(name) for name in TaskStore.DEFERRED_LOAD_ATTRIBUTES}
+            return
+        self.deferred_load_run()
+
         if alt_path is not None:
-            path = alt_path
-        with open(path, "r", encoding="utf-8", newline="\n") as stored_file:
-            deserialize(self, stored_file)
+            self.deserialize_file(alt_path)
+            # the primary location doesn't contain the loaded tasks
+            self.full_save_required = True
+            return
+
+        # the journal can describe only the changes made after the load
+        full_save_required = len(self.store_dict_id) > 0
+
+        # the compressed size for a compressed file, which only makes the journal compacted sooner
+        self.main_file_size = os.path.getsize(self.filepath)
+        # the bodies stay in the mapped file until they are accessed (Windows cannot replace a mapped file)
+        lazy_body_loading = config.LAZY_BODY_LOADING and os.name != "nt"
+        snapshot = None
+        if config.BINARY_SNAPSHOT_ENABLED:
+            snapshot = TaskStoreSnapshot(self.filepath).read(mapped=lazy_body_loading)
+        if snapshot is not None:
+            # the main file hasn't been changed since the snapshot was written, so it doesn't have to be parsed
+            self.export_lamport_clock, self.last_import_lamport_clock, snapshot_tasks = snapshot
+            for task in snapshot_tasks:
+                self.add_deserialized(task)
+        elif lazy_body_loading and self.main_file_size > 0 and not util.file_is_compressed(self.filepath):
+            with open(self.filepath, "rb") as stored_file:
+                mapped_file = mmap.mmap(stored_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.deserialize_lines(MappedTaskStoreFileLines(mapped_file))
+        else:
+            self.deserialize_file(self.filepath)
 
         path_diff = self.filepath + config.DIFFNEW_EXTENSION
-        if alt_path is None and os.path.isfile(path_diff):
-            # load is not from alternative path -> load differential file if it exists
-            with open(path_diff, "r", encoding="utf-8", newline="\n") as stored_file:
-                list_of_diff_taskids = []
-                deserialize(self, stored_file, list_of_diff_taskids)
-                self.taskids_touched_since_last_add_or_del.update(list_of_diff_taskids)
-                self.taskids_touched_dict_cleared_since_last_save = False  # loaded the previous state with some tasks in the diff file and this state can be further used
+        if os.path.isfile(path_diff):
+            # differential file written by an older version, it is merged into the main file by the next save
+            with util.open_text_file(path_diff) as stored_file:
+                self.deserialize_lines(stored_file)
+            full_save_required = True
+
+        path_journal_compacting = self.filepath + config.JOURNAL_COMPACTING_EXTENSION
+        if os.path.isfile(path_journal_compacting):
+            # the program was killed during compaction, the next save has to finish it
+            self.journal_replay(path_journal_compacting)
+            full_save_required = True
+
+        self.journal_size = 0
+        path_journal = self.filepath + config.JOURNAL_EXTENSION
+        if os.path.isfile(path_journal):
+            self.journal_size = self.journal_replay(path_journal)
+
+        self.journal_saved_clocks = (self.export_lamport_clock, self.last_import_lamport_clock)
+        self.taskids_unsaved.clear()
+        self.full_save_required = full_save_required
+
+
+    def task_store_load_stream(self, stored_file, taskid_prefixes=None):
+        """
+        Deserializes the task store data read from the given file object opened in binary mode (e.g. a member of a zip
+        file, which is decompressed while it is read) and adds them to any data that were held in memory by the task
+        store, like task_store_load() for an alternative path.
+
+        Args:
+            stored_file (io.BufferedIOBase):
+            taskid_prefixes (Union[None, Set[str]]): if not None, only the tasks with these taskid prefixes are loaded,
+                                                     see deserialize_lines()
+
+        Returns:
+            None:
+        """
+        self.deserialize_lines(io.TextIOWrapper(stored_file, encoding="utf-8", newline="\n"),
+                               taskid_prefixes=taskid_prefixes)
+        # the primary location doesn't contain the loaded tasks
+        self.full_save_required = True
+
+    def add_deserialized_task_store(self, task_store):
+        """
+        Adds all tasks of the other task store and takes over its export and import lamport clocks, which gives the same
+        result as loading the file the other task store has been loaded from. The tasks are shared by both task stores,
+        so the other one must not be used afterwards.
+
+        Args:
+            task_store (woolnote.task_store.TaskStore):
+
+        Returns:
+            None:
+        """
+        self.export_lamport_clock = task_store.export_lamport_clock
+        self.last_import_lamport_clock = task_store.last_import_lamport_clock
+        for task in task_store.store_dict_id.values():
+            self.add_deserialized(task)
+        # includes the tasks that have been replaced by the same taskid in the other task store's file
+        self.update_lamport_clock(task_store.lamport_clock)
+        self.full_save_required = True
+
+    def deserialize_file(self, path):
+        """
+        Deserializes the task store file at the given path and adds the tasks to itself, just like deserialize_lines()
+        for the opened file. The file is decompressed if it is compressed. Large uncompressed files are parsed in
+        parallel, see deserialize_file_parallel().
+
+        Args:
+            path (str):
+
+        Returns:
+            None:
+        """
+        if (config.PARALLEL_LOADING_MIN_SIZE and os.path.getsize(path) >= config.PARALLEL_LOADING_MIN_SIZE
+                and not util.file_is_compressed(path) and self.deserialize_file_parallel(path)):
+            return
+        with util.open_text_file(path) as stored_file:
+            self.deserialize_lines(stored_file)
+
+    def deserialize_file_parallel(self, path):
+        """
+        Splits the task store file at the given path into byte ranges at the TASK-BEGIN lines, parses them in worker
+        processes (see deserialize_file_range()) and adds the tasks to itself in the order of the file, so that the
+        result is the same as with deserialize_lines() - a task that is in the file more than once is replaced and
+        the lamport clock is the maximum of all tasks. Nothing is added if the file cannot be parsed in parallel
+        (e.g. a TASK-BEGIN line in the body of a task has been taken for the beginning of a task, the platform
+        cannot fork processes or other threads are running), the caller has to parse it in a single pass then.
+
+        Args:
+            path (str):
+
+        Returns:
+            bool: Whether the tasks have been added.
+        """
+        processes = config.PARALLEL_LOADING_PROCESSES or os.cpu_count() or 1
+        # the worker processes are forked because other start methods would run woolnote.py again in each of them;
+        # a child forked while other threads are running (e.g. the background writer or the server's threads) could
+        # deadlock on a lock that one of them held, so that is done only at the startup before any threads are started
+        if (processes < 2 or "fork" not in multiprocessing.get_all_start_methods()
+                or threading.active_count() > 1):
+            return False
+        file_ranges = TaskStore.file_ranges(path, 4 * processes)
+        if len(file_ranges) < 2:
+            return False
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes,
+                                                        mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = [executor.submit(TaskStore.deserialize_file_range, path, start, end)
+                           for start, end in file_ranges]
+                results = [future.result() for future in futures]
+        except (ImportError, NotImplementedError, concurrent.futures.process.BrokenProcessPool) as exc:
+            util.dbgprint("TaskStore: cannot parse {} in parallel: {}".format(path, repr(exc)))
+            return False
+        # every range except the last one has to end outside of a task, otherwise the next range began inside it
+        if not all(result[0] for result in results[:-1]):
+            return False
+
+        for ended_outside_task, tasks, lamport_clock, export_lamport_clock, last_import_lamport_clock in results:
+            if export_lamport_clock is not None:
+                self.export_lamport_clock = export_lamport_clock
+            if last_import_lamport_clock is not None:
+                self.last_import_lamport_clock = last_import_lamport_clock
+            for task in tasks:
+                self.add_deserialized(task)
+            # includes the tasks that have been replaced by the same taskid later in the range
+            self.update_lamport_clock(lamport_clock)
+        return True
+
+    @staticmethod
+    def file_ranges(path, count):
+        """
+        Splits the task store file at the given path into about the given number of byte ranges of similar size that
+        begin with a TASK-BEGIN line (except the first one).
+
+        Args:
+            path (str):
+            count (int):
+
+        Returns:
+            List[Tuple[int, int]]: start and end of every range
+        """
+        with open(path, "rb") as stored_file:
+            size = os.fstat(stored_file.fileno()).st_size
+            if size == 0:
+                return [(0, 0)]
+            mapped_file = mmap.mmap(stored_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            starts = [0]
+            for i in range(1, count):
+                found = mapped_file.find(b"\nTASK-BEGIN\n", max(size * i // count, starts[-1]))
+                if found == -1:
+                    break
+                if found + 1 > starts[-1]:
+                    starts.append(found + 1)
+        finally:
+            mapped_file.close()
+        return list(zip(starts, starts[1:] + [size]))
+
+    @staticmethod
+    def deserialize_file_range(path, start, end):
+        """
+        Deserializes the byte range of the task store file at the given path in a worker process of
+        deserialize_file_parallel().
+
+        Args:
+            path (str):
+            start (int):
+            end (int):
+
+        Returns:
+            tuple: Whether the range ended outside of a task, the tasks in the order of the range, the lamport clock, the
+                   export lamport clock and the last import lamport clock (None if not in the range).
+        """
+        with open(path, "rb") as stored_file:
+            stored_file.seek(start)
+            data = stored_file.read(end - start)
+        task_store = TaskStore(None)
+        task_store.export_lamport_clock = None
+        task_store.last_import_lamport_clock = None
+        ended_outside_task = task_store.deserialize_lines(io.StringIO(data.decode("utf-8"), newline="\n"))
+        return (ended_outside_task, list(task_store.store_dict_id.values()), task_store.lamport_clock,
+                task_store.export_lamport_clock, task_store.last_import_lamport_clock)
+
+    def deserialize_lines(self, source_lines, list_of_taskids_read=None, taskid_prefixes=None, journal_record=False):
+        """
+        Deserializes task store data in a single pass over the lines of the input and adds the tasks to itself. The
+        lines of every task are fed to a TaskLineParser as they come, so the tasks are never joined into strings. If
+        the lines come from MappedTaskStoreFileLines, the bodies are skipped and decoded only when they are accessed.
 
+        Args:
+            source_lines (Iterable[str]): lines of the serialized task store, e.g. an opened file
+            list_of_taskids_read (Union[None, List]): if not None, append deserialized taskid to this list
+            taskid_prefixes (Union[None, Set[str]]): if not None, only the tasks whose taskids start with one of these
+                                                     SUMMARY_PREFIX_LENGTH characters long prefixes are deserialized
+            journal_record (bool): The lines are a record of the task store's own journal (see journal_replay()), only
+                                   then the TASK-REMOVED lines remove the tasks; they are ignored in any other file
+                                   (e.g. an import or a restored backup)
+
+        Returns:
+            bool: Whether the input ended outside of a task (an unfinished task at the end is skipped).
+        """
+        task_parser = None  # not None inside a task
+        task_id = None  # the taskid from the task's TASK-ID line that must be repeated in its TASK-END line
+        task_parser_exception = None  # raised only when the task ends, unfinished tasks are skipped with any errors
+        task_skipped = False  # the task's taskid doesn't have any of the taskid_prefixes
+        search_other_line_boundaries = RE_OTHER_LINE_BOUNDARIES.search
+        skip_body = getattr(source_lines, "skip_body", None)
+        source_lines = iter(source_lines)
+        line = next(source_lines, None)
+        while line is not None:
+            line = line.rstrip("\n")
+            if task_parser is None:
+                first_word = line.split(" ", 1)[0]
+                if first_word == "EXPORT-LAMPORT-CLOCK":
+                    self.export_lamport_clock = int(line.split(" ", 2)[1])
+                elif first_word == "LAST-IMPORT-LAMPORT-CLOCK":
+                    self.last_import_lamport_clock = int(line.split(" ", 2)[1])
+                elif first_word == "TASK-REMOVED" and journal_record:
+                    # written to the journal for removed tasks
+                    removed_taskid = line.split(" ", 2)[1]
+                    if removed_taskid in self.store_dict_id:
+                        self.remove(removed_taskid)
+                elif line == "TASK-BEGIN":
+                    task_parser = TaskLineParser()
+                    task_id = None
+                    task_parser_exception = None
+                    task_skipped = False
+
+            if task_parser is not None:
+                first_word = line.split(" ", 1)[0]
+                if task_parser_exception is None and not task_skipped:
+                    try:
+                        if search_other_line_boundaries(line) is None:
+                            task_parser.parse_line(line, first_word)
+                        else:
+                            # a task used to be parsed by str.splitlines() which splits even at these characters
+                            for task_line in (line + "\n").splitlines():
+                                task_parser.parse_line(task_line)
+                    except Exception as exc:
+                        task_parser_exception = exc
+
+                if task_id is None:
+                    if first_word == "TASK-ID":
+                        task_id = line.split(" ", 2)[1]
+                        if taskid_prefixes is not None and task_id[:SUMMARY_PREFIX_LENGTH] not in taskid_prefixes:
+                            # the lines are not parsed until the task ends
+                            task_skipped = True
+                elif first_word == "TASK-END" and line.split(" ", 2)[1] == task_id:
+                    if not task_skipped:
+                        if task_parser_exception is not None:
+                            raise task_parser_exception
+                        if task_parser.is_complete():
+                            new_task = task_parser.task
+                        else:
+                            # an invalid task has always been loaded as a new empty task
+                            new_task = Task()
+                        self.add_deserialized(new_task)
+                        if list_of_taskids_read is not None:
+                            list_of_taskids_read.append(new_task.taskid)
+                    task_parser = None
+
+            line = next(source_lines, None)
+            if task_skipped and task_parser is not None:
+                # only the TASK-END line can end the skipped task
+                while line is not None and not line.startswith("TASK-END "):
+                    line = next(source_lines, None)
+            if task_parser is not None and task_parser.inside_body:
+                if (skip_body is not None and first_word == "TASK-BODY-BEGIN" and not task_parser.body_lines
+                        and line is not None):
+                    # the body is decoded only when it is accessed, continue with its TASK-BODY-END line
+                    body_mapped = skip_body(task_parser.body_end_delimiter)
+                    if body_mapped is not None:
+                        task_parser.body_mapped = body_mapped
+                        line = next(source_lines, None)
+                # the most common lines - those inside the body that can end neither the body nor the task
+                body_lines_append = task_parser.body_lines.append
+                while line is not None and not line.startswith("TASK-") and search_other_line_boundaries(line) is None:
+                    body_lines_append(line.rstrip("\n"))
+                    line = next(source_lines, None)
+        return task_parser is None
 
     def add_deserialized(self, task):
         """
@@ -384,7 +2081,21 @@ class TaskStore():
         """
         self.store_dict_id[task.taskid] = task
         self.lamport_clock = max(self.lamport_clock, int(task.lamport_timestamp))
-        self.taskids_touched_since_last_add_or_del.clear()
+        self.taskids_unsaved.add(task.taskid)
+        self.taskids_index_dirty.add(task.taskid)
+        self.taskids_fulltext_index_dirty.add(task.taskid)
+        self.lamport_order.add(task.taskid, task.lamport_timestamp)
+        self.changes_without_lamport_clock += 1
+
+    def get_version(self):
+        """
+        Returns a value that changes whenever a task is added, touched or removed, so that results computed from the
+        task store can be cached until then. Most changes advance the lamport clock, the rest is counted separately.
+
+        Returns:
+            Tuple[int, int]:
+        """
+        return self.lamport_clock, self.changes_without_lamport_clock
 
     def update_lamport_clock(self, ext_clock):
         """
@@ -411,8 +2122,10 @@ class TaskStore():
         self.store_dict_id[task.taskid] = task
         self.lamport_clock = 1 + max(self.lamport_clock, int(task.lamport_timestamp))
         task.lamport_timestamp = self.lamport_clock
-        self.taskids_touched_since_last_add_or_del.clear()
-        self.taskids_touched_dict_cleared_since_last_save = True
+        self.taskids_unsaved.add(task.taskid)
+        self.taskids_index_dirty.add(task.taskid)
+        self.taskids_fulltext_index_dirty.add(task.taskid)
+        self.lamport_order.add(task.taskid, task.lamport_timestamp)
 
     def touch(self, taskid):
         """
@@ -427,37 +2140,46 @@ class TaskStore():
         """
         self.lamport_clock = 1 + max(self.lamport_clock, int(self.store_dict_id[taskid].lamport_timestamp))
         self.store_dict_id[taskid].lamport_timestamp = self.lamport_clock
-        self.taskids_touched_since_last_add_or_del.add(taskid)
+        self.taskids_unsaved.add(taskid)
+        self.taskids_index_dirty.add(taskid)
+        self.taskids_fulltext_index_dirty.add(taskid)
+        self.lamport_order.add(taskid, self.lamport_clock)
 
-    def sort_taskid_list_descending_lamport_helper(self, taskid_list):
+    def sort_taskid_set_descending_lamport(self, taskid_set):
         """
-        Sorts the input list of taskids by lamport clock in descending order. No state is changed.
+        Sorts the input taskids by lamport clock in descending order. Tasks with the same lamport clock keep the order
+        in which they are in the task store, just like in sort_taskid_list_descending_lamport(). No state is changed.
+        Small sets are sorted by the keys of the permanently sorted taskids, large sets are filtered from them.
 
         Args:
-            taskid_list (Union[dict_keys, List[str]]): A list of taskids identifying which tasks to sort.
+            taskid_set (Union[Set[str], FrozenSet[str]]): taskids of tasks in the task store
 
         Returns:
             List[str]: taskids sorted by lamport clock in descending order
         """
-        tuples_taskid_lamport = []
-        for taskid in taskid_list:
-            task = self.store_dict_id[taskid]
-            lamport = task.lamport_timestamp
-            tuples_taskid_lamport.append((taskid, lamport))
-        sorted_tuples = sorted(tuples_taskid_lamport, key=lambda x: x[1], reverse=True)
-        sorted_taskid_desc = [x[0] for x in sorted_tuples]
-        return sorted_taskid_desc
+        if 8 * len(taskid_set) > len(self.lamport_order):
+            return [taskid for taskid in self.lamport_order if taskid in taskid_set]
+        return sorted(taskid_set, key=self.lamport_order.sort_key)
+
+    def iter_taskid_descending_lamport(self):
+        """
+        Returns an iterator over the taskids of all tasks in the task store in descending lamport clock order. The task
+        store must not be changed while the iterator is used.
+
+        Returns:
+            Iterator[str]:
+        """
+        return iter(self.lamport_order)
 
     def sort_taskid_list_descending_lamport(self):
         """
         Returns a list of taskids (of all tasks in the task store) sorted by their lamport clock in descending order.
-        No state is changed.
+        The taskids are kept sorted by the task store, so this doesn't sort anything. No state is changed.
 
         Returns:
             List[str]: taskids sorted by lamport clock in descending order
         """
-        sorted_taskid_desc = self.sort_taskid_list_descending_lamport_helper(self.store_dict_id.keys())
-        return sorted_taskid_desc
+        return list(self.lamport_order)
 
     def remove(self, taskid):
         """
@@ -472,38 +2194,48 @@ class TaskStore():
         """
         self.lamport_clock += 1
         del (self.store_dict_id[taskid])
-        self.taskids_touched_since_last_add_or_del.clear()
-        self.taskids_touched_dict_cleared_since_last_save = True
+        self.lamport_order.discard(taskid)
+        self.taskids_unsaved.add(taskid)
+        self.taskids_index_dirty.add(taskid)
+        self.taskids_fulltext_index_dirty.add(taskid)
+
+    def remove_all(self):
+        """
+        Removes the references to all tasks from the task store. Doesn't advance any lamport clock. To be used before
+        loading a different database into the same task store.
+
+        Returns:
+            None:
+        """
+        self.taskids_index_dirty.update(self.store_dict_id.keys())
+        self.taskids_fulltext_index_dirty.update(self.store_dict_id.keys())
+        self.store_dict_id = {}
+        self.lamport_order = LamportOrderedTaskids()
+        self.changes_without_lamport_clock += 1
+        self.full_save_required = True
 
     def get_folder_list(self):
         """
-        Returns a list of folders. The list is obtained by iterating through all tasks in the task store and reading the
-        names of the folders they have set. Each task can belong to exactly one folder and the folder is a string.
+        Returns a list of folders. The list is obtained from the folder index which counts the tasks in each folder.
+        Each task can belong to exactly one folder and the folder is a string.
 
         Returns:
             List[str]: List of all folders used by all the tasks.
         """
-        folder_set = set()
-        for taskid, task in self.store_dict_id.items():
-            if task.folder:
-                folder_set.add(task.folder)
-        folder_list = sorted(folder_set)
+        self.index_refresh()
+        folder_list = sorted(self.folder_tag_index.folder_name_refcount)
         return folder_list
 
     def get_tag_list(self):
         """
-        Returns a list of tags. The list is obtained by iterating through all tasks in the task store and reading the
-        names of the tags they have set. Each task can have zero or more tags set and each tag is a string.
+        Returns a list of tags. The list is obtained from the tag index which counts the tasks having each tag. Each
+        task can have zero or more tags set and each tag is a string.
 
         Returns:
             List[str]: List of all tags used by all the tasks.
         """
-        tag_set = set()
-        for taskid, task in self.store_dict_id.items():
-            for tag in task.tags:
-                if tag:
-                    tag_set.add(tag)
-        tag_list = sorted(tag_set)
+        self.index_refresh()
+        tag_list = sorted(self.folder_tag_index.tag_name_refcount)
         return tag_list
 
     def get_context_list(self):
@@ -537,9 +2269,56 @@ class TaskStore():
         context_list = sorted(context_set)
         return context_list
 
+    def filter_folder_taskid_set(self, folder):
+        """
+        Returns the unordered set of taskids from the task store which are in the specified folder. The folder name is
+        case-insensitive.
+
+        Args:
+            folder (str): folder
+
+        Returns:
+            Set[str]: taskids from the given folder
+        """
+        self.index_refresh()
+        return set(self.folder_tag_index.taskids_in_folder(folder))
+
+    def filter_tag_taskid_set(self, tag):
+        """
+        Returns the unordered set of taskids from the task store which have the specified tag. The tag name is
+        case-insensitive.
+
+        Args:
+            tag (str): tag
+
+        Returns:
+            Set[str]: taskids for the given tag
+        """
+        self.index_refresh()
+        return set(self.folder_tag_index.taskids_with_tag(tag))
+
+    def filter_search_taskid_set(self, search_text):
+        """
+        Returns the unordered set of taskids from the task store which contain the specified text. Search is
+        case-insensitive.
+
+        Args:
+            search_text (str): case-insensitive text to be searched
+
+        Returns:
+            Set[str]: taskids matching the searched text.
+        """
+        if not config.FULLTEXT_INDEX_ENABLED:
+            search_text = search_text.lower()
+            return {taskid for taskid, task in self.store_dict_id.items()
+                    if FulltextIndex.task_contains(task, search_text)}
+        self.fulltext_index_refresh()
+        return self.fulltext_index.search(search_text, self.store_dict_id)
+
     def filter_folder(self, folder):
         """
-        Returns only those taskids from the task store which are in the specified folder.
+        Returns only those taskids from the task store which are in the specified folder. The folder name is
+        case-insensitive.
 
         Args:
             folder (str): folder
@@ -547,17 +2326,11 @@ class TaskStore():
         Returns:
             List[str]: taskids from the given folder
         """
-        list_taskid_unfiltered = self.sort_taskid_list_descending_lamport()
-        list_taskid_filtered = []
-        for taskid in list_taskid_unfiltered:
-            task = self.store_dict_id[taskid]
-            if task.folder.lower() == folder.lower():
-                list_taskid_filtered.append(task.taskid)
-        return list_taskid_filtered
+        return self.sort_taskid_set_descending_lamport(self.filter_folder_taskid_set(folder))
 
     def filter_tag(self, tag):
         """
-        Returns only those taskids from the task store which have the specified tag.
+        Returns only those taskids from the task store which have the specified tag. The tag name is case-insensitive.
 
         Args:
             tag (str): tag
@@ -565,13 +2338,7 @@ class TaskStore():
         Returns:
             List[str]: taskids for the given tag
         """
-        list_taskid_unfiltered = self.sort_taskid_list_descending_lamport()
-        list_taskid_filtered = []
-        for taskid in list_taskid_unfiltered:
-            task = self.store_dict_id[taskid]
-            if tag.lower() in [tasktag.lower() for tasktag in task.tags]:
-                list_taskid_filtered.append(task.taskid)
-        return list_taskid_filtered
+        return self.sort_taskid_set_descending_lamport(self.filter_tag_taskid_set(tag))
 
     def filter_search(self, search_text):
         """
@@ -583,22 +2350,151 @@ class TaskStore():
         Returns:
             List[str]: taskids matching the searched text.
         """
-        list_taskid_unfiltered = self.sort_taskid_list_descending_lamport()
-        list_taskid_filtered = []
-        for taskid in list_taskid_unfiltered:
-            task = self.store_dict_id[taskid]
-            name_found = search_text.lower() in task.name.lower()
-            body_found = search_text.lower() in task.body.lower()
-            taskid_found = search_text.lower() in task.taskid.lower()
-            due_found = search_text.lower() in task.due_date.lower()
-            created_found = search_text.lower() in task.created_date.lower()
-            changed_found = search_text.lower() in task.changed_date.lower()
-            if name_found or body_found or taskid_found or due_found or created_found or changed_found:
-                list_taskid_filtered.append(task.taskid)
-        return list_taskid_filtered
+        return self.sort_taskid_set_descending_lamport(self.filter_search_taskid_set(search_text))
+
+
+# TaskStoreWriter - writes the files of task stores in a background thread
+##########################################################################
+
+class TaskStoreWriter():
+    def __init__(self, delay=config.BACKGROUND_WRITER_DELAY):
+        """
+        Writes the files of task stores in a background thread, so that saving doesn't delay the caller. The task
+        stores that have it set as their background_writer serialize their data in task_store_save() and the writer
+        runs the prepared file operations in the same order. Waiting journal appends of a task store are merged into
+        one write (and one fsync) and a full save makes the waiting file operations of the task store unnecessary. The
+        writer waits for the given delay after a save so that more saves can be merged, unless someone waits in flush().
+
+        Args:
+            delay (float): How many seconds to wait before writing.
+        """
+        super().__init__()
+        self.delay = delay
+        self.condition = threading.Condition()
+        self.queue = []  # [task_store, file_operation, number of file operations merged into this one]
+        self.file_operations_enqueued = 0
+        self.file_operations_done = 0
+        self.flush_waiting = 0
+        self.stopping = False
+        self.exception = None  # the first error since the last flush(), raised by flush()
+        self.thread = threading.Thread(target=self.run, name="woolnote task store writer", daemon=True)
+        self.thread.start()
+
+    def enqueue(self, task_store, file_operation):
+        """
+        Adds a file operation prepared by task_store_save() to the queue of the writer. If the writer has been stopped,
+        the file operation is run right away.
+
+        Args:
+            task_store (woolnote.task_store.TaskStore): The task store which prepared the file operation.
+            file_operation (tuple): FILE_OPERATION_* followed by its arguments.
+
+        Returns:
+            None:
+        """
+        with self.condition:
+            if not self.stopping:
+                self.file_operations_enqueued += 1
+                queued_same_task_store = [queued for queued in self.queue if queued[0] is task_store]
+                if file_operation[0] == FILE_OPERATION_FULL_SAVE:
+                    # the full file contains everything that is waiting to be written
+                    merged_count = sum(queued[2] for queued in queued_same_task_store)
+                    self.queue = [queued for queued in self.queue if queued[0] is not task_store]
+                    self.queue.append([task_store, file_operation, merged_count + 1])
+                elif (file_operation[0] == FILE_OPERATION_JOURNAL_APPEND and queued_same_task_store
+                      and queued_same_task_store[-1][1][0] == FILE_OPERATION_JOURNAL_APPEND):
+                    queued = queued_same_task_store[-1]
+                    queued[1] = (FILE_OPERATION_JOURNAL_APPEND, queued[1][1] + file_operation[1], queued[1][2])
+                    queued[2] += 1
+                else:
+                    self.queue.append([task_store, file_operation, 1])
+                self.condition.notify_all()
+                return
+        task_store.file_operation_execute(file_operation, in_background=False)
+
+    def run(self):
+        """
+        The loop of the writer's thread. Runs the queued file operations until the writer is stopped and the queue is
+        empty.
+
+        Returns:
+            None:
+        """
+        while True:
+            with self.condition:
+                while not self.queue and not self.stopping:
+                    self.condition.wait()
+                if not self.queue:
+                    return
+                # wait for more saves which can be merged with the queued ones
+                deadline = time.monotonic() + self.delay
+                while not self.flush_waiting and not self.stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                queue = self.queue
+                self.queue = []
+
+            for task_store, file_operation, merged_count in queue:
+                try:
+                    task_store.file_operation_execute(file_operation, in_background=True)
+                except Exception as exc:
+                    util.dbgprint("TaskStoreWriter: cannot write {}: {}".format(task_store.filepath, repr(exc)))
+                    with self.condition:
+                        if self.exception is None:
+                            self.exception = exc
+
+            with self.condition:
+                self.file_operations_done += sum(merged_count for task_store, file_operation, merged_count in queue)
+                self.condition.notify_all()
+
+    def flush(self):
+        """
+        Waits until all file operations that have been enqueued before the call are written to the disk. Raises the
+        first error that occurred in the writer's thread since the last call.
+
+        Returns:
+            None:
+        """
+        with self.condition:
+            file_operations_enqueued = self.file_operations_enqueued
+            self.flush_waiting += 1
+            self.condition.notify_all()
+            try:
+                while self.file_operations_done < file_operations_enqueued:
+                    self.condition.wait()
+            finally:
+                self.flush_waiting -= 1
+            exception = self.exception
+            self.exception = None
+        if exception is not None:
+            raise exception
+
+    def stop(self):
+        """
+        Writes all queued file operations and stops the writer's thread. File operations enqueued afterwards are run
+        right away. Has to be called before the program exits.
+
+        Returns:
+            None:
+        """
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        self.thread.join()
 
 
 class TaskStoreTestingNoWrite(TaskStore):
-    def task_store_save(self, alt_path=None):
-        super().task_store_save(alt_path=alt_path, testing_no_write=True)
+    def task_store_save(self, alt_path=None, compact=False):
+        super().task_store_save(alt_path=alt_path, testing_no_write=True, compact=compact)
+
+    def task_store_backup(self, backup_store, manifest_name):
+        super().task_store_backup(backup_store, manifest_name, testing_no_write=True)
+
+    def task_store_export_zip(self, path, arcname, summary_arcname, compresslevel):
+        return super().task_store_export_zip(path, arcname, summary_arcname, compresslevel, testing_no_write=True)
+
+    def task_store_archive_oldest(self, archive_path, keep_count, archive_batch):
+        super().task_store_archive_oldest(archive_path, keep_count, archive_batch, testing_no_write=True)
 
@@ -0,0 +1,68 @@
+# University of Illinois/NCSA Open Source License
+# Copyright (c) 2018, Jakub Svoboda.
+
+# TODO: docstring for the file
+from woolnote import systemencoding
+import concurrent.futures
+from http.server import HTTPServer
+import ssl
+
+from woolnote import config
+from woolnote import util
+
+
+# HTTP server handling the requests in a thread pool
+####################################################
+
+class ThreadPoolHTTPServer(HTTPServer):
+    def __init__(self, server_address, RequestHandlerClass, executor):
+        """
+        HTTP server whose handle_request() only accepts a connection and hands it over to a thread of the executor,
+        which handles the request (including the TLS handshake of an SSL socket). The request handler has to be safe
+        to use from several threads at once (see the request_lock of get_WebInterfaceHandlerLocal()). The executor
+        can be shared by several servers, its number of threads limits how many requests are handled at once.
+
+        Args:
+            server_address (Tuple[str, int]):
+            RequestHandlerClass (type):
+            executor (concurrent.futures.ThreadPoolExecutor):
+        """
+        super().__init__(server_address, RequestHandlerClass)
+        self.executor = executor
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        """
+        Handles the request in a thread of the executor and closes it.
+
+        Args:
+            request (socket.socket):
+            client_address (Tuple[str, int]):
+
+        Returns:
+            None:
+        """
+        try:
+            # a client that stops responding doesn't keep the thread forever
+            request.settimeout(config.SERVER_REQUEST_TIMEOUT)
+            if isinstance(request, ssl.SSLSocket):
+                request.do_handshake()
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def get_executor():
+    """
+    Returns a new thread pool for ThreadPoolHTTPServer with SERVER_THREAD_POOL_SIZE threads.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor:
+    """
+    util.dbgprint("serving the requests by {} threads".format(config.SERVER_THREAD_POOL_SIZE))
+    return concurrent.futures.ThreadPoolExecutor(max_workers=config.SERVER_THREAD_POOL_SIZE,
+                                                 thread_name_prefix="woolnote-request")
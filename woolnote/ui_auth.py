@@ -3,6 +3,7 @@
 
 # TODO: docstring for the file
 from woolnote import systemencoding
+import threading
 from woolnote import util
 from woolnote import config
 from woolnote import tests
@@ -20,6 +21,8 @@ class WoolnoteUIAuth():
         self.one_time_pwd = util.generate_one_time_pwd()
         self.one_time_pwd_tries_left = 0
         self.ONE_TIME_PWD_TRIES = 5
+        # the one-time password is checked by concurrently handled requests before they take the request lock
+        self.one_time_pwd_lock = threading.Lock()
 
     @tests.integration_method("web_ui")
     def return_cookie_authenticated(self):
@@ -39,9 +42,10 @@ class WoolnoteUIAuth():
         Returns:
             str: The one-time password (e.g. to be displayed to the user over a secure channel (e.g. loopback)).
         """
-        self.one_time_pwd = util.generate_one_time_pwd()
-        self.one_time_pwd_tries_left = self.ONE_TIME_PWD_TRIES
-        return self.one_time_pwd
+        with self.one_time_pwd_lock:
+            self.one_time_pwd = util.generate_one_time_pwd()
+            self.one_time_pwd_tries_left = self.ONE_TIME_PWD_TRIES
+            return self.one_time_pwd
 
     @tests.integration_method("web_ui")
     def check_one_time_pwd(self, user_supplied_pwd):
@@ -56,15 +60,16 @@ class WoolnoteUIAuth():
             bool: Whether the user-supplied password is correct and allowed.
 
         """
-        self.one_time_pwd_tries_left -= 1
-        if self.one_time_pwd_tries_left > 0:
-            ret = util.safe_string_compare(user_supplied_pwd, self.one_time_pwd)
-            if ret is True:  # explicitly checking for boolean True
-                # successful use, prohibit subsequent (e.g. attacker reading screen)
-                self.one_time_pwd_tries_left = 0
-                return True
+        with self.one_time_pwd_lock:
+            self.one_time_pwd_tries_left -= 1
+            if self.one_time_pwd_tries_left > 0:
+                ret = util.safe_string_compare(user_supplied_pwd, self.one_time_pwd)
+                if ret is True:  # explicitly checking for boolean True
+                    # successful use, prohibit subsequent (e.g. attacker reading screen)
+                    self.one_time_pwd_tries_left = 0
+                    return True
+                return False
             return False
-        return False
 
     @tests.integration_method("web_ui")
     def check_permanent_pwd(self, user_supplied_pwd):
@@ -3,12 +3,14 @@
 
 # TODO: docstring for the file
 from woolnote import systemencoding
+import io
 import os
 import copy
+import time
 import zipfile
 from woolnote import config
 from woolnote import util
-from woolnote.task_store import Task, TaskStore, MARKUP, PLAIN
+from woolnote.task_store import Task, TaskStore, MARKUP, PLAIN, SUMMARY_PREFIX_LENGTH
 
 
 # UI backend
@@ -28,6 +30,7 @@ class UIBackend():
         super().__init__()
         self.task_store = task_store
         self.task_store_trash = task_store_trash
+        self.search_query_plan_cache = util.SearchQueryPlanCache(config.SEARCH_QUERY_PLAN_CACHE_SIZE)
 
 
     def helper_sanitize_task_body_before_save(self, task_to_be_updated, tainted_task_body):
@@ -138,7 +141,8 @@ class UIBackend():
         """
 
         Imports notes from the configured path into the task store. Does either differential sync or overwrite all import
-        depending on the argument.
+        depending on the argument. The result is not saved - it is written by the next save of the task stores, so the
+        import can be reverted by quitting woolnote before that (a backup is taken before and after a sync import).
 
         Args:
             replace_local_request (bool): If replace_local_request == True, then the remote database simply replaces the local database.
@@ -147,23 +151,36 @@ class UIBackend():
             Union[str, None]: error message or None if no error
         """
 
+        # the sync compares the notes with the trash
+        self.task_store_trash.deferred_load_run()
+
         self.task_store.task_store_save()
         self.task_store_trash.task_store_save()
+        self.task_store.task_store_flush()
+        self.task_store_trash.task_store_flush()
 
         util.tasks_backup(self.task_store, self.task_store_trash, s="imp0")
 
-        # import the zip into the local directory so that it can be loaded
-        with zipfile.ZipFile(os.path.join(config.PATH_LOAD_DROPBOX_IMPORT, config.FILE_WOOLNOTE_ZIP), "r") as importzip:
-            importzip.extract(config.FILE_WOOLNOTE_DAT, config.PATH_SAVE_DB)  # overwrites
-
         use_task_store = self.task_store
         use_task_store_trash = self.task_store_trash
         use_task_remote_store = TaskStore(os.path.join(config.PATH_SAVE_DB, config.FILE_WOOLNOTE_DAT))
-        use_task_remote_store.task_store_load()
+        # the database is decompressed from the zip straight into the parser, it is never written to the disk
+        with zipfile.ZipFile(os.path.join(config.PATH_LOAD_DROPBOX_IMPORT, config.FILE_WOOLNOTE_ZIP), "r") as importzip:
+            # only the groups of tasks which differ from the exported summary are loaded and compared (the tasks of the
+            # other groups are the same on both sides and unchanged since the export, so they would be left as they are)
+            taskid_prefixes = None
+            if not replace_local_request and config.FILE_WOOLNOTE_SUMMARY in importzip.namelist():
+                with importzip.open(config.FILE_WOOLNOTE_SUMMARY) as summary_file:
+                    remote_summary = TaskStore.summary_deserialize(
+                        io.TextIOWrapper(summary_file, encoding="utf-8", newline="\n"))
+                if remote_summary is not None:
+                    taskid_prefixes = use_task_store.summary_prefixes_differing(remote_summary)
+            with importzip.open(config.FILE_WOOLNOTE_DAT) as remote_file:
+                use_task_remote_store.task_store_load_stream(remote_file, taskid_prefixes=taskid_prefixes)
 
         if replace_local_request:
-            use_task_store.store_dict_id = {}
-            use_task_store.task_store_load(alt_path=os.path.join(config.PATH_SAVE_DB, config.FILE_WOOLNOTE_DAT))
+            use_task_store.remove_all()
+            use_task_store.add_deserialized_task_store(use_task_remote_store)
             use_task_store.update_lamport_clock(use_task_remote_store.export_lamport_clock)
             use_task_store.last_import_lamport_clock = use_task_store.lamport_clock
             return None
@@ -250,6 +267,9 @@ class UIBackend():
 
         # util.dbgprint("set_tasks_local")
         set_tasks_local = set(use_task_store.store_dict_id.keys())
+        if taskid_prefixes is not None:
+            set_tasks_local = {taskid for taskid in set_tasks_local
+                               if taskid[:SUMMARY_PREFIX_LENGTH] in taskid_prefixes}
         # util.dbgprint(str(repr(set_tasks_local)))
         set_tasks_local_processed = set()
         # util.dbgprint("set_tasks_remote")
@@ -300,7 +320,8 @@ class UIBackend():
                 if new_in_remote(task_remote):
                     # -> import
                     use_task_store.add_deserialized(task_remote)  # import
-            set_tasks_remote_processed.add(task_remote.taskid)
+            # taskid and not task_remote.taskid - task_remote is left over from a previous task if this one is processed
+            set_tasks_remote_processed.add(taskid)
 
         # go through unprocessed local tasks, sync them, mark as processed
         for taskid in set_tasks_local:
@@ -315,17 +336,18 @@ class UIBackend():
                 if new_in_local(task_local):
                     # -> do nothing (will be exported to remote on next export)
                     pass
-            set_tasks_local_processed.add(task_local.taskid)
+            set_tasks_local_processed.add(taskid)
 
         util.tasks_backup(self.task_store, self.task_store_trash, s="imp1")
         return None
 
     def export_notes(self):
         """
-        Exports the task store to a file in the configured path.
+        Exports the task store to a file in the configured path. The task store is saved with the changed export
+        timestamps first and then serialized straight into the zip file.
 
         Returns:
-            None:
+            List[Tuple[str, float, int]]: stage name, duration in seconds, bytes written by the stage
         """
 
         util.tasks_backup(self.task_store, self.task_store_trash)
@@ -335,18 +357,21 @@ class UIBackend():
         for taskid, task in self.task_store.store_dict_id.items():
             task.export_lamport_timestamp = self.task_store.export_lamport_clock
 
-        # save the main database
-        self.task_store.task_store_save()
+        # save the main database (the export timestamps have been changed without touching the tasks)
+        time_start = time.perf_counter()
+        self.task_store.task_store_save(compact=True)
         self.task_store_trash.task_store_save()
-
-        # export to .dat file (without ZIP, so to the same path as the main database)
-        self.task_store.task_store_save(alt_path=os.path.join(config.PATH_SAVE_DB, config.FILE_WOOLNOTE_DAT))
-
-        # export the .dat to .zip
-        with zipfile.ZipFile(os.path.join(config.PATH_SAVE_DROPBOX_EXPORT, config.FILE_WOOLNOTE_ZIP), "w",
-                             compression=zipfile.ZIP_DEFLATED) as exportzip:
-            exportzip.write(os.path.join(config.PATH_SAVE_DB, config.FILE_WOOLNOTE_DAT), arcname=config.FILE_WOOLNOTE_DAT,
-                            compress_type=zipfile.ZIP_DEFLATED)
+        self.task_store.task_store_flush()
+        self.task_store_trash.task_store_flush()
+        stats = [("save", time.perf_counter() - time_start, self.task_store.main_file_size)]
+
+        # export to .zip
+        stats.extend(self.task_store.task_store_export_zip(
+            os.path.join(config.PATH_SAVE_DROPBOX_EXPORT, config.FILE_WOOLNOTE_ZIP), config.FILE_WOOLNOTE_DAT,
+            config.FILE_WOOLNOTE_SUMMARY, config.EXPORT_COMPRESSION_LEVEL))
+        for stage, duration, size in stats:
+            util.dbgprint("export {}: {:.3f} s, {} B".format(stage, duration, size))
+        return stats
 
     def delete_taskid(self, task_id_list):
         """
@@ -358,12 +383,16 @@ class UIBackend():
         Returns:
             None:
         """
+        self.task_store_trash.deferred_load_run()
         for taskid in task_id_list:
             task = self.task_store.store_dict_id[taskid]
             self.task_store_trash.add(task)
             self.task_store.remove(taskid)
         self.task_store.task_store_save()
         self.task_store_trash.task_store_save()
+        self.task_store_trash.task_store_archive_oldest(
+            os.path.join(config.PATH_SAVE_DB, config.FILE_TASKS_TRASH_ARCHIVE_DAT), config.TRASH_KEEP_COUNT,
+            config.TRASH_ARCHIVE_BATCH)
 
     def notes_tagdel(self, task_id_list, tagdel):
         """
@@ -381,7 +410,7 @@ class UIBackend():
             task = self.task_store.store_dict_id[taskid]
             if tagdel in task.tags:
                 self.task_store.touch(task.taskid)
-                task.tags.discard(tagdel)
+                task.tags = task.tags - {tagdel}
         self.task_store.task_store_save()
 
     def notes_tagadd(self, task_id_list, tagadd):
@@ -398,7 +427,7 @@ class UIBackend():
         for taskid in task_id_list:
             task = self.task_store.store_dict_id[taskid]
             self.task_store.touch(task.taskid)
-            task.tags.add(tagadd)
+            task.tags = task.tags | {tagadd}
         self.task_store.task_store_save()
 
     def notes_foldermove(self, task_id_list, foldermove):
@@ -431,15 +460,14 @@ class UIBackend():
             used_task_store = self.task_store
         elif task_store_name == "task_store_trash":
             used_task_store = self.task_store_trash
+            used_task_store.deferred_load_run()
         elif task_store_name == None:
             used_task_store = self.task_store
         else:
             raise ValueError("Unknown task store name - {}".format(task_store_name))
 
-        tokens = util.search_expression_tokenizer(search_query)
-        tree_root = util.search_expression_build_ast(tokens)
-        highlight_list = []
-        list_taskid_desc = util.search_expression_execute_ast_node(tree_root, used_task_store,
-                                                                   fulltext_search_strings=highlight_list)
+        # repeated queries (e.g. virtual folders) are parsed only once and evaluated only if the task store changed
+        search_query_plan = self.search_query_plan_cache.get_plan(search_query)
+        list_taskid_desc, highlight_list = search_query_plan.execute(used_task_store)
 
         return list_taskid_desc, highlight_list
@@ -5,13 +5,21 @@
 from woolnote import systemencoding
 import random
 import html
+import collections
+import contextlib
+import threading
 import time
 import os
+import gzip
 import hashlib
+import zlib
 
 from woolnote import config
 from woolnote import tests
 
+# the first bytes of a gzip-compressed file
+GZIP_MAGIC = b"\x1f\x8b"
+
 # debug output can be toggled with debug_print for the whole file
 debug_print = True
 
@@ -58,8 +66,6 @@ def search_expression_tokenizer(filter_expression):
     Returns:
         List[Tuple[str, str]]:
     """
-    dbgprint("dbg search_expression_tokenizer start")
-    dbgprint("filter string: " + repr(filter_expression) + " " + str(type(filter_expression)))
     # valid queries:
     # single fulltext search string that (contains) "special" characters but not at the beginning
     # ("query that uses a special character at the beginning - the first special char encloses the query)
@@ -190,8 +196,6 @@ def search_expression_tokenizer(filter_expression):
     # the expression may have ended with the search string and it may need to be commited
     commit_search_string_to_tokens()
 
-    dbgprint("tokens: " + repr(tokens))
-
     if search_expression_validate_token_list(tokens):
         return tokens
 
@@ -213,7 +217,6 @@ def search_expression_validate_token_list(tokens):
     state_operator_argument_required = False
     opening_operators = {} # tracks which operators (and, or) are used on which levels of state_inside_OPENING
     for (token_type, token_content) in tokens:
-        dbgprint("validate dbg: {} {}".format(token_type, token_content))
         if token_type == "SEARCH_STRING":
             if prev_token_type == "SEARCH_STRING":
                 raise Exception("two SEARCH_STRING in succession. Problematic content: {}".format(token_content))
@@ -278,12 +281,13 @@ def search_expression_validate_token_list(tokens):
     return True
 
 
-def search_expression_build_ast(tokens):
+def search_expression_build_ast(tokens, tokens_validated=False):
     """
     Builds AST from the tokens and returns the root of the AST or raises an exception if the supplied tokens are invalid.
 
     Args:
         tokens (List[Tuple[str, str]]):
+        tokens_validated (bool): True if the tokens have already been validated (search_expression_tokenizer() does it)
 
     Returns:
         woolnote.util.Search_AST_Node:
@@ -310,19 +314,16 @@ def search_expression_build_ast(tokens):
     execute_root.content = None
 
     # raises an exception if invalid
-    search_expression_validate_token_list(tokens)
+    if not tokens_validated:
+        search_expression_validate_token_list(tokens)
 
     for (token_type, token_content) in tokens:
-        dbgprint("ast dbg: {} {}".format(token_type, token_content))
         if token_type == "SEARCH_STRING":
             current_position.type = token_type
             current_position.content = token_content
         elif token_type == "CTRL_SEQ_CLOSING":
-            dbgprint("ast dbg closing")
             while current_position.type != "CTRL_SEQ_OPENING":
-                dbgprint("ast dbg closing while {}".format(current_position.type))
                 current_position = current_position.parent
-            dbgprint("ast dbg closed after while {}".format(current_position.type))
             current_position.type = "CTRL_SEQ_CLOSED"
         elif token_type == "CTRL_SEQ_OPERATOR":
             if token_content == "not":
@@ -376,8 +377,6 @@ def search_expression_build_ast(tokens):
         else:
             raise Exception("unknown token type: {}".format(repr(token_type)))
 
-    dbgprint(execute_root.toString())
-
     # basic sanity check
     if execute_root.type != "EXEC_ROOT":
         raise Exception("search_expression_build_ast failed for: {}".format(repr(tokens)))
@@ -389,9 +388,12 @@ def search_expression_build_ast(tokens):
 
 @tests.integration_function("util")
 def search_expression_execute_ast_node(ast_node, task_store, search_type=None, fulltext_search_strings=None, fulltext_search_strings_excluded=None):
-    # TODO: docstring
-    # TODO doscstring about fulltext_search_strings changing the return value
     """
+    Executes the AST of a search expression on the task store and returns the matching taskids sorted by lamport clock
+    in descending order. The whole tree is evaluated on sets of taskids and the result is sorted only once.
+
+    If fulltext_search_strings is a list, all fulltext search strings that should be highlighted in the results are
+    appended to it (and those from negated partial search filters to fulltext_search_strings_excluded).
 
     Args:
         ast_node (woolnote.util.Search_AST_Node):
@@ -403,84 +405,236 @@ def search_expression_execute_ast_node(ast_node, task_store, search_type=None, f
     Returns:
         List[str]:
     """
-    # fulltext_search_strings is None or list. if it is list, then all fulltext search strings will be appended to it
-    # works correctly only on EXEC_ROOT for end user
-    # recognized types of tokens:
-    # EXEC_ROOT
-    # SEARCH_STRING
-    # CTRL_SEQ_OPERATOR
-    # CTRL_SEQ_SEARCH_TYPE
-    # CTRL_SEQ_CLOSED
     if fulltext_search_strings is not None and fulltext_search_strings_excluded is None:
         # so that if the caller is interested only in the first array, the internal logic of swapping on 'not' still works
         fulltext_search_strings_excluded = []
     if ast_node.type == "EXEC_ROOT":
-        unsorted_list = search_expression_execute_ast_node(ast_node.children[0], task_store,
-                                                           fulltext_search_strings=fulltext_search_strings,
-                                                           fulltext_search_strings_excluded=fulltext_search_strings_excluded)
-        sorted_list = task_store.sort_taskid_list_descending_lamport_helper(list(set(unsorted_list)))
-        return sorted_list
-    elif ast_node.type == "SEARCH_STRING":
-        if search_type is None:
-            if fulltext_search_strings is not None:
-                fulltext_search_strings.append(ast_node.content)
-            return task_store.filter_search(ast_node.content)
-        elif search_type == "fulltext:":
+        ast_node = ast_node.children[0]
+    taskid_set = search_expression_execute_ast_node_taskid_set(ast_node, task_store, search_type=search_type,
+                                                               fulltext_search_strings=fulltext_search_strings,
+                                                               fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+    if taskid_set is None:
+        # bad input
+        return None
+    return task_store.sort_taskid_set_descending_lamport(taskid_set)
+
+
+def search_expression_execute_ast_node_taskid_set(ast_node, task_store, search_type=None, fulltext_search_strings=None, fulltext_search_strings_excluded=None):
+    """
+    Executes the AST of a search expression (without the EXEC_ROOT node) and returns an unordered set of the matching
+    taskids. The nodes are visited in the same order as by the previous list-based executor, so that the fulltext
+    search strings are collected in the same order.
+
+    Args:
+        ast_node (woolnote.util.Search_AST_Node):
+        task_store (woolnote.task_store.TaskStore):
+        search_type (Union[None, str]):
+        fulltext_search_strings (Union[None, List]): Fulltext strings to be highlighted in the text.
+        fulltext_search_strings_excluded (Union[None, List]): Fulltext strings to be highlighted in the text according to the partial search filter that has been negated.
+
+    Returns:
+        Union[None, Set[str]]: None for bad input
+    """
+    if ast_node.type == "SEARCH_STRING":
+        if search_type is None or search_type == "fulltext:":
             if fulltext_search_strings is not None:
                 fulltext_search_strings.append(ast_node.content)
-            return task_store.filter_search(ast_node.content)
+            return task_store.filter_search_taskid_set(ast_node.content)
         elif search_type == "folder:":
-            return task_store.filter_folder(ast_node.content)
+            return task_store.filter_folder_taskid_set(ast_node.content)
         elif search_type == "tag:":
-            return task_store.filter_tag(ast_node.content)
+            return task_store.filter_tag_taskid_set(ast_node.content)
         else:
             return None
     elif ast_node.type == "CTRL_SEQ_OPERATOR":
-        if ast_node.content == "and":
-            list1 = search_expression_execute_ast_node(ast_node.children[0], task_store, search_type=search_type,
-                                                       fulltext_search_strings=fulltext_search_strings,
-                                                       fulltext_search_strings_excluded=fulltext_search_strings_excluded)
-            list2 = search_expression_execute_ast_node(ast_node.children[1], task_store, search_type=search_type,
-                                                       fulltext_search_strings=fulltext_search_strings,
-                                                       fulltext_search_strings_excluded=fulltext_search_strings_excluded)
-            and_list = []
-            for item in list1:
-                if item in list2:
-                    and_list.append(item)
-            sorted_and_list = task_store.sort_taskid_list_descending_lamport_helper(list(set(and_list)))
-            return sorted_and_list
-        elif ast_node.content == "or":
-            list1 = search_expression_execute_ast_node(ast_node.children[0], task_store, search_type=search_type,
-                                                       fulltext_search_strings=fulltext_search_strings,
-                                                       fulltext_search_strings_excluded=fulltext_search_strings_excluded)
-            list2 = search_expression_execute_ast_node(ast_node.children[1], task_store, search_type=search_type,
-                                                       fulltext_search_strings=fulltext_search_strings,
-                                                       fulltext_search_strings_excluded=fulltext_search_strings_excluded)
-            or_list = list(set(list1 + list2))
-            sorted_or_list = task_store.sort_taskid_list_descending_lamport_helper(or_list)
-            return sorted_or_list
-        elif ast_node.content == "not":
+        if ast_node.content == "not":
             # On each 'not', the two array references for fulltext search strings are switched over - that way they are
             # correctly added in even-numbered nested 'not's.
-            list1 = search_expression_execute_ast_node(ast_node.children[0], task_store, search_type=search_type,
-                                                       fulltext_search_strings=fulltext_search_strings_excluded,
-                                                       fulltext_search_strings_excluded=fulltext_search_strings)
-            list2 = task_store.sort_taskid_list_descending_lamport()
-            sorted_not_list = [x for x in list2 if x not in list1]
-            return sorted_not_list
+            set1 = search_expression_execute_ast_node_taskid_set(ast_node.children[0], task_store,
+                                                                 search_type=search_type,
+                                                                 fulltext_search_strings=fulltext_search_strings_excluded,
+                                                                 fulltext_search_strings_excluded=fulltext_search_strings)
+            if set1 is None:
+                return None
+            return task_store.store_dict_id.keys() - set1
+        elif ast_node.content in ("and", "or"):
+            # both operands are always evaluated so that all fulltext search strings are collected
+            set1 = search_expression_execute_ast_node_taskid_set(ast_node.children[0], task_store,
+                                                                 search_type=search_type,
+                                                                 fulltext_search_strings=fulltext_search_strings,
+                                                                 fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+            set2 = search_expression_execute_ast_node_taskid_set(ast_node.children[1], task_store,
+                                                                 search_type=search_type,
+                                                                 fulltext_search_strings=fulltext_search_strings,
+                                                                 fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+            if set1 is None or set2 is None:
+                return None
+            if ast_node.content == "and":
+                return set1 & set2
+            return set1 | set2
+        else:
+            return None
     elif ast_node.type == "CTRL_SEQ_SEARCH_TYPE":
-        return search_expression_execute_ast_node(ast_node.children[0], task_store, search_type=ast_node.content,
-                                                  fulltext_search_strings=fulltext_search_strings,
-                                                  fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+        return search_expression_execute_ast_node_taskid_set(ast_node.children[0], task_store,
+                                                             search_type=ast_node.content,
+                                                             fulltext_search_strings=fulltext_search_strings,
+                                                             fulltext_search_strings_excluded=fulltext_search_strings_excluded)
     elif ast_node.type == "CTRL_SEQ_CLOSED":
-        return search_expression_execute_ast_node(ast_node.children[0], task_store, search_type=search_type,
-                                                  fulltext_search_strings=fulltext_search_strings,
-                                                  fulltext_search_strings_excluded=fulltext_search_strings_excluded)
+        return search_expression_execute_ast_node_taskid_set(ast_node.children[0], task_store, search_type=search_type,
+                                                             fulltext_search_strings=fulltext_search_strings,
+                                                             fulltext_search_strings_excluded=fulltext_search_strings_excluded)
     else:
         # bad input
         return None
 
 
+# compiled search expressions
+#############################
+
+class SearchQueryPlan():
+    """Parsed search expression, caches its last result for each task store."""
+
+    def __init__(self, search_expression):
+        """
+        Parses the search expression into its AST, which is then executed by search_expression_execute_ast_node().
+        Raises an exception if the search expression is invalid.
+
+        Args:
+            search_expression (str): Search query in the language of search_expression_tokenizer().
+        """
+        super().__init__()
+        self.search_expression = search_expression
+        tokens = search_expression_tokenizer(search_expression)
+        self.tree_root = search_expression_build_ast(tokens, tokens_validated=True)
+        # dict[TaskStore, Tuple[version of the task store, Union[None, List[str]], List[str]]]
+        self.result_cache = {}
+
+    def execute(self, task_store):
+        """
+        Returns the taskids from the task store matching the search expression sorted by lamport clock in descending
+        order and the fulltext search strings to be highlighted (see search_expression_execute_ast_node()). The result
+        is reused until the task store changes.
+
+        Args:
+            task_store (woolnote.task_store.TaskStore):
+
+        Returns:
+            Tuple[Union[None, List[str]], List[str]]: None instead of the taskids for bad input
+        """
+        version = task_store.get_version()
+        cached = self.result_cache.get(task_store)
+        if cached is None or cached[0] != version:
+            fulltext_search_strings = []
+            list_taskid_desc = search_expression_execute_ast_node(self.tree_root, task_store,
+                                                                  fulltext_search_strings=fulltext_search_strings)
+            cached = (version, list_taskid_desc, fulltext_search_strings)
+            self.result_cache[task_store] = cached
+        list_taskid_desc = None if cached[1] is None else list(cached[1])
+        return list_taskid_desc, list(cached[2])
+
+
+class SearchQueryPlanCache():
+    """Bounded cache of parsed search expressions, evicts the least recently used ones."""
+
+    def __init__(self, max_size):
+        """
+        Args:
+            max_size (int): maximum number of cached search expressions
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.plans = collections.OrderedDict()  # search expression -> SearchQueryPlan
+        self.plans_lock = threading.Lock()  # the plans are looked up by concurrently handled requests
+
+    def get_plan(self, search_expression):
+        """
+        Returns the parsed search expression, parses it if it is not cached. Raises an exception if the search
+        expression is invalid (invalid expressions are not cached).
+
+        Args:
+            search_expression (str): Search query in the language of search_expression_tokenizer().
+
+        Returns:
+            woolnote.util.SearchQueryPlan:
+        """
+        with self.plans_lock:
+            plan = self.plans.get(search_expression)
+            if plan is not None:
+                self.plans.move_to_end(search_expression)
+                return plan
+        plan = SearchQueryPlan(search_expression)
+        with self.plans_lock:
+            self.plans[search_expression] = plan
+            if len(self.plans) > self.max_size:
+                self.plans.popitem(last=False)
+        return plan
+
+
+# reader-writer lock
+####################
+
+class ReadWriteLock():
+    """Lock that is held either by any number of readers or by one writer, waiting writers go first."""
+
+    def __init__(self):
+        """
+        Creates an unlocked lock. A reader waits while a writer holds the lock or waits for it, so that a steady stream
+        of readers cannot keep the writers waiting forever. The lock is not reentrant.
+        """
+        super().__init__()
+        self.condition = threading.Condition(threading.Lock())
+        self.readers = 0  # number of readers holding the lock
+        self.writer = False  # whether a writer holds the lock
+        self.writers_waiting = 0
+
+    def acquire_read(self):
+        with self.condition:
+            while self.writer or self.writers_waiting:
+                self.condition.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self.condition:
+            self.readers -= 1
+            if not self.readers:
+                self.condition.notify_all()
+
+    def acquire_write(self):
+        with self.condition:
+            self.writers_waiting += 1
+            while self.writer or self.readers:
+                self.condition.wait()
+            self.writers_waiting -= 1
+            self.writer = True
+
+    def release_write(self):
+        with self.condition:
+            self.writer = False
+            self.condition.notify_all()
+
+    @contextlib.contextmanager
+    def reading(self):
+        """
+        Holds the lock as a reader in the with statement.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextlib.contextmanager
+    def writing(self):
+        """
+        Holds the lock as the writer in the with statement.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
 # helper functions for core functionality and web backend & frontend
 ####################################################################
 
@@ -1152,24 +1306,167 @@ def safe_string_compare(string1, string2):
     return hash1 == hash2
 
 
+def fsync_directory(path):
+    """
+    Makes sure that the creation, renaming or deletion of files in the given directory is written to the disk. Does
+    nothing on platforms which don't support opening directories.
+
+    Args:
+        path (str): Path of the directory ("" for the working directory).
+
+    Returns:
+        None:
+    """
+    try:
+        dir_fd = os.open(path or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def write_file_atomically(path, text_chunks, binary=False, sync=True, compresslevel=None):
+    """
+    Writes the text into a temporary file next to the given path, makes sure it is on the disk and renames it to the
+    given path. The file at the given path therefore always contains either the old or the new text in its entirety,
+    even if the program is killed or the device loses power.
+
+    Args:
+        path (str): Path of the file to replace.
+        text_chunks (Union[List[str], List[bytes]]): The new contents of the file, written one chunk after another.
+        binary (bool): The chunks are bytes instead of text.
+        sync (bool): Make sure the file is on the disk. Otherwise, the caller has to do that (e.g. for many files at
+                     once) before relying on the file.
+        compresslevel (Union[int, None]): If not None, the file is compressed by gzip with this level (1-9), see
+                                          open_text_file().
+
+    Returns:
+        None:
+    """
+    path_temp = path + config.TEMP_EXTENSION
+    if binary or compresslevel is not None:
+        open_temp_file = lambda: open(path_temp, "wb")
+    else:
+        open_temp_file = lambda: open(path_temp, "w", encoding="utf-8", newline="\n")
+    with open_temp_file() as temp_file:
+        if compresslevel is None:
+            temp_file.writelines(text_chunks)
+        else:
+            # the gzip format (with no file name and mtime, so the same text always gives the same file)
+            compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            for chunk in text_chunks:
+                temp_file.write(compressor.compress(chunk if binary else chunk.encode("utf-8")))
+            temp_file.write(compressor.flush())
+        if sync:
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+    os.replace(path_temp, path)
+    if sync:
+        fsync_directory(os.path.dirname(path))
+
+
+def file_is_compressed(path):
+    """
+    Returns whether the file at the given path is compressed by gzip (it starts with the gzip magic bytes).
+
+    Args:
+        path (str):
+
+    Returns:
+        bool:
+    """
+    with open(path, "rb") as checked_file:
+        return checked_file.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+
+
+def open_text_file(path):
+    """
+    Opens the text file at the given path for reading, decompressing it if it has been compressed by gzip (see
+    write_file_atomically()), so that the plain and the compressed files can be read alike.
+
+    Args:
+        path (str):
+
+    Returns:
+        io.TextIOBase:
+    """
+    if file_is_compressed(path):
+        return gzip.open(path, "rt", encoding="utf-8", newline="\n")
+    return open(path, "r", encoding="utf-8", newline="\n")
+
+
+def http_content_encoding_accepted(accept_encoding):
+    """
+    Returns the content coding of a response by which a client with the given Accept-Encoding header wants it to be
+    compressed. gzip is preferred to deflate, the codings with q=0 are not accepted.
+
+    Args:
+        accept_encoding (Union[None, str]): The value of the Accept-Encoding header.
+
+    Returns:
+        Union[None, str]: "gzip", "deflate" or None if the response shouldn't be compressed.
+    """
+    if not accept_encoding:
+        return None
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        qvalue = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[coding.strip().lower()] = qvalue
+    for coding in ("gzip", "deflate"):
+        if qvalues.get(coding, qvalues.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def http_content_compress(content, content_encoding):
+    """
+    Compresses the body of a response with HTTP_COMPRESSION_LEVEL.
+
+    Args:
+        content (bytes):
+        content_encoding (str): "gzip" or "deflate" (zlib format, like the HTTP content coding)
+
+    Returns:
+        bytes:
+    """
+    if content_encoding == "gzip":
+        # no mtime, so the same content is always compressed the same way
+        return gzip.compress(content, compresslevel=config.HTTP_COMPRESSION_LEVEL, mtime=0)
+    return zlib.compress(content, config.HTTP_COMPRESSION_LEVEL)
+
+
 def tasks_backup(task_store, task_store_trash, s=None):
-    # TODO: docstring
     """
+    Creates a backup of the internal task database and trash in the backup directory. Only the tasks that are not in
+    any previous backup are written, see task_backup.TaskBackupStore. The optional s parameter allows appending a
+    string to the names of the backups.
 
     Args:
         task_store (woolnote.task_store.TaskStore):
         task_store_trash (woolnote.task_store.TaskStore):
-        s (Union[None, None, None, str, None, None, None, None, None, None, None, None, None]):
+        s (Union[None, str]):
 
     Returns:
         None:
     """
-    #"""Creates a backup of the internal task database and trash. The optional s parameter allows appending a string to the file names of the backup."""
+    # imported here because task_backup imports util
+    from woolnote import task_backup
     timestamp = current_timestamp().replace(":", "-").replace(" ", "_")
     if s is not None:
         timestamp += "_" + str(s)
-    task_store.task_store_save(
-        alt_path=os.path.join(config.PATH_SAVE_DB_BACKUP, "woolbackup_" + timestamp + "_" + config.FILE_TASKS_DAT))
-    task_store_trash.task_store_save(
-        alt_path=os.path.join(config.PATH_SAVE_DB_BACKUP, "woolbackup_" + timestamp + "_" + config.FILE_TASKS_TRASH_DAT))
+    backup_store = task_backup.backup_store_get(config.PATH_SAVE_DB_BACKUP)
+    task_store.task_store_backup(backup_store, "woolbackup_" + timestamp + "_" + config.FILE_TASKS_DAT)
+    task_store_trash.task_store_backup(backup_store, "woolbackup_" + timestamp + "_" + config.FILE_TASKS_TRASH_DAT)
 
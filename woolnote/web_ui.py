@@ -5,7 +5,9 @@
 # TODO: think about moving functionality to backend
 
 from woolnote import systemencoding
+import collections
 import hashlib
+import threading
 
 from woolnote import util
 from woolnote import config
@@ -14,6 +16,40 @@ from woolnote.task_store import Task
 from woolnote import tests
 
 
+# Web UI request and session
+############################
+
+class WebUISession():
+    def __init__(self):
+        """
+        The state that the web ui keeps for one client from one request to the next one - the messages to be
+        displayed and the history of the visited lists of notes.
+        """
+        super().__init__()
+        self.error_msg_queue_list = []  # error messages to be displayed on a task list
+        self.error_msg_queue_note = []  # error messages to be displayed on a note
+
+        # history of visited paths so that a "back" link can be provided
+        self.history_dict_of_links = {}
+
+
+class WebUIRequest():
+    def __init__(self, post_data_dict, get_dict, session):
+        """
+        The data of one request for the methods of the web ui, which get it as their first argument. Nothing about the
+        request is stored in the web ui itself, so that it can handle several requests at once.
+
+        Args:
+            post_data_dict (Union[Dict, Dict[str, List[str]]]):
+            get_dict (Dict[str, List[str]]):
+            session (woolnote.web_ui.WebUISession): The session of the client which has sent the request.
+        """
+        super().__init__()
+        self.post_data_dict = post_data_dict
+        self.get_dict = get_dict
+        self.session = session
+
+
 # Web UI frontend
 #################
 
@@ -23,11 +59,11 @@ class WebUI():
         Web UI that uses the specified ui_backend (which performs most data manipulation), the specified task stores
         for storing the data, the specified ui_auth for performing authentication actions, and the specified
         woolnote_config holding configuration for the whole program.
-        The web ui is to be used by a server that correctly sets the properties self.last_request_post_data_dict,
-        self.last_request_get_dict using the method set_last_request() before calling a method of the web ui. The server
-        can also use the method get_last_get_request_from_history_id() to retrieve an older set of get request data to
-        inject them back into set_last_request() and effectively go back in history (the server has to pay attention
-        from which pages to which pages it is valid to go to and this is currently not documented).
+        The web ui is to be used by a server that passes the data of the request being handled as a WebUIRequest to
+        the methods of the web ui, with the client's session from session_get(). The server can also use the method
+        get_last_get_request_from_history_id() to retrieve an older set of get request data to put them into a new
+        WebUIRequest and effectively go back in history (the server has to pay attention from which pages to which
+        pages it is valid to go to and this is currently not documented).
 
         Args:
             task_store (woolnote.task_store.TaskStore):
@@ -38,14 +74,11 @@ class WebUI():
         """
         super().__init__()
 
-        # history_back gets the proper history hash (history_id) so that it uses that instead
-        self.last_request_post_data_dict = {}
-        self.last_request_get_dict = {}
-        self.error_msg_queue_list = []  # error messages to be displayed on a task list
-        self.error_msg_queue_note = []  # error messages to be displayed on a note
-
-        # history of visited paths so that a "back" link can be provided
-        self.last_history_dict_of_links = {}
+        # the sessions of the clients by session id, the least recently used ones are dropped first
+        self.sessions = collections.OrderedDict()
+        self.sessions_lock = threading.Lock()
+        # used for the requests without a session, e.g. by clients that don't keep cookies
+        self.session_default = WebUISession()
 
         # this is used for permanent actions like delete so that get requests with permanent effects cannot be cached and mistakenly used in other sessions
         self.sess_action_auth = util.create_random_id()  # create a new random auth string
@@ -60,31 +93,48 @@ class WebUI():
         self.woolnote_config = woolnote_config
         self.ui_auth = ui_auth
 
-    @tests.integration_method("web_ui")
-    def set_last_request(self, postdict, getdict):
+    def session_get(self, session_id):
         """
-        To be used by the http request handler before calling any methods for a new request.
-
-        The web ui is to be used by a server that correctly sets the properties self.last_request_post_data_dict,
-        self.last_request_get_dict using the method set_last_request() before calling a method of the web ui.
+        To be used by the http request handler to get the session of the client which has sent the request. Returns
+        the default session for None.
 
         Args:
-            postdict (Union[Dict, Dict[str, List[str]]]):
-            getdict (Dict[str, List[str]]):
+            session_id (Union[None, str]): The session id the client has got from session_create().
 
         Returns:
-            None:
+            Union[None, woolnote.web_ui.WebUISession]: None if there is no such session (anymore).
         """
-        self.last_request_post_data_dict = postdict
-        self.last_request_get_dict = getdict
+        if session_id is None:
+            return self.session_default
+        with self.sessions_lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                self.sessions.move_to_end(session_id)
+            return session
+
+    def session_create(self):
+        """
+        To be used by the http request handler for a client without a session. Creates a new session and drops the
+        least recently used one if there are more than WEB_UI_SESSION_COUNT_MAX sessions.
+
+        Returns:
+            str: The id of the new session, to be given to the client.
+        """
+        session_id = util.create_random_id()
+        with self.sessions_lock:
+            self.sessions[session_id] = WebUISession()
+            if len(self.sessions) > config.WEB_UI_SESSION_COUNT_MAX:
+                self.sessions.popitem(last=False)
+        return session_id
 
     @tests.integration_method("web_ui")
-    def get_last_get_request_from_history_id(self, id):
+    def get_last_get_request_from_history_id(self, request, id):
         """
         To be used by the http request handler to go back in request history. Returns a dict of GET request keys and
         values associated with the provided history ID. History ID is a hash of the request keys and values of interest.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             id (str): History id where to go to.
 
         Returns:
@@ -92,14 +142,20 @@ class WebUI():
 
         """
         # - to be used by the http request handler to go back in request history
-        return self.last_history_dict_of_links[id].copy()
+        history_dict_of_links = request.session.history_dict_of_links
+        if id not in history_dict_of_links:
+            # the history ids are hashes of the saved data, so the links from the pages displayed before the client
+            # has got its session are in the default session
+            history_dict_of_links = self.session_default.history_dict_of_links
+        return history_dict_of_links[id].copy()
 
     @tests.integration_method("web_ui")
-    def save_history(self, req_keys_to_save, alt_task_store_name=None):
+    def save_history(self, request, req_keys_to_save, alt_task_store_name=None):
         """
         To be used by the other methods in this class - the methods that display a listing of notes, so that notes can go back to the same listing.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             req_keys_to_save (Union[List[str], List]):
             alt_task_store_name (Union[None, str]):
 
@@ -107,7 +163,7 @@ class WebUI():
             str: history_id
         """
         history_id = "main_list"  # fallback string
-        _hd = self.last_request_get_dict
+        _hd = request.get_dict
         _hk = req_keys_to_save
         _lhgd = {k: _hd[k] for k in _hd if k in _hk}
         if _lhgd:
@@ -115,78 +171,89 @@ class WebUI():
                 _lhgd.update({"alt_task_store_name": [alt_task_store_name]})
             # save only if the dict is nonempty, so that favicon.ico does not overwrite it
             history_id = hashlib.sha256(repr(_lhgd).encode("utf-8")).hexdigest()
-            self.last_history_dict_of_links[history_id] = _lhgd
+            request.session.history_dict_of_links[history_id] = _lhgd
         return history_id
 
     @tests.integration_method("web_ui")
-    def helper_convert_msg_queue_list_to_list_for_output(self):
+    def helper_convert_msg_queue_list_to_list_for_output(self, request):
         """
         Creates a new static list of warnings collected so far, empties the list.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             List[str]: List of warnings.
         """
         result = []
-        if self.error_msg_queue_list:
+        if request.session.error_msg_queue_list:
             # this order of reference shuffling ensures that a race condition doesn't result in lost messages in the oddball case these variables are also edited in a different true thread
-            msg_list = self.error_msg_queue_list
-            self.error_msg_queue_list = []
+            msg_list = request.session.error_msg_queue_list
+            request.session.error_msg_queue_list = []
             result = [str(x) for x in msg_list]
         return result
 
     @tests.integration_method("web_ui")
-    def helper_convert_msg_queue_note_to_list_for_output(self):
+    def helper_convert_msg_queue_note_to_list_for_output(self, request):
         """
         Creates a new static list of warnings collected so far, empties the list.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             List[str]: List of warnings.
         """
         result = []
-        if self.error_msg_queue_note:
+        if request.session.error_msg_queue_note:
             # this order of reference shuffling ensures that a race condition doesn't result in lost messages in the oddball case these variables are also edited in a different true thread
-            msg_list = self.error_msg_queue_note
-            self.error_msg_queue_note = []
+            msg_list = request.session.error_msg_queue_note
+            request.session.error_msg_queue_note = []
             result = [str(x) for x in msg_list]
         return result
 
 
     @tests.integration_method("web_ui")
-    def helper_sessactionauth_is_wrong(self):
+    def helper_sessactionauth_is_wrong(self, request):
         """
         Gets the GET value sessactionauth and finds out whether it is wrong
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             bool: True if sessactionauth is wrong
         """
-        wrong = not util.safe_string_compare(self.sess_action_auth, self.last_request_get_dict["sessactionauth"][0])
+        wrong = not util.safe_string_compare(self.sess_action_auth, request.get_dict["sessactionauth"][0])
         if wrong:
-            util.dbgprint("sessactionauth is wrong - {}".format(self.last_request_get_dict["sessactionauth"][0]))
+            util.dbgprint("sessactionauth is wrong - {}".format(request.get_dict["sessactionauth"][0]))
         return wrong
 
     @tests.integration_method("web_ui")
-    def helper_action_get_request_is_wrong(self, action_name):
+    def helper_action_get_request_is_wrong(self, request, action_name):
         """
         Gets the GET value "action" and finds out whether it is wrong
         Throws an exception if the data don't exist so that the exception bubbles up.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             action_name (string): The action string that is expected to be right
 
         Returns:
             bool: True if the provided action name and the contents of the action dictionary key differ
         """
-        wrong = not util.safe_string_compare(action_name, self.last_request_get_dict["action"][0])
+        wrong = not util.safe_string_compare(action_name, request.get_dict["action"][0])
         return wrong
 
     @tests.integration_method("web_ui")
-    def helper_action_post_request_is_wrong(self, action_name, dict_key=None):
+    def helper_action_post_request_is_wrong(self, request, action_name, dict_key=None):
         """
         Gets the POST value "action" and finds out whether it is wrong
         Doesn't throw an exception if the data don't exist becacuse it is sometimes expected that they don't and so
         it just returns True.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             action_name (string): The action string that is expected to be right
             dict_key (string): Alternative dictionary string to use (instead of "action")
 
@@ -196,42 +263,44 @@ class WebUI():
         try:
             if dict_key is None:
                 dict_key = "action"
-            wrong = not util.safe_string_compare(action_name, self.last_request_post_data_dict[dict_key][0])
+            wrong = not util.safe_string_compare(action_name, request.post_data_dict[dict_key][0])
             return wrong
         except:
             return True
 
 
     @tests.integration_method("web_ui")
-    def helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(self, key_name):
+    def helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(self, request, key_name):
         """
         Returns either the first GET value of the specified key or (if it doesnt exist) None.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             key_name (str): Key of the GET value.
 
         Returns:
             Union[str, None]: Either the first GET value of the specified key or (if it doesnt exist) None.
         """
         try:
-            return self.last_request_get_dict[key_name][0]
+            return request.get_dict[key_name][0]
         except:
             return None
 
 
     @tests.integration_method("web_ui")
-    def helper_retrieve_last_request_post_dict_key_val_index_zero_or_return_none(self, key_name):
+    def helper_retrieve_last_request_post_dict_key_val_index_zero_or_return_none(self, request, key_name):
         """
         Returns either the first POST value of the specified key or (if it doesnt exist) None.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             key_name (str): Key of the POST value.
 
         Returns:
             Union[str, None]: Either the first POST value of the specified key or (if it doesnt exist) None.
         """
         try:
-            return self.last_request_post_data_dict[key_name][0]
+            return request.post_data_dict[key_name][0]
         except:
             return None
 
@@ -273,19 +342,25 @@ class WebUI():
         return False
 
     @tests.integration_method("web_ui")
-    def helper_get_alt_task_store_name(self):
+    def helper_get_alt_task_store_name(self, request):
         """
         Returns alt_task_store_name if present in the get data or None if not present.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None: alt_task_store_name if present in the get data or None if not present.
         """
-        return self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("alt_task_store_name")
+        return self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "alt_task_store_name")
 
     @tests.integration_method("web_ui")
-    def req_display_otp(self):
+    def req_display_otp(self, request):
         """
-        Puts a new generated one-time password to the self.error_msg_queue_list so that it is displayed.
+        Puts a new generated one-time password to the session's error_msg_queue_list so that it is displayed.
+
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
 
         Returns:
             None:
@@ -293,28 +368,29 @@ class WebUI():
 
         ret = self.ui_auth.create_new_one_time_pwd()
         if ret is not None:
-            self.error_msg_queue_list.append(ret)
+            request.session.error_msg_queue_list.append(ret)
 
     @tests.integration_method("web_ui")
-    def helper_save_task_itself_from_req(self, task):
+    def helper_save_task_itself_from_req(self, request, task):
         """
         Reads data for a new/saved note from POST data, performs sanitization, and correctly saves the data to a note
         (that also entails resetting the reminder flag if due date changes, correctly processing body text based on
         formatting used, setting the correct values for the formatting property)
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             task (woolnote.task_store.Task): Task into which POST data are saved.
 
         Returns:
             None:
         """
-        tainted_task_name = self.last_request_post_data_dict.get("taskname", [config.DEFAULT_TASKNAME])[0]
-        tainted_task_folder = self.last_request_post_data_dict.get("taskfolder", [config.DEFAULT_FOLDER])[0]
-        tainted_task_pubauthid = self.last_request_post_data_dict.get("taskpubauthid", [util.create_id_task()])[0]
-        tainted_task_tags = self.last_request_post_data_dict.get("tasktags", [""])[0]
-        tainted_task_body = self.last_request_post_data_dict.get("taskbody", [""])[0]
-        tainted_due_date = self.last_request_post_data_dict.get("duedate", [""])[0]
-        tainted_formatting = self.last_request_post_data_dict.get("formatting", ["markup"])[0]
+        tainted_task_name = request.post_data_dict.get("taskname", [config.DEFAULT_TASKNAME])[0]
+        tainted_task_folder = request.post_data_dict.get("taskfolder", [config.DEFAULT_FOLDER])[0]
+        tainted_task_pubauthid = request.post_data_dict.get("taskpubauthid", [util.create_id_task()])[0]
+        tainted_task_tags = request.post_data_dict.get("tasktags", [""])[0]
+        tainted_task_body = request.post_data_dict.get("taskbody", [""])[0]
+        tainted_due_date = request.post_data_dict.get("duedate", [""])[0]
+        tainted_formatting = request.post_data_dict.get("formatting", ["markup"])[0]
 
         self.ui_backend.helper_sanitize_task_before_save(task_to_be_updated=task,
                                                          tainted_task_name=tainted_task_name,
@@ -327,40 +403,41 @@ class WebUI():
 
 
     @tests.integration_method("web_ui")
-    def req_save_new_single_task_line(self):
+    def req_save_new_single_task_line(self, request):
         """
         Saves a new single task line from the GET and POST data above the specified single task line id.
         (This functionality is useful for entering single lines into frequently used places in notes.)
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
 
         Returns:
             None:
         """
-        if self.helper_action_get_request_is_wrong("req_save_new_single_task_line"):
-            self.error_msg_queue_note.append("Single note line has not been saved.")
+        if self.helper_action_get_request_is_wrong(request, "req_save_new_single_task_line"):
+            request.session.error_msg_queue_note.append("Single note line has not been saved.")
             return
 
-        if self.helper_action_post_request_is_wrong("req_save_new_single_task_line", "post_action"):
+        if self.helper_action_post_request_is_wrong(request, "req_save_new_single_task_line", "post_action"):
             # this POST value is not present when the page is visited from history
             # missing POST data and not doing this check would delete all checkboxes on the page
-            self.error_msg_queue_note.append("Single note line has not been saved - wrong request (page reload?).")
+            request.session.error_msg_queue_note.append("Single note line has not been saved - wrong request (page reload?).")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_note.append("Single note line has not been saved - wrong session.")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_note.append("Single note line has not been saved - wrong session.")
             return
 
-        single_note_line_id = util.sanitize_singleline_string_for_tasksave(self.last_request_post_data_dict["single_note_line_id"][0])
-        self.error_msg_queue_note.append("Saving one line under ID " + str(single_note_line_id))
+        single_note_line_id = util.sanitize_singleline_string_for_tasksave(request.post_data_dict["single_note_line_id"][0])
+        request.session.error_msg_queue_note.append("Saving one line under ID " + str(single_note_line_id))
         single_note_line_text = ""
         try:
-            single_note_line_text = util.sanitize_singleline_string_for_tasksave(self.last_request_post_data_dict["single_note_line_text"][0])
-            self.error_msg_queue_note.append("Saving one line: '{}'".format(str(single_note_line_text)))
+            single_note_line_text = util.sanitize_singleline_string_for_tasksave(request.post_data_dict["single_note_line_text"][0])
+            request.session.error_msg_queue_note.append("Saving one line: '{}'".format(str(single_note_line_text)))
         except:
-            self.error_msg_queue_note.append("Not saving an empty line.")
+            request.session.error_msg_queue_note.append("Not saving an empty line.")
 
-        single_note_line_prepend_minus_space = self.helper_retrieve_last_request_post_dict_key_val_index_zero_or_return_none("single_note_line_prepend_minus_space")
+        single_note_line_prepend_minus_space = self.helper_retrieve_last_request_post_dict_key_val_index_zero_or_return_none(request, "single_note_line_prepend_minus_space")
 
         task_id = self.woolnote_config.single_note_line_id[single_note_line_id]
         task = self.task_store.store_dict_id[task_id]
@@ -386,82 +463,91 @@ class WebUI():
 
         self.ui_backend.save_edited_note(task)
 
-        self.last_request_get_dict["taskid"] = [
+        request.get_dict["taskid"] = [
             task.taskid]  # inject back so that the next rendered page can access it as if the note editing has been requested
 
 
     @tests.integration_method("web_ui")
-    def req_save_new_note(self):
+    def req_save_new_note(self, request):
         """
         Saves a new note from the GET and POST data.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
 
 
-        if self.helper_action_get_request_is_wrong("req_save_new_note"):
+        if self.helper_action_get_request_is_wrong(request, "req_save_new_note"):
             return
 
-        if self.helper_sessactionauth_is_wrong():
+        if self.helper_sessactionauth_is_wrong(request):
             return
 
         task = Task()
 
-        self.helper_save_task_itself_from_req(task)
+        self.helper_save_task_itself_from_req(request, task)
 
         self.ui_backend.save_new_note(task)
-        self.last_request_get_dict["taskid"] = [
+        request.get_dict["taskid"] = [
             task.taskid]  # inject back so that the next rendered page can access it as if the note always existed
 
 
     @tests.integration_method("web_ui")
-    def req_save_edited_note(self):
+    def req_save_edited_note(self, request):
         """
         Saves a new version of an existing note from the GET and POST data.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
 
-        if self.helper_action_get_request_is_wrong("req_save_edited_note"):
-            self.error_msg_queue_note.append("Note has not been saved.")
+        if self.helper_action_get_request_is_wrong(request, "req_save_edited_note"):
+            request.session.error_msg_queue_note.append("Note has not been saved.")
             return
 
-        if self.helper_action_post_request_is_wrong("req_save_edited_note", "post_action"):
+        if self.helper_action_post_request_is_wrong(request, "req_save_edited_note", "post_action"):
             # this POST value is not present when the page is visited from history
             # missing POST data and not doing this check would delete all checkboxes on the page
-            self.error_msg_queue_note.append("Note has not been saved - wrong request (page reload?).")
+            request.session.error_msg_queue_note.append("Note has not been saved - wrong request (page reload?).")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_note.append("Note has not been saved - wrong session.")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_note.append("Note has not been saved - wrong session.")
             return
 
         # note: If the user changes the taskid value in the edit submit request to another existing note,
         #       that existing note is overwritten. This has to be intentional and taskids are long and
         #       random.
-        task_id = util.sanitize_singleline_string_for_tasksave(self.last_request_get_dict["taskid"][0])
+        task_id = util.sanitize_singleline_string_for_tasksave(request.get_dict["taskid"][0])
         task = self.task_store.store_dict_id[task_id]
 
-        self.helper_save_task_itself_from_req(task)
+        self.helper_save_task_itself_from_req(request, task)
 
         self.ui_backend.save_edited_note(task)
 
     @tests.integration_method("web_ui")
-    def req_note_dismiss_reminder(self):
+    def req_note_dismiss_reminder(self, request):
         """
         Marks the note's reminder attribute as dismissed so that it won't show up again (until the attribute is set to
         True by other code again) (gets the task id from GET).
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
-        if self.helper_action_get_request_is_wrong("req_dismiss_reminder_and_display_note"):
-            self.error_msg_queue_note.append("Reminder has not been dismisses - application error?")
+        if self.helper_action_get_request_is_wrong(request, "req_dismiss_reminder_and_display_note"):
+            request.session.error_msg_queue_note.append("Reminder has not been dismisses - application error?")
             return
 
-        task_id = util.sanitize_singleline_string_for_tasksave(self.last_request_get_dict["taskid"][0])
+        task_id = util.sanitize_singleline_string_for_tasksave(request.get_dict["taskid"][0])
         task = self.task_store.store_dict_id[task_id]
 
         # TODO move to backend?
@@ -470,38 +556,41 @@ class WebUI():
         self.task_store.task_store_save()
 
     @tests.integration_method("web_ui")
-    def req_note_checkboxes_save(self):
+    def req_note_checkboxes_save(self, request):
         """
         Saves checkboxes for a note. Gets the required data from GET and POST. Has to get all checkboxes that are
         checked, the rest is automatically unchecked.
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
-        if self.helper_action_get_request_is_wrong("req_note_checkboxes_save"):
-            self.error_msg_queue_note.append("Checkboxes were not saved.")
+        if self.helper_action_get_request_is_wrong(request, "req_note_checkboxes_save"):
+            request.session.error_msg_queue_note.append("Checkboxes were not saved.")
             return
 
-        if self.helper_action_post_request_is_wrong("req_note_checkboxes_save", "post_action"):
+        if self.helper_action_post_request_is_wrong(request, "req_note_checkboxes_save", "post_action"):
             # this POST value is not present when the page is visited from history
             # missing POST data and not doing this check would delete all checkboxes on the page
-            self.error_msg_queue_note.append("Checkboxes were not saved - wrong request (page reload?).")
+            request.session.error_msg_queue_note.append("Checkboxes were not saved - wrong request (page reload?).")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_note.append("Checkboxes were not saved - wrong session.")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_note.append("Checkboxes were not saved - wrong session.")
             return
 
-        task_id = util.sanitize_singleline_string_for_tasksave(self.last_request_get_dict["taskid"][0])
+        task_id = util.sanitize_singleline_string_for_tasksave(request.get_dict["taskid"][0])
         task = self.task_store.store_dict_id[task_id]
 
         hash_task_body_current = hashlib.sha256(repr(task.body).encode("utf-8")).hexdigest()
-        hash_task_body_request = self.last_request_get_dict.get("task_body_hash", [""])[0]
+        hash_task_body_request = request.get_dict.get("task_body_hash", [""])[0]
         if hash_task_body_current != hash_task_body_request:
-            self.error_msg_queue_note.append("Checkboxes were not saved - tried to save checkboxes for an older version of the note.")
+            request.session.error_msg_queue_note.append("Checkboxes were not saved - tried to save checkboxes for an older version of the note.")
             return
 
         # TODO move to backend?
-        post_data_keys = list(self.last_request_post_data_dict.keys())
+        post_data_keys = list(request.post_data_dict.keys())
         cms_str = util.convert_multiline_markup_string_into_safe_html(task.body)
         new_task_body = util.multiline_markup_checkbox_mapping(cms_str, task.body, edit_chkbox_state=True,
                                                                chkbox_on_list=post_data_keys)
@@ -511,160 +600,181 @@ class WebUI():
 
 
     @tests.integration_method("web_ui")
-    def req_import_notes(self):
+    def req_import_notes(self, request):
         """
         Imports notes (either by synchronization or by overwriting everything local). Doesn't save the result
         permanently until another operation calls task_store.task_store_save() (all data-changing operations do it and
         another launch of import would do it). Imports from the configured path.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
 
-        if self.helper_action_get_request_is_wrong("req_import_notes"):
-            self.error_msg_queue_list.append("Import not performed.")
+        if self.helper_action_get_request_is_wrong(request, "req_import_notes"):
+            request.session.error_msg_queue_list.append("Import not performed.")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Import not performed - wrong session?")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Import not performed - wrong session?")
             return
 
-        user_supplied_nonce = self.last_request_get_dict["nonceactionauth"][0]
+        user_supplied_nonce = request.get_dict["nonceactionauth"][0]
         if not self.check_one_time_nonce(user_supplied_nonce):
-            self.error_msg_queue_list.append("Import not performed - page expired.")
+            request.session.error_msg_queue_list.append("Import not performed - page expired.")
             return
 
-        replace_local_request = "yes" == self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("replace_local")
+        replace_local_request = "yes" == self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "replace_local")
 
-        self.error_msg_queue_list.append("Imported changes are only saved once a next permanent action is performed (saving a note, saving note checkboxes, exporting notes, deleting a note). If you are unhappy with the import operation and want to revert the import, kill/quit the woolnote server immediately.")
+        request.session.error_msg_queue_list.append("Imported changes are only saved once a next permanent action is performed (saving a note, saving note checkboxes, exporting notes, deleting a note). If you are unhappy with the import operation and want to revert the import, kill/quit the woolnote server immediately.")
         ret = self.ui_backend.import_notes(replace_local_request)
         if ret is not None:
-            self.error_msg_queue_list.append(ret)
+            request.session.error_msg_queue_list.append(ret)
 
     @tests.integration_method("web_ui")
-    def req_export_notes(self):
+    def req_export_notes(self, request):
         """
         Exports notes to the configured path.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
 
-        if self.helper_action_get_request_is_wrong("req_export_notes"):
-            self.error_msg_queue_list.append("Export not performed.")
+        if self.helper_action_get_request_is_wrong(request, "req_export_notes"):
+            request.session.error_msg_queue_list.append("Export not performed.")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Export not performed - wrong session?")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Export not performed - wrong session?")
             return
 
-        user_supplied_nonce = self.last_request_get_dict["nonceactionauth"][0]
+        user_supplied_nonce = request.get_dict["nonceactionauth"][0]
         if not self.check_one_time_nonce(user_supplied_nonce):
-            self.error_msg_queue_list.append("Export not performed - page expired.")
+            request.session.error_msg_queue_list.append("Export not performed - page expired.")
             return
 
         self.ui_backend.export_notes()
 
     @tests.integration_method("web_ui")
-    def req_delete_taskid(self):
+    def req_delete_taskid(self, request):
         """
         Deletes the notes specified by the task ids from POST data. This is to be the final function to be called in
         the web ui in the process of deleting - this function doesn't ask for any confirmation.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
-        if self.helper_action_get_request_is_wrong("req_delete_taskid"):
-            self.error_msg_queue_list.append("Note deletion not performed.")
+        if self.helper_action_get_request_is_wrong(request, "req_delete_taskid"):
+            request.session.error_msg_queue_list.append("Note deletion not performed.")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Note deletion not performed - wrong session?")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Note deletion not performed - wrong session?")
             return
 
-        task_id_list = self.last_request_post_data_dict["taskid"]
+        task_id_list = request.post_data_dict["taskid"]
         self.ui_backend.delete_taskid(task_id_list)
 
     @tests.integration_method("web_ui")
-    def req_note_list_manipulate_tagdel(self):
+    def req_note_list_manipulate_tagdel(self, request):
         """
         Deletes the tag specified in POST data from notes having the task ids specified in POST data.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
-        if self.helper_action_get_request_is_wrong("req_note_list_manipulate_tagdel"):
-            self.error_msg_queue_list.append("Note manipulation not performed.")
+        if self.helper_action_get_request_is_wrong(request, "req_note_list_manipulate_tagdel"):
+            request.session.error_msg_queue_list.append("Note manipulation not performed.")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Note manipulation not performed - wrong session?")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Note manipulation not performed - wrong session?")
             return
 
         try:
-            task_id_list = self.last_request_post_data_dict["taskid"]
-            tagdel = self.last_request_post_data_dict["tagdel"][0]
+            task_id_list = request.post_data_dict["taskid"]
+            tagdel = request.post_data_dict["tagdel"][0]
         except:
-            self.error_msg_queue_list.append("Note manipulation not performed - cannot access required POST data.")
+            request.session.error_msg_queue_list.append("Note manipulation not performed - cannot access required POST data.")
         else:
             self.ui_backend.notes_tagdel(task_id_list, tagdel)
 
     @tests.integration_method("web_ui")
-    def req_note_list_manipulate_tagadd(self):
+    def req_note_list_manipulate_tagadd(self, request):
         """
         Adds the tag specified in POST data to notes having the task ids specified in POST data.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
 
-        if self.helper_action_get_request_is_wrong("req_note_list_manipulate_tagadd"):
-            self.error_msg_queue_list.append("Note manipulation not performed.")
+        if self.helper_action_get_request_is_wrong(request, "req_note_list_manipulate_tagadd"):
+            request.session.error_msg_queue_list.append("Note manipulation not performed.")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Note manipulation not performed - wrong session?")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Note manipulation not performed - wrong session?")
             return
 
         try:
-            task_id_list = self.last_request_post_data_dict["taskid"]
-            tagadd = self.last_request_post_data_dict["tagadd"][0]
+            task_id_list = request.post_data_dict["taskid"]
+            tagadd = request.post_data_dict["tagadd"][0]
         except:
-            self.error_msg_queue_list.append("Note manipulation not performed - cannot access required POST data.")
+            request.session.error_msg_queue_list.append("Note manipulation not performed - cannot access required POST data.")
         else:
             self.ui_backend.notes_tagadd(task_id_list, tagadd)
 
     @tests.integration_method("web_ui")
-    def req_note_list_manipulate_foldermove(self):
+    def req_note_list_manipulate_foldermove(self, request):
         """
         Changes the folder specified in POST data for notes having the task ids specified in POST data.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             None:
         """
 
-        if self.helper_action_get_request_is_wrong("req_note_list_manipulate_foldermove"):
-            self.error_msg_queue_list.append("Note manipulation not performed.")
+        if self.helper_action_get_request_is_wrong(request, "req_note_list_manipulate_foldermove"):
+            request.session.error_msg_queue_list.append("Note manipulation not performed.")
             return
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Note manipulation not performed - wrong session?")
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Note manipulation not performed - wrong session?")
             return
 
         try:
-            task_id_list = self.last_request_post_data_dict["taskid"]
-            foldermove = self.last_request_post_data_dict["foldermove"][0]
+            task_id_list = request.post_data_dict["taskid"]
+            foldermove = request.post_data_dict["foldermove"][0]
         except:
-            self.error_msg_queue_list.append("Note manipulation not performed - cannot access required POST data.")
+            request.session.error_msg_queue_list.append("Note manipulation not performed - cannot access required POST data.")
         else:
             self.ui_backend.notes_foldermove(task_id_list, foldermove)
 
     @tests.integration_method("web_ui")
-    def helper_get_task_or_default(self):
+    def helper_get_task_or_default(self, request):
         """
         A helper function that either retrieves the requested task from the request or returns contents of a page
         that should be rendered when the task has not been found in the request.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             Union[Tuple[bool, str, woolnote.task_store.Task, str], Tuple[bool, int, int, str]]:
             1) bool - whether a task specified by "taskid" in request was found
@@ -672,41 +782,45 @@ class WebUI():
             3) the task, if found
             4) the "not found" page that should be rendered if task not found
         """
-        task_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("taskid")
-        alt_task_store_name = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("alt_task_store_name")
+        task_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "taskid")
+        alt_task_store_name = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "alt_task_store_name")
         used_task_store = self.task_store
         # don't want to use sth like globals.get(alt_task_store) so that only approved stores can be used
         if alt_task_store_name == "task_store_trash":
             used_task_store = self.task_store_trash
+            used_task_store.deferred_load_run()
         try:
             task = used_task_store.store_dict_id[task_id]
         except Exception as exc:
             # task_id is either None or it is not in store_dict_id
             util.dbgprint("exception in helper_get_task_or_default, semi-expected {}".format(str(exc)))
-            self.error_msg_queue_list.append("Couldn't retrieve requested note.")
-            return False, 0, 0, self.page_list_notes(no_history=True)
+            request.session.error_msg_queue_list.append("Couldn't retrieve requested note.")
+            return False, 0, 0, self.page_list_notes(request, no_history=True)
         return True, task_id, task, ""
 
 
     @tests.integration_method("web_ui")
-    def page_edit_note(self):
+    def page_edit_note(self, request):
         """
         Displays a note-editing page for an existing note whose task id is specified in GET data.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
-        task_found, task_id, task, notfound_page = self.helper_get_task_or_default()
+        task_found, task_id, task, notfound_page = self.helper_get_task_or_default(request)
         if not task_found:
-            self.error_msg_queue_list.append("Cannot edit specified note.")
+            request.session.error_msg_queue_list.append("Cannot edit specified note.")
             return notfound_page
 
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         page_header_list_of_warnings = None
-        if self.error_msg_queue_note:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_note_to_list_for_output()
+        if request.session.error_msg_queue_note:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_note_to_list_for_output(request)
 
         page_body = html_page_templates.page_edit_note_template(self.task_store, task, self.sess_action_auth,
                                             editing_mode_existing_note=True, history_back_id=history_back_id,
@@ -715,15 +829,18 @@ class WebUI():
         return page_body
 
     @tests.integration_method("web_ui")
-    def page_add_new_note(self):
+    def page_add_new_note(self, request):
         """
         Displays a note-editing page for a new (yet nonexistent) note.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         task = Task()  # just a temporary one, won't even be saved; it's just so that the form below can stay unchanged
 
@@ -780,34 +897,37 @@ class WebUI():
             return page_body
 
     @tests.integration_method("web_ui")
-    def page_display_note(self):
+    def page_display_note(self, request):
         """
         Displays the note specified by task id in GET data. The page contains links to save checkboxes or to edit the
         note.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
-        task_found, task_id, task, notfound_page = self.helper_get_task_or_default()
+        task_found, task_id, task, notfound_page = self.helper_get_task_or_default(request)
         if not task_found:
-            self.error_msg_queue_list.append("Cannot display specified note.")
+            request.session.error_msg_queue_list.append("Cannot display specified note.")
             return notfound_page
 
-        alt_task_store_name = self.helper_get_alt_task_store_name()
+        alt_task_store_name = self.helper_get_alt_task_store_name(request)
 
         highlight_in_text = None
         try:
-            highlight_in_text = [x for x in self.last_request_get_dict["highlight_in_text"]]  # not sanitized
+            highlight_in_text = [x for x in request.get_dict["highlight_in_text"]]  # not sanitized
             util.dbgprint(highlight_in_text)
         except Exception as exc:
             util.dbgprint("expected exception ama {}".format(str(exc)))
 
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         page_header_list_of_warnings = None
-        if self.error_msg_queue_note:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_note_to_list_for_output()
+        if request.session.error_msg_queue_note:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_note_to_list_for_output(request)
 
         page_body = html_page_templates.page_display_note_template(
             task_id=task.taskid,
@@ -822,12 +942,13 @@ class WebUI():
         return page_body
 
     @tests.integration_method("web_ui")
-    def page_list_notes(self, no_history=False):
+    def page_list_notes(self, request, no_history=False):
         """
         Displays a list of notes. The page contains links to existing folders, tags, virtual folders, other links, and
         contains a list of all existing notes. This is the main page of woolnote.
 
         Args:
+            request (woolnote.web_ui.WebUIRequest):
             no_history (bool): If true, this invocation is not saved into history as a point where to go back to. To be
                                used when this method is called in an exception handler because saving the history would
                                save not the request to display a note list but to do whatever action that has just
@@ -842,15 +963,15 @@ class WebUI():
         page_header_first_text = "all notes"
 
         if no_history:
-            history_id = self.save_history([])
+            history_id = self.save_history(request, [])
         else:
-            history_id = self.save_history(["action"], alt_task_store_name=None)
+            history_id = self.save_history(request, ["action"], alt_task_store_name=None)
 
         page_header_list_of_warnings = None
         page_header_small_text = None
 
-        if self.error_msg_queue_list:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output()
+        if request.session.error_msg_queue_list:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output(request)
         else:
             try:
                 # TODO: use asn library?
@@ -869,14 +990,18 @@ class WebUI():
                                         page_header_optional_list_of_warnings=page_header_list_of_warnings)
 
     @tests.integration_method("web_ui")
-    def page_list_trash(self):
+    def page_list_trash(self, request):
         """
         Displays a list of notes in the trash. The page is otherwise very similar to page_list_notes().
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
+        self.task_store_trash.deferred_load_run()
         list_taskid_desc = self.task_store_trash.sort_taskid_list_descending_lamport()
         title = "woolnote - trash"
         page_header_first_text = "notes in the trash"
@@ -884,10 +1009,10 @@ class WebUI():
         page_header_link_request_dict = {"action": "show_list"}
         page_header_list_of_warnings = None
 
-        if self.error_msg_queue_list:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output()
+        if request.session.error_msg_queue_list:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output(request)
 
-        history_id = self.save_history(["action"], alt_task_store_name=None)
+        history_id = self.save_history(request, ["action"], alt_task_store_name=None)
 
         return html_page_templates.page_list_notes_template(list_taskid_desc=list_taskid_desc,
                                         self_sess_action_auth=self.sess_action_auth, title=title,
@@ -901,23 +1026,26 @@ class WebUI():
                                         page_header_optional_list_of_warnings=page_header_list_of_warnings)
 
     @tests.integration_method("web_ui")
-    def page_search_notes(self):
+    def page_search_notes(self, request):
         """
         Displays a list of notes matching the search_text provided in the GET data. The page is otherwise very similar
         to page_list_notes().
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
         task_store_name = "task_store"
         alt_task_store = None
-        alt_task_store_name = self.helper_get_alt_task_store_name()
+        alt_task_store_name = self.helper_get_alt_task_store_name(request)
         if alt_task_store_name == "task_store_trash":
             task_store_name = alt_task_store_name
             alt_task_store = self.task_store_trash
 
-        search_text = self.last_request_get_dict["search_text"][0].lower()
+        search_text = request.get_dict["search_text"][0].lower()
         list_taskid_desc, highlight_list = self.ui_backend.search_notes(task_store_name, search_text)
 
         matching_virtual_folder = ""
@@ -930,7 +1058,7 @@ class WebUI():
         if task_store_name == "task_store":
             task_store_name = None
 
-        history_id = self.save_history(["search_text", "action"], alt_task_store_name=alt_task_store_name)
+        history_id = self.save_history(request, ["search_text", "action"], alt_task_store_name=alt_task_store_name)
 
         title = "woolnote - search " + matching_virtual_folder + search_text
 
@@ -939,8 +1067,8 @@ class WebUI():
         page_header_link_request_dict = {"action": "show_list"}
         page_header_list_of_warnings = None
 
-        if self.error_msg_queue_list:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output()
+        if request.session.error_msg_queue_list:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output(request)
 
         return html_page_templates.page_list_notes_template(list_taskid_desc=list_taskid_desc,
                                         self_sess_action_auth=self.sess_action_auth, title=title,
@@ -955,11 +1083,14 @@ class WebUI():
                                         page_header_optional_list_of_warnings=page_header_list_of_warnings)
 
     @tests.integration_method("web_ui")
-    def page_list_folder(self):
+    def page_list_folder(self, request):
         """
         Displays a list of notes in the folder specified in the GET data. The page is otherwise very similar
         to page_list_notes().
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
@@ -968,9 +1099,10 @@ class WebUI():
         alt_task_store_name = None
         alt_task_store = None
         try:
-            alt_task_store_name = self.last_request_get_dict["alt_task_store_name"][0]
+            alt_task_store_name = request.get_dict["alt_task_store_name"][0]
             if alt_task_store_name == "task_store_trash":
                 alt_task_store = self.task_store_trash
+                alt_task_store.deferred_load_run()
             else:
                 alt_task_store_name = None
                 alt_task_store = None
@@ -981,13 +1113,13 @@ class WebUI():
             used_task_store = alt_task_store
 
         try:
-            folder = self.last_request_get_dict["folder"][0]
+            folder = request.get_dict["folder"][0]
             list_taskid_desc = used_task_store.filter_folder(folder)
         except Exception as exc:
             util.dbgprint("exception aoa, semi-expected {}".format(str(exc)))
-            return self.page_list_notes(no_history=True)
+            return self.page_list_notes(request, no_history=True)
 
-        history_id = self.save_history(["folder", "action"], alt_task_store_name=alt_task_store_name)
+        history_id = self.save_history(request, ["folder", "action"], alt_task_store_name=alt_task_store_name)
 
         title = "woolnote - notes in " + folder
 
@@ -996,8 +1128,8 @@ class WebUI():
         page_header_link_request_dict = {"action": "show_list"}
         page_header_list_of_warnings = None
 
-        if self.error_msg_queue_list:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output()
+        if request.session.error_msg_queue_list:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output(request)
 
         return html_page_templates.page_list_notes_template(list_taskid_desc=list_taskid_desc,
                                         self_sess_action_auth=self.sess_action_auth, title=title,
@@ -1011,11 +1143,14 @@ class WebUI():
                                         page_header_optional_list_of_warnings=page_header_list_of_warnings)
 
     @tests.integration_method("web_ui")
-    def page_list_tag(self):
+    def page_list_tag(self, request):
         """
         Displays a list of notes in the tag specified in the GET data. The page is otherwise very similar to
         page_list_notes().
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
@@ -1024,9 +1159,10 @@ class WebUI():
         alt_task_store_name = None
         alt_task_store = None
         try:
-            alt_task_store_name = self.last_request_get_dict["alt_task_store_name"][0]
+            alt_task_store_name = request.get_dict["alt_task_store_name"][0]
             if alt_task_store_name == "task_store_trash":
                 alt_task_store = self.task_store_trash
+                alt_task_store.deferred_load_run()
             else:
                 alt_task_store_name = None
                 alt_task_store = None
@@ -1037,13 +1173,13 @@ class WebUI():
             used_task_store = alt_task_store
 
         try:
-            tag = self.last_request_get_dict["tag"][0]
+            tag = request.get_dict["tag"][0]
             list_taskid_desc = used_task_store.filter_tag(tag)
         except Exception as exc:
             util.dbgprint("exception apa, semi-expected {}".format(str(exc)))
-            return self.page_list_notes(no_history=True)
+            return self.page_list_notes(request, no_history=True)
 
-        history_id = self.save_history(["tag", "action"], alt_task_store_name=alt_task_store_name)
+        history_id = self.save_history(request, ["tag", "action"], alt_task_store_name=alt_task_store_name)
 
         title = "woolnote - notes in " + tag
 
@@ -1052,8 +1188,8 @@ class WebUI():
         page_header_link_request_dict = {"action": "show_list"}
         page_header_list_of_warnings = None
 
-        if self.error_msg_queue_list:
-            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output()
+        if request.session.error_msg_queue_list:
+            page_header_list_of_warnings = self.helper_convert_msg_queue_list_to_list_for_output(request)
 
         return html_page_templates.page_list_notes_template(list_taskid_desc=list_taskid_desc,
                                         self_sess_action_auth=self.sess_action_auth, title=title,
@@ -1067,10 +1203,13 @@ class WebUI():
                                         page_header_optional_list_of_warnings=page_header_list_of_warnings)
 
     @tests.integration_method("web_ui")
-    def page_note_list_multiple_select(self):
+    def page_note_list_multiple_select(self, request):
         """
         Displays a list of actions and list of selected notes on which the actions can be performed.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
@@ -1078,17 +1217,17 @@ class WebUI():
         tasks_to_delete = []
         try:
             list_taskid_desc_unfiltered = self.task_store.sort_taskid_list_descending_lamport()
-            post_data_keys = list(self.last_request_post_data_dict.keys())
+            post_data_keys = list(request.post_data_dict.keys())
             for taskid in list_taskid_desc_unfiltered:
                 task = self.task_store.store_dict_id[taskid]
                 if taskid in post_data_keys:
                     tasks_to_delete.append(task)
         except Exception as exc:
             util.dbgprint("exception aqa, semi-expected {}".format(str(exc)))
-            self.error_msg_queue_list.append("Cannot get the list of notes for multi-select manipulation.")
-            return self.page_list_notes(no_history=True)
+            request.session.error_msg_queue_list.append("Cannot get the list of notes for multi-select manipulation.")
+            return self.page_list_notes(request, no_history=True)
 
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         page_body = html_page_templates.page_note_list_multiple_select_template(
             tasks_to_delete=tasks_to_delete,
@@ -1099,21 +1238,24 @@ class WebUI():
         return page_body
 
     @tests.integration_method("web_ui")
-    def page_delete_notes(self):
+    def page_delete_notes(self, request):
         """
         Displays a list of notes to delete with a red button deleting them for good and a cancel button.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
-        if self.helper_sessactionauth_is_wrong():
-            self.error_msg_queue_list.append("Cannot display note deletion page - wrong session?")
-            return self.page_list_notes(no_history=True)
+        if self.helper_sessactionauth_is_wrong(request):
+            request.session.error_msg_queue_list.append("Cannot display note deletion page - wrong session?")
+            return self.page_list_notes(request, no_history=True)
 
         tasks_to_delete = []
         try:
-            delete_taskid_list = self.last_request_post_data_dict["taskid"]
+            delete_taskid_list = request.post_data_dict["taskid"]
             for taskid, task in self.task_store.store_dict_id.items():
                 if taskid in delete_taskid_list:
                     tasks_to_delete.append(task)
@@ -1121,16 +1263,16 @@ class WebUI():
             # util.dbgprint("delete_notes_page_page() - no post data detected")
             # get get data instead
             try:
-                delete_taskid_list = self.last_request_get_dict["taskid"]
+                delete_taskid_list = request.get_dict["taskid"]
                 for taskid, task in self.task_store.store_dict_id.items():
                     if taskid in delete_taskid_list:
                         tasks_to_delete.append(task)
             except Exception as exc:
                 util.dbgprint("exception ara, semi-expected {}".format(str(exc)))
-                self.error_msg_queue_list.append("Cannot display note deletion page - wrong request?")
-                return self.page_list_notes(no_history=True)
+                request.session.error_msg_queue_list.append("Cannot display note deletion page - wrong request?")
+                return self.page_list_notes(request, no_history=True)
 
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         page_body = html_page_templates.page_delete_notes_template(
             tasks_to_delete=tasks_to_delete,
@@ -1141,16 +1283,19 @@ class WebUI():
         return page_body
 
     @tests.integration_method("web_ui")
-    def page_export_prompt(self):
+    def page_export_prompt(self, request):
         """
         Displays a question whether to export notes into the configured path.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
         nonce = self.create_new_nonce()
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         page_body = html_page_templates.page_export_prompt_template(
             nonce=nonce,
@@ -1160,17 +1305,20 @@ class WebUI():
         return page_body
 
     @tests.integration_method("web_ui")
-    def page_import_prompt(self):
+    def page_import_prompt(self, request):
         """
         Displays a question whether to import notes from the configured path. Two types of import are offered - sync
         import and plain overwrite import.
 
+        Args:
+            request (woolnote.web_ui.WebUIRequest):
+
         Returns:
             str: html page contents to be displayed
         """
 
         nonce = self.create_new_nonce()
-        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none("history_back_id")
+        history_back_id = self.helper_retrieve_last_request_get_dict_key_val_index_zero_or_return_none(request, "history_back_id")
 
         page_body = html_page_templates.page_import_prompt_template(
             nonce=nonce,
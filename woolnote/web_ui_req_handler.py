@@ -9,16 +9,18 @@ import sys
 import traceback
 import ssl
 
+from woolnote import config
 from woolnote import util
 from woolnote import html_constants
 from woolnote import tests
+from woolnote.web_ui import WebUIRequest
 
 
 # web interface request handler
 ###############################
 
 
-def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
+def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth, request_lock=None):
     """
     Returns the class for the web request handler which has access to data in the arguments. (Because the class is
     then used in such a way that it's not possible to pass additional arguments to its __init__().)
@@ -27,12 +29,29 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
         task_store (woolnote.task_store.TaskStore): The primary task store currently used.
         web_ui (woolnote.web_ui.WebUI): Web UI handlers that are called by req_handler_*() methods in the returned class.
         ui_auth (woolnote.ui_auth.WoolnoteUIAuth): The authentication module to be used for checking authentication credentials and authorizing access.
+        request_lock (Union[None, woolnote.util.ReadWriteLock]): The lock guarding the task stores, the UI backend and the configuration if the requests are handled concurrently. The requests that only read them hold it as readers, the other ones as the writer. A new lock is used if None.
 
     Returns:
         type: class WebInterfaceHandlerLocal(BaseHTTPRequestHandler) that holds the arguments in its scope
     """
+    if request_lock is None:
+        request_lock = util.ReadWriteLock()
+
     class WebInterfaceHandlerLocal(BaseHTTPRequestHandler):
 
+        # actions of the pages that only read the task stores, the UI backend and the configuration
+        READ_ONLY_ACTIONS = {"page_display_note", "page_list_folder", "page_list_tag", "page_search_notes",
+                             "page_list_trash", "page_edit_note", "page_add_new_note", "page_delete_taskid",
+                             "page_note_list_multiple_select"}
+
+        # persistent connections (HTTP/1.1 keep-alive) only if more connections can be served at once, otherwise an
+        # idle connection would block the other clients
+        if config.SERVER_KEEP_ALIVE and (config.SERVER_CONCURRENT or config.SERVER_ASYNCIO):
+            protocol_version = "HTTP/1.1"
+            # the body written after the headers isn't delayed until the client acknowledges them (which it can delay
+            # on a kept-alive connection)
+            disable_nagle_algorithm = True
+
         HTTP_STATIC_RESOURCES = {
             "/uikit-2.27.1.gradient-customized.css": {
                 "page_content": html_constants.CSS_UIKIT_2_27_1_STYLE_OFFLINE,
@@ -54,15 +73,47 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
                 *args ():
                 **kwargs ():
             """
+            self.helper_reset_request_data()
+            self.requests_handled = 0  # the number of requests received on the connection
+            if tests.TEST_FRAMEWORK_ENABLED:
+                tests.gen_serializable_test_new_request()
+                tests.gen_serializable_test_instance("WebInterfaceHandlerLocal", self)
+            super().__init__(*args, **kwargs)
+
+        def helper_reset_request_data(self):
+            """
+            Forgets the data of the previous request on the connection.
+
+            Returns:
+                None:
+            """
             self.last_request_get_dict = {}
             self.last_request_post_data_dict = {}
             self.last_request_path = ""
             self.last_request_headers = {}
             self.authenticated = False
-            if tests.TEST_FRAMEWORK_ENABLED:
-                tests.gen_serializable_test_new_request()
-                tests.gen_serializable_test_instance("WebInterfaceHandlerLocal", self)
-            super().__init__(*args, **kwargs)
+            self.session_id = None  # None for the default session of the web ui
+            self.session_id_is_new = False  # whether the session id has to be sent to the client
+
+        def helper_set_connection_timeout(self, timeout):
+            """
+            Sets the timeout of the reads and writes of the connection.
+
+            Args:
+                timeout (float): seconds
+
+            Returns:
+                None:
+            """
+            self.connection.settimeout(timeout)
+
+        def handle_one_request(self):
+            if self.requests_handled:
+                # an idle kept-alive connection is closed after the timeout
+                self.helper_set_connection_timeout(config.SERVER_KEEP_ALIVE_TIMEOUT)
+                self.helper_reset_request_data()
+            self.requests_handled += 1
+            super().handle_one_request()
 
         @tests.gen_serializable_test_method()
         def _test_repr(self):
@@ -152,6 +203,30 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
                 util.dbgprint("exception in cookie handling {}".format(str(exc)))
             return self.authenticated
 
+        def helper_get_request_session(self):
+            """
+            Sets self.session_id to the web ui session of the authenticated client from the cookies. Creates a new
+            session if the client doesn't have one (anymore), which is then sent to the client in a cookie.
+
+            Returns:
+                None:
+            """
+            self.session_id = None
+            self.session_id_is_new = False
+            if not self.authenticated:
+                return
+            try:
+                cookies = self.last_request_headers['Cookie'].split(";")
+                for cookie in cookies:
+                    keyval = cookie.split("=")
+                    if keyval[0].strip() == "session":
+                        self.session_id = keyval[1].strip()
+            except Exception as exc:
+                util.dbgprint("exception in cookie handling {}".format(str(exc)))
+            if self.session_id is None or web_ui.session_get(self.session_id) is None:
+                self.session_id = web_ui.session_create()
+                self.session_id_is_new = True
+
         def get_request_path(self):
             """
             Copies the request path into self.last_request_path.
@@ -200,6 +275,7 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
 
             self.authenticated = False
             self.helper_get_request_authentication()
+            self.helper_get_request_session()
 
         @tests.gen_serializable_test_method()
         def req_handler_authenticated(self):
@@ -211,7 +287,11 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
             """
             page_content = "<html><body>N/A</body></html>"
             # reload the config settings (the config note could have been changed by the user)
-            woolnote_config.read_from_config_note(task_store)
+            if not woolnote_config.is_up_to_date(task_store):
+                woolnote_config.read_from_config_note(task_store)
+            # the session could have been dropped since the request has arrived
+            session = web_ui.session_get(self.session_id) or web_ui.session_get(None)
+            request = WebUIRequest(self.last_request_post_data_dict, self.last_request_get_dict, session)
 
             def history_go_back():
                 """
@@ -220,7 +300,7 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
                 Returns:
                     None:
                 """
-                nonlocal page_content
+                nonlocal request
                 try:
                     util.dbgprint("history_back - try")
                     # history_back_id might not exist -> except
@@ -233,8 +313,8 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
                     if history_id == "main_list":
                         pass
                     else:
-                        self.last_request_get_dict = web_ui.get_last_get_request_from_history_id(history_id)
-                        web_ui.set_last_request(self.last_request_post_data_dict, self.last_request_get_dict)
+                        self.last_request_get_dict = web_ui.get_last_get_request_from_history_id(request, history_id)
+                        request = WebUIRequest(self.last_request_post_data_dict, self.last_request_get_dict, session)
                     util.dbgprint("history_back - end of try")
                 except:
                     util.dbgprint("history_back - except")
@@ -252,117 +332,114 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
                 """
                 nonlocal page_content
                 if "action" not in self.last_request_get_dict:
-                    page_content = web_ui.page_list_notes(no_history=True)
+                    page_content = web_ui.page_list_notes(request, no_history=True)
                 elif self.last_request_get_dict["action"][0] == "page_list_folder":
-                    page_content = web_ui.page_list_folder()
+                    page_content = web_ui.page_list_folder(request)
                 elif self.last_request_get_dict["action"][0] == "page_list_tag":
-                    page_content = web_ui.page_list_tag()
+                    page_content = web_ui.page_list_tag(request)
                 elif self.last_request_get_dict["action"][0] == "page_search_notes":
-                    page_content = web_ui.page_search_notes()
+                    page_content = web_ui.page_search_notes(request)
                 else:
-                    page_content = web_ui.page_list_notes(no_history=True)
+                    page_content = web_ui.page_list_notes(request, no_history=True)
 
             # handle request to display a list from history (back/cancel buttons, not browser history)
             if "action" in self.last_request_get_dict:
                 if self.last_request_get_dict["action"][0] == "history_back":
                     history_go_back()
 
-            # copy the data about the current request into the web_ui so that it can act on them as well
-            web_ui.set_last_request(self.last_request_post_data_dict, self.last_request_get_dict)
-
             try:
                 if "action" not in self.last_request_get_dict:
-                    page_content = web_ui.page_list_notes()
+                    page_content = web_ui.page_list_notes(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_display_note":
-                    page_content = web_ui.page_display_note()
+                    page_content = web_ui.page_display_note(request)
                 elif self.last_request_get_dict["action"][0] == "req_dismiss_reminder_and_display_note":
-                    web_ui.req_note_dismiss_reminder()
-                    page_content = web_ui.page_display_note()
+                    web_ui.req_note_dismiss_reminder(request)
+                    page_content = web_ui.page_display_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "req_display_otp":
-                    web_ui.req_display_otp()
+                    web_ui.req_display_otp(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "page_list_folder":
-                    page_content = web_ui.page_list_folder()
+                    page_content = web_ui.page_list_folder(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_list_tag":
-                    page_content = web_ui.page_list_tag()
+                    page_content = web_ui.page_list_tag(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_search_notes":
-                    page_content = web_ui.page_search_notes()
+                    page_content = web_ui.page_search_notes(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_list_trash":
-                    page_content = web_ui.page_list_trash()
+                    page_content = web_ui.page_list_trash(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_edit_note":
-                    page_content = web_ui.page_edit_note()
+                    page_content = web_ui.page_edit_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_add_new_note":
-                    page_content = web_ui.page_add_new_note()
+                    page_content = web_ui.page_add_new_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_delete_taskid":
-                    page_content = web_ui.page_delete_notes()
+                    page_content = web_ui.page_delete_notes(request)
 
                 elif self.last_request_get_dict["action"][0] == "req_note_checkboxes_save":
-                    web_ui.req_note_checkboxes_save()
-                    page_content = web_ui.page_display_note()
+                    web_ui.req_note_checkboxes_save(request)
+                    page_content = web_ui.page_display_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "req_save_edited_note":
-                    web_ui.req_save_edited_note()
-                    page_content = web_ui.page_edit_note()
+                    web_ui.req_save_edited_note(request)
+                    page_content = web_ui.page_edit_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "req_save_new_note":
-                    web_ui.req_save_new_note()
-                    page_content = web_ui.page_edit_note()
+                    web_ui.req_save_new_note(request)
+                    page_content = web_ui.page_edit_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "req_save_new_single_task_line":
-                    web_ui.req_save_new_single_task_line()
-                    page_content = web_ui.page_display_note()
+                    web_ui.req_save_new_single_task_line(request)
+                    page_content = web_ui.page_display_note(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_import_prompt":
-                    page_content = web_ui.page_import_prompt()
+                    page_content = web_ui.page_import_prompt(request)
 
                 elif self.last_request_get_dict["action"][0] == "page_export_prompt":
-                    page_content = web_ui.page_export_prompt()
+                    page_content = web_ui.page_export_prompt(request)
 
                 elif self.last_request_get_dict["action"][0] == "req_import_notes":
-                    web_ui.req_import_notes()
+                    web_ui.req_import_notes(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "req_export_notes":
-                    web_ui.req_export_notes()
+                    web_ui.req_export_notes(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "req_delete_taskid":
-                    web_ui.req_delete_taskid()
+                    web_ui.req_delete_taskid(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "req_note_list_manipulate_foldermove":
-                    web_ui.req_note_list_manipulate_foldermove()
+                    web_ui.req_note_list_manipulate_foldermove(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "req_note_list_manipulate_tagadd":
-                    web_ui.req_note_list_manipulate_tagadd()
+                    web_ui.req_note_list_manipulate_tagadd(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "req_note_list_manipulate_tagdel":
-                    web_ui.req_note_list_manipulate_tagdel()
+                    web_ui.req_note_list_manipulate_tagdel(request)
                     history_go_back()
                     display_content_after_history_back_during_request_processing()
 
                 elif self.last_request_get_dict["action"][0] == "page_note_list_multiple_select":
-                    page_content = web_ui.page_note_list_multiple_select()
+                    page_content = web_ui.page_note_list_multiple_select(request)
 
                 else:
-                    page_content = web_ui.page_list_notes()
+                    page_content = web_ui.page_list_notes(request)
 
             except Exception as exc:
                 etype, evalue, etraceback = sys.exc_info()
@@ -404,12 +481,34 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
             """
             page_content = "<html><body>N/A</body></html>"
             if self.authenticated:
-                page_content = self.req_handler_authenticated()
+                if self.helper_request_is_read_only():
+                    with request_lock.reading():
+                        # the configuration is read only by the writer
+                        if woolnote_config.is_up_to_date(task_store):
+                            return self.req_handler_authenticated()
+                with request_lock.writing():
+                    page_content = self.req_handler_authenticated()
             else:
                 # NOT authenticated!
-                page_content = self.req_handler_unauthenticated()
+                with request_lock.reading():
+                    page_content = self.req_handler_unauthenticated()
             return page_content
 
+        def helper_request_is_read_only(self):
+            """
+            Returns whether the authenticated request only displays a page, so that it can be handled in parallel with
+            other such requests.
+
+            Returns:
+                bool:
+            """
+            try:
+                action = self.last_request_get_dict["action"][0]
+            except:
+                # the list of notes
+                return True
+            return action in self.READ_ONLY_ACTIONS
+
         @tests.gen_serializable_test_method()
         def req_handler(self):
             """
@@ -463,62 +562,134 @@ def get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth):
         def output_data_wfile_write(self, val):
             """
             This function exists so that output data can be captured by the test generator so that this class is testable.
+
+            Args:
+                val (bytes): The encoded body of the response.
             """
             try:
-                self.wfile.write(val.encode("utf-8"))
+                self.wfile.write(val)
             except ssl.SSLEOFError:
                 # TODO in woolnote.py - why is suppress_ragged_eofs ignored?
                 util.dbgprint("ssl.SSLEOFError (#TODO in the code)")
 
-        def do_GET(self):
-            self.get_request_data()
-            self.do_HEAD()
-            self.output_data_wfile_write(self.req_handler())
-            return
+        def helper_get_static_resource(self):
+            """
+            Returns the static resource for the path of the current request.
 
-        def do_POST(self):
-            self.get_request_data()
+            Returns:
+                Union[None, Dict[str, str]]: The item of HTTP_STATIC_RESOURCES, None for the dynamic content.
+            """
+            for resource in self.HTTP_STATIC_RESOURCES:
+                if self.last_request_path.startswith(resource):
+                    return self.HTTP_STATIC_RESOURCES[resource]
+            return None
 
-            # instead of do_HEAD(), do similar work
-            # the same response
-            self.send_response(200)
-            # reply for POST can only be text/html because of how woolnote works
-            self.send_header("Content-Type", "text/html")
-            self.send_header("X-Frame-Options", "DENY")
-            # set auth cookie
-            if self.authenticated:
-                self.send_header("Set-cookie", "auth=" + ui_auth.return_cookie_authenticated() + "; SameSite=Strict; HttpOnly")
-            self.end_headers()
-            # end of what is otherwise done in do_HEAD()
+        def helper_compress_page_content(self, page_content, static_resource=None):
+            """
+            Compresses the encoded page by the content coding accepted by the client (Accept-Encoding) if it has at
+            least HTTP_COMPRESSION_MIN_SIZE bytes. The static resources have been compressed when the class was created.
 
-            self.output_data_wfile_write(self.req_handler())
+            Args:
+                page_content (bytes): The encoded page.
+                static_resource (Union[None, Dict[str, str]]): The item of HTTP_STATIC_RESOURCES if it's the page.
 
-        def do_HEAD(self):
-            self.get_request_path()
+            Returns:
+                Tuple[bytes, Union[None, str]]: The page, the content coding (None if not compressed).
+            """
+            if config.HTTP_COMPRESSION_LEVEL is None or len(page_content) < config.HTTP_COMPRESSION_MIN_SIZE:
+                return page_content, None
+            content_encoding = util.http_content_encoding_accepted(self.headers.get("Accept-Encoding"))
+            if content_encoding is None:
+                return page_content, None
+            if static_resource is not None and "page_content_compressed" in static_resource:
+                return static_resource["page_content_compressed"][content_encoding], content_encoding
+            return util.http_content_compress(page_content, content_encoding), content_encoding
+
+        def helper_send_headers(self, static_resource=None, content_length=None, content_encoding=None):
+            """
+            Sends the status line and the headers of the response.
+
+            Args:
+                static_resource (Union[None, Dict[str, str]]): The item of HTTP_STATIC_RESOURCES, None for text/html.
+                content_length (Union[None, int]): The length of the encoded body, None if it is unknown (HEAD of a page).
+                content_encoding (Union[None, str]): The content coding of the body, None if not compressed.
+
+            Returns:
+                None:
+            """
             self.send_response(200)
-            resource_found = False
-            for resource in self.HTTP_STATIC_RESOURCES:
-                if self.last_request_path.startswith(resource):
-                    try:
-                        content_type = self.HTTP_STATIC_RESOURCES[resource]["Content-Type"]
-                        self.send_header("Content-Type", content_type)
-                    except:
-                        pass
-                    try:
-                        cache_control = self.HTTP_STATIC_RESOURCES[resource]["Cache-Control"]
-                        self.send_header("Cache-Control", cache_control)
-                    except:
-                        pass
-                    resource_found = True
-                    break
-            if not resource_found:
+            if static_resource is not None:
+                try:
+                    content_type = static_resource["Content-Type"]
+                    self.send_header("Content-Type", content_type)
+                except:
+                    pass
+                try:
+                    cache_control = static_resource["Cache-Control"]
+                    self.send_header("Cache-Control", cache_control)
+                except:
+                    pass
+            else:
                 self.send_header("Content-Type", "text/html")
             self.send_header("X-Frame-Options", "DENY")
             if self.authenticated:
                 self.send_header("Set-cookie", "auth=" + ui_auth.return_cookie_authenticated() + "; SameSite=Strict; HttpOnly")
+            if self.session_id_is_new:
+                self.send_header("Set-cookie", "session=" + self.session_id + "; SameSite=Strict; HttpOnly")
+            if content_encoding is not None:
+                self.send_header("Content-Encoding", content_encoding)
+            if config.HTTP_COMPRESSION_LEVEL is not None:
+                # the response depends on Accept-Encoding, the caches have to know it
+                self.send_header("Vary", "Accept-Encoding")
+            if content_length is not None:
+                self.send_header("Content-Length", str(content_length))
+            if self.requests_handled >= config.SERVER_KEEP_ALIVE_MAX_REQUESTS:
+                # the client opens a new connection for the next request
+                self.close_connection = True
+            if self.close_connection and self.protocol_version == "HTTP/1.1":
+                # also if the client asked for it, otherwise it would expect the connection to be kept alive
+                self.send_header("Connection", "close")
             self.end_headers()
             if tests.TEST_FRAMEWORK_ENABLED:
                 # let the test generator record it, so that the internal state is captured in the tests
                 self._test_repr()
 
+        def do_GET(self):
+            self.get_request_data()
+            # the whole page is generated before the headers because of Content-Length
+            static_resource = self.helper_get_static_resource()
+            page_content, content_encoding = self.helper_compress_page_content(self.req_handler().encode("utf-8"),
+                                                                               static_resource)
+            self.helper_send_headers(static_resource, len(page_content), content_encoding)
+            self.output_data_wfile_write(page_content)
+
+        def do_POST(self):
+            self.get_request_data()
+            page_content, content_encoding = self.helper_compress_page_content(self.req_handler().encode("utf-8"))
+            # reply for POST can only be text/html because of how woolnote works
+            self.helper_send_headers(None, len(page_content), content_encoding)
+            self.output_data_wfile_write(page_content)
+
+        def do_HEAD(self):
+            self.get_request_path()
+            static_resource = self.helper_get_static_resource()
+            if static_resource is None:
+                # the page is not generated for HEAD (the request could change the notes), so its length is unknown
+                self.close_connection = True
+                self.helper_send_headers()
+                return
+            # the same headers as for GET
+            page_content, content_encoding = self.helper_compress_page_content(
+                static_resource["page_content"].encode("utf-8"), static_resource)
+            self.helper_send_headers(static_resource, len(page_content), content_encoding)
+
+    if config.HTTP_COMPRESSION_LEVEL is not None:
+        # the static resources are compressed only once
+        for static_resource in WebInterfaceHandlerLocal.HTTP_STATIC_RESOURCES.values():
+            page_content = static_resource["page_content"].encode("utf-8")
+            if len(page_content) >= config.HTTP_COMPRESSION_MIN_SIZE:
+                static_resource["page_content_compressed"] = {
+                    content_encoding: util.http_content_compress(page_content, content_encoding)
+                    for content_encoding in ("gzip", "deflate")}
+
     return WebInterfaceHandlerLocal
@@ -11,6 +11,7 @@
 
 from woolnote import systemencoding
 import argparse
+import atexit
 from http.server import HTTPServer
 import os
 import ssl
@@ -18,10 +19,12 @@ import ssl
 from woolnote import config
 from woolnote.woolnote_config import WoolnoteConfig
 from woolnote import util
-from woolnote.task_store import Task, TaskStore, TaskStoreTestingNoWrite
+from woolnote.task_store import Task, TaskStore, TaskStoreTestingNoWrite, TaskStoreWriter
 from woolnote.ui_backend import UIBackend
 from woolnote.web_ui import WebUI
 from woolnote.web_ui_req_handler import get_WebInterfaceHandlerLocal
+from woolnote import thread_pool_http_server
+from woolnote import asyncio_http_server
 from woolnote.ui_auth import WoolnoteUIAuth
 from woolnote import tests
 
@@ -130,9 +133,16 @@ if tests.TEST_FRAMEWORK_ENABLED:
         task_store_trash = TaskStoreTestingNoWrite(os.path.join(config.PATH_SAVE_DB, config.FILE_TASKS_TRASH_DAT))
 
 task_store.task_store_load()
-task_store_trash.task_store_load()
+task_store_trash.task_store_load(deferred=config.LAZY_TRASH_LOADING)
 util.tasks_backup(task_store, task_store_trash)
 
+if config.BACKGROUND_WRITER_ENABLED:
+    # saves are written to the files by a background thread, everything is written before the program exits
+    task_store_writer = TaskStoreWriter()
+    task_store.background_writer = task_store_writer
+    task_store_trash.background_writer = task_store_writer
+    atexit.register(task_store_writer.stop)
+
 ui_auth = WoolnoteUIAuth()
 woolnote_config = WoolnoteConfig()
 ui_backend = UIBackend(task_store, task_store_trash)
@@ -173,17 +183,28 @@ if tests.TEST_FRAMEWORK_ENABLED:
 
 # below is web interface that is not necessary for tests of web_ui.py and the things that are called from that module
 
-WebInterfaceHandlerLocal = get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth)
+request_lock = util.ReadWriteLock()
+WebInterfaceHandlerLocal = get_WebInterfaceHandlerLocal(woolnote_config, task_store, web_ui, ui_auth, request_lock)
+
+if config.SERVER_CONCURRENT or config.SERVER_ASYNCIO:
+    # shared by both servers
+    request_executor = thread_pool_http_server.get_executor()
 
 def get_server_on_port(port, use_ssl=False):
-    server = HTTPServer(("", port), WebInterfaceHandlerLocal)
+    if config.SERVER_CONCURRENT:
+        server = thread_pool_http_server.ThreadPoolHTTPServer(("", port), WebInterfaceHandlerLocal, request_executor)
+    else:
+        server = HTTPServer(("", port), WebInterfaceHandlerLocal)
     if use_ssl:
         try:
             util.dbgprint("use_ssl=True, trying")
             ssl_cert_path = os.path.join(config.PATH_DIR_FOR_SSL_CERT_PEM, config.FILE_CERT_PEM)
             ssl_key_path = os.path.join(config.PATH_DIR_FOR_SSL_KEY_PEM, config.FILE_KEY_PEM)
+            # with the thread pool, the handshake is done by the thread handling the request instead of while the
+            # connection is accepted
             server.socket = ssl.wrap_socket(server.socket, certfile=ssl_cert_path,
                                             keyfile=ssl_key_path, server_side=True,
+                                            do_handshake_on_connect=not config.SERVER_CONCURRENT,
                                             suppress_ragged_eofs=True)
             # TODO: for some reason, suppress_ragged_eofs is ignored
         except:
@@ -215,12 +236,23 @@ def get_server_on_port(port, use_ssl=False):
 #         """.format(exc=ss(repr(exc)), tra=cmps(repr(traceback.format_exception(etype, evalue, etraceback)))))
 # serve_on_port(8088, False)
 
-server_http = get_server_on_port(config.HTTP_PORT, False)
-server_https = get_server_on_port(config.HTTPS_PORT, True)
+def get_ssl_context():
+    try:
+        util.dbgprint("ssl context, trying")
+        ssl_cert_path = os.path.join(config.PATH_DIR_FOR_SSL_CERT_PEM, config.FILE_CERT_PEM)
+        ssl_key_path = os.path.join(config.PATH_DIR_FOR_SSL_KEY_PEM, config.FILE_KEY_PEM)
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(certfile=ssl_cert_path, keyfile=ssl_key_path)
+        return ssl_context
+    except:
+        # like get_server_on_port(), the port is served without SSL
+        util.dbgprint("ssl context, FAILED!")
+        return None
 
 
 def serve_forever(*servers):
     # https://stackoverflow.com/questions/60680/how-do-i-write-a-python-http-server-to-listen-on-multiple-ports
+    # with SERVER_CONCURRENT, handle_request() only accepts the connection and the request is handled by the thread pool
     import select
     while True:
         r, w, e = select.select(servers, [], [], 10)
@@ -233,4 +265,11 @@ def serve_forever(*servers):
 # droid = Android()
 # droid.webViewShow('http://127.0.0.1:8088/woolnote?woolauth=sleepysheep')
 
-serve_forever(server_http, server_https)
+if config.SERVER_ASYNCIO:
+    # the connections of both ports are served by one event loop, the requests are handled by request_executor
+    server_asyncio = asyncio_http_server.AsyncioHTTPServer(WebInterfaceHandlerLocal, request_executor)
+    server_asyncio.serve_forever([(config.HTTP_PORT, None), (config.HTTPS_PORT, get_ssl_context())])
+else:
+    server_http = get_server_on_port(config.HTTP_PORT, False)
+    server_https = get_server_on_port(config.HTTPS_PORT, True)
+    serve_forever(server_http, server_https)
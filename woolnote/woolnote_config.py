@@ -97,6 +97,9 @@ ___
         # dict[id, taskid]
         self.single_note_line_id = {}
 
+        # version of the task store from which the configuration has been read, see TaskStore.get_version()
+        self.task_store_version = None
+
     @tests.integration_method("web_ui")
     def save_default_config_note(self, task_store):
         # TODO: docstring
@@ -110,12 +113,26 @@ ___
         task.body = self.CONFIG_TASK_DEFAULT_BODY
         task_store.add(task)
 
+    def is_up_to_date(self, task_store):
+        """
+        Returns whether the configuration has been read from the task store since it was last changed, so that
+        read_from_config_note() would not change anything.
+
+        Args:
+            task_store (woolnote.task_store.TaskStore):
+
+        Returns:
+            bool:
+        """
+        return self.task_store_version == task_store.get_version()
+
     @tests.integration_method("web_ui")
     def read_from_config_note(self, task_store):
         """
         Reads configuration from notes.
         Reads virtualfolder configuration from the config note and single note line IDs from all the notes.
-        The read data are saved into `self.virtual_folders` and `self.single_note_line_id`.
+        The read data are saved into `self.virtual_folders` and `self.single_note_line_id`. The new values replace the
+        old ones at once, so they can be read by concurrently handled requests in the meantime.
 
         Args:
             task_store (woolnote.task_store.TaskStore):
@@ -123,7 +140,7 @@ ___
         Returns:
             None:
         """
-        self.virtual_folders = {}
+        virtual_folders = {}
         contents = None
         list_taskid_unfiltered = task_store.sort_taskid_list_descending_lamport()
         for taskid in list_taskid_unfiltered:
@@ -140,13 +157,13 @@ ___
                     try:
                         paramtype, paramname, paramcontent = line.split("====", 2)
                         if paramtype == self.CONFIG_VIRTFLDR_PARAM_NAME:
-                            self.virtual_folders[paramname] = paramcontent
+                            virtual_folders[paramname] = paramcontent
                     except:
                         pass
 
-        self.single_note_line_id = {}
+        single_note_line_id = {}
         # those present more than once
-        self.single_note_line_id_invalid = set()
+        single_note_line_id_invalid = set()
         list_taskid_unfiltered = task_store.filter_search("#^#:")
         for taskid in list_taskid_unfiltered:
             task = task_store.store_dict_id[taskid]
@@ -158,11 +175,16 @@ ___
                                                       line.startswith("** #^#:"), line.startswith("*** #^#:"),
                                                       line.startswith("**** #^#:") )):
                         id = line.split("#^#:")[1].split(":#^#")[0]
-                        if id in self.single_note_line_id_invalid:
+                        if id in single_note_line_id_invalid:
                             continue
-                        if id in self.single_note_line_id:
-                            self.single_note_line_id_invalid.add(id)
-                            del self.single_note_line_id[id]
+                        if id in single_note_line_id:
+                            single_note_line_id_invalid.add(id)
+                            del single_note_line_id[id]
                             continue
                         else:
-                            self.single_note_line_id[id] = taskid
+                            single_note_line_id[id] = taskid
+
+        self.virtual_folders = virtual_folders
+        self.single_note_line_id = single_note_line_id
+        self.single_note_line_id_invalid = single_note_line_id_invalid
+        self.task_store_version = task_store.get_version()